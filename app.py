@@ -0,0 +1,32 @@
+# app.py
+# 통합 실행기 — Study&Body(test.py)·MBTI 직업 추천(main.py)·ex1.py를 한 프로세스의 멀티페이지 앱으로.
+# 실행: streamlit run app.py
+# 세 스크립트를 따로 띄우면 인터프리터·streamlit·pandas/plotly import와 메모리를 각자 치르지만,
+# 여기서는 한 번만 올라오고 프로세스 단위 캐시(콘텐츠 카탈로그, 직업 인덱스, 리듬 곡선 표, 그림 캐시,
+# SQLite 연결 등)도 페이지끼리 함께 쓴다. 각 스크립트는 그대로 단독 실행도 된다.
+from pathlib import Path
+
+import streamlit as st
+
+from studybody.ui import REMINDER_TICK, deliver_reminders
+
+ROOT = Path(__file__).resolve().parent
+
+PAGES = [
+    st.Page(ROOT / "test.py", title="Study&Body", icon="🧠", url_path="study", default=True),
+    st.Page(ROOT / "main.py", title="MBTI 직업 추천", icon="🌈", url_path="mbti"),
+    st.Page(ROOT / "ex1.py", title="ex1", icon="📝", url_path="ex1"),
+]
+
+# 다른 페이지에 가 있는 동안 그려지지 않은 위젯의 값은 지워지므로, 돌아왔을 때 유지할 키는 다시 써 둔다
+KEEP = ("page", "student", "reminders_on")
+for key in KEEP:
+    if key in st.session_state:
+        st.session_state[key] = st.session_state[key]
+
+page = st.navigation(PAGES)
+page.run()
+
+# 리듬 알림은 다른 페이지에 있어도 계속 받는다 (Study&Body 페이지는 자기 프래그먼트로 받음)
+if page is not PAGES[0] and st.session_state.get("reminders_on") and "reminder_sid" in st.session_state:
+    st.fragment(deliver_reminders, run_every=REMINDER_TICK)()
@@ -0,0 +1,34 @@
+# benchmarks/bench_batch.py
+# MBTI 추천 일괄 처리: 작업자 수·청크 크기별 처리량(행/초), 출력은 버린다
+# 실행: python benchmarks/bench_batch.py [행 수]
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from studybody.batch import run_batch  # noqa: E402
+from studybody.jobs import get_job_index  # noqa: E402
+
+ROWS = 500_000
+TYPES = [a + b + c + d for a in "EI" for b in "SN" for c in "TF" for d in "JP"]
+
+
+def synthetic(n: int):
+    rng = random.Random(0)
+    cats = [()] * 3 + [(c,) for c in get_job_index().categories]
+    for i in range(n):
+        yield f"u{i}", rng.choice(TYPES), rng.choice(cats), None
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    print(f"{'workers':>7} | {'chunk':>6} | {'jsonl rows/s':>12} | {'csv rows/s':>10}")
+    for workers in [0, 2, 4]:
+        for chunk in [1_000, 10_000]:
+            rates = []
+            for fmt in ["jsonl", "csv"]:
+                t0 = time.perf_counter()
+                run_batch(synthetic(n), lambda s: None, fmt, workers, chunk)
+                rates.append(n / (time.perf_counter() - t0))
+            print(f"{workers:>7} | {chunk:>6,} | {rates[0]:>12,.0f} | {rates[1]:>10,.0f}")
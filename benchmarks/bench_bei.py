@@ -0,0 +1,42 @@
+# benchmarks/bench_bei.py
+# Brain Energy Index: 스칼라 함수 반복 vs 배열 일괄 계산 (10^6행), 결과 일치 확인 포함
+# 실행: python benchmarks/bench_bei.py
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from studybody.bei import brain_energy_index, brain_energy_index_batch  # noqa: E402
+
+N = 1_000_000
+
+
+def synthetic(n: int):
+    rng = np.random.default_rng(0)
+    return (
+        rng.choice(np.arange(4.0, 10.5, 0.5), n),   # 수면(시간)
+        rng.integers(0, 13, n),                    # 물(컵)
+        rng.integers(0, 7, n),                     # 카페인(잔)
+        rng.integers(0, 600, n),                   # 공부(분)
+    )
+
+
+if __name__ == "__main__":
+    sleep, water, caffeine, study = synthetic(N)
+    args = list(zip(sleep.tolist(), water.tolist(), caffeine.tolist(), study.tolist()))
+
+    t0 = time.perf_counter()
+    scalar = np.array([brain_energy_index(*a) for a in args])
+    t_scalar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batch = brain_energy_index_batch(sleep, water, caffeine, study)
+    t_batch = time.perf_counter() - t0
+
+    assert np.array_equal(scalar, batch), "스칼라/배열 결과 불일치"
+    print(f"rows            : {N:,}")
+    print(f"scalar loop     : {t_scalar * 1e3:9.1f} ms")
+    print(f"batched (NumPy) : {t_batch * 1e3:9.1f} ms  ({t_scalar / t_batch:.0f}x)")
+    print("results identical: yes")
@@ -0,0 +1,63 @@
+# benchmarks/bench_cohort.py
+# 반 전체 현황: 학생 500명이 계획을 쌓은 뒤 "이번 주 과목별 공부 시간" 조회 시간
+# (공유 집계 칸 조회 vs 모든 학생의 테이블을 매번 합치기)
+# 실행: python benchmarks/bench_cohort.py
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from studybody.aggregates import DailyIndex  # noqa: E402
+from studybody.cohort import CohortStore  # noqa: E402
+
+STUDENTS = 500
+TASKS = 60          # 학생당 계획 수
+SUBJECTS = ["국어", "수학", "영어", "화학", "생명과학", "물리", "한국사", "기타"]
+ROUNDS = 200
+
+
+def build():
+    rng = random.Random(0)
+    start = date(2026, 10, 12)
+    store, frames = CohortStore(), []
+    for s in range(STUDENTS):
+        index = DailyIndex()
+        store.attach(f"학생 {s}", index)
+        rows = [(start + timedelta(days=rng.randrange(14)), rng.choice(SUBJECTS), rng.randrange(10, 120), rng.random() < 0.5)
+                for _ in range(TASKS)]
+        for day, subject, minutes, done in rows:
+            index.add(day, subject, minutes, done)
+        frames.append(pd.DataFrame(rows, columns=["날짜", "과목", "예정(분)", "완료"]))
+    return store, frames, start
+
+
+def timed(fn) -> float:
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - t0) / ROUNDS
+
+
+if __name__ == "__main__":
+    t0 = time.perf_counter()
+    store, frames, start = build()
+    feed = time.perf_counter() - t0
+    end = start + timedelta(days=6)
+
+    def scan():
+        # 비교용: 학생별 테이블을 모아 그때그때 group by
+        df = pd.concat(frames)
+        week = df[(df["날짜"] >= start) & (df["날짜"] <= end)]
+        return week.groupby("과목")["예정(분)"].sum()
+
+    ours = store.subject_minutes(start, end)
+    assert {s: p for s, (p, _) in ours.items()} == scan().to_dict()
+    t_cells = timed(lambda: store.subject_minutes(start, end))
+    t_scan = timed(scan)
+    print(f"students={STUDENTS} tasks={STUDENTS * TASKS:,} (변경분 반영 {feed:.2f}s, 잠금 포함)")
+    print(f"{'weekly by subject, counters':>34} | {t_cells * 1e6:>10.1f} µs")
+    print(f"{'weekly by subject, concat+groupby':>34} | {t_scan * 1e6:>10.1f} µs")
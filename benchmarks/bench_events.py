@@ -0,0 +1,62 @@
+# benchmarks/bench_events.py
+# 변경 기록 재생: 기록 길이·테이블 크기별 "가장 최근 상태" 복원 시간 (스냅샷에서 재생 vs 처음부터 재생)
+# 과 스냅샷으로 들고 있는 행 수 (메모리), 어느 시점이든 다시 적용해야 하는 이벤트 수의 최댓값
+# 실행: python benchmarks/bench_events.py
+import random
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from studybody.events import EventLog  # noqa: E402
+from studybody.store import COLUMNS  # noqa: E402
+
+SIZES = [2_000, 50_000]
+LENGTHS = [1_000, 10_000, 100_000]
+ROUNDS = 20
+
+
+def frame_of(state: dict) -> pd.DataFrame:
+    df = pd.DataFrame.from_dict(state, orient="index", columns=COLUMNS)
+    df.index.name = "id"
+    return df
+
+
+def build(rows: int, events: int, snapshot_every: int = 256):
+    # 행 rows개에 무작위 수정 events개 — 재생만 재려고 저장소 없이 로그에 바로 기록한다
+    rng = random.Random(0)
+    day = pd.Timestamp("2026-10-19")
+    state = {i: ("수학", f"단원 {i}", 30, False, day) for i in range(1, rows + 1)}
+    log = EventLog(lambda: frame_of(state), snapshot_every)
+    for _ in range(events):
+        rid = rng.randrange(1, rows + 1)
+        before, after = state[rid], ("수학", f"단원 {rid}", rng.randrange(10, 120), rng.random() < 0.5, day)
+        state[rid] = after
+        log.record([(rid, before, after)])
+    return log
+
+
+def timed(fn) -> float:
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - t0) / ROUNDS
+
+
+if __name__ == "__main__":
+    print(f"{'rows':>7} | {'events':>8} | {'snapshots':>9} | {'snapshot rows':>13} | {'replay (snapshot)':>17} | "
+          f"{'replay (from start)':>19} | {'max replayed events':>19}")
+    for rows in SIZES:
+        for n in LENGTHS:
+            log = build(rows, n)
+            full = build(rows, n, n + 1)   # 비교용: 처음 상태 하나만
+            pd.testing.assert_frame_equal(log.state_at(n - 1), full.state_at(n - 1), check_dtype=False)
+            t_snap = timed(lambda: log.state_at(n - 1))
+            t_full = timed(lambda: full.state_at(n - 1))
+            held = sum(len(df) for _, df in log._snapshots)
+            seqs = [seq for seq, _ in log._snapshots] + [n]
+            worst = max(b - a for a, b in zip(seqs, seqs[1:]))
+            print(f"{rows:>7,} | {n:>8,} | {len(log._snapshots):>9} | {held:>13,} | {t_snap * 1e3:>14.2f} ms | "
+                  f"{t_full * 1e3:>16.2f} ms | {worst:>19,}")
@@ -0,0 +1,43 @@
+# benchmarks/bench_forecast.py
+# 장기 리듬 예보(수면 구간 마스크 포함): 날짜별 curve_at 반복 vs (일수 × 칸) 행렬 한 번, 그리고 히트맵 전송량(전체 vs 표시 해상도)
+# 실행: python benchmarks/bench_forecast.py
+import sys
+import time
+from datetime import date, time as clock
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from studybody.figures import forecast_figure  # noqa: E402
+from studybody.forecast import energy_matrix  # noqa: E402
+from studybody.rhythm import CHRONOTYPES, curve_at  # noqa: E402
+
+DAYS = [30, 90, 365]
+STEP = 1
+REPEAT = 20
+
+
+def timed(fn) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()
+    return (time.perf_counter() - t0) / REPEAT
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    params = CHRONOTYPES["일반형"]
+    print(f"{'days':>5} | {'per-day loop':>12} | {'matrix':>9} | {'full f4 payload':>15} | {'heatmap spec':>12}")
+    for n in DAYS:
+        wake = rng.integers(360, 540, n)
+        cols = np.arange(0, 1440, STEP)
+        loop = timed(lambda: np.stack([
+            np.where((cols - w) % 1440 < 17 * 60, curve_at(params, w, STEP), np.nan) for w in wake
+        ]))
+        matrix = timed(lambda: energy_matrix("일반형", wake, 7.0, STEP))
+        full_bytes = n * (1440 // STEP) * 4 * 4 / 3     # float32 → base64
+        spec = forecast_figure("일반형", date.today(), n, clock(7, 0), 7.0, 60, 1.0).to_json()
+        print(f"{n:>5} | {loop * 1e3:>9.2f} ms | {matrix * 1e3:>6.2f} ms | {full_bytes / 1e6:>12.2f} MB | "
+              f"{len(spec) / 1e3:>9.1f} KB")
@@ -0,0 +1,53 @@
+# benchmarks/bench_imports.py
+# 페이지별 첫 실행 비용: 새 프로세스에서 앱 셸 + 페이지 하나만 실행하고
+#   - 페이지 모듈 import 시간 (views.IMPORT_TIMES)
+#   - 그 시점까지 로드된 무거운 라이브러리 (pandas / numpy / plotly / pyarrow)
+# 를 JSON 한 줄로 받아 표로 출력한다.
+# 실행: python benchmarks/bench_imports.py
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from studybody.views import PAGES  # noqa: E402
+
+HEAVY = ["pandas", "numpy", "plotly", "pyarrow"]
+
+_CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+base = set(sys.modules)
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.session_state["page"] = {page!r}  # 첫 실행부터 해당 페이지만
+at.run()
+from studybody import views
+print(json.dumps({{
+    "total": time.perf_counter() - t0,
+    "imports": views.IMPORT_TIMES,
+    "exceptions": [e.value for e in at.exception],
+    "loaded": [m for m in {heavy!r} if m in sys.modules and m not in base],
+}}))
+"""
+
+
+def measure(page: str, db: Path) -> dict:
+    code = _CHILD.format(app=str(ROOT / "test.py"), page=page, heavy=HEAVY)
+    env = dict(os.environ, STUDYBODY_DB=str(db))
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    db = Path(tempfile.mkdtemp()) / "bench.db"
+    print(f"{'page':<12} | {'page import':>11} | {'first run':>9} | heavy modules loaded")
+    for page, mod in PAGES.items():
+        r = measure(page, db)
+        imp = r["imports"].get(f"studybody.views.{mod}", 0.0)
+        loaded = ", ".join(r["loaded"]) or "-"
+        print(f"{page:<12} | {imp * 1e3:>8.1f} ms | {r['total'] * 1e3:>6.0f} ms | {loaded}"
+              + (f"  (예외: {r['exceptions']})" if r["exceptions"] else ""))
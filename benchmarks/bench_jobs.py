@@ -0,0 +1,38 @@
+# benchmarks/bench_jobs.py
+# MBTI 직업 추천: 직업 수별 질의 1회 시간 (전체 유사도 계산 + argpartition 상위 k, 분야 필터 유무)
+# 실행: python benchmarks/bench_jobs.py
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from studybody.jobs import JobIndex  # noqa: E402
+
+SIZES = [1_000, 10_000, 50_000, 200_000]
+QUERIES = 200
+CATEGORIES = [f"분야 {i}" for i in range(40)]
+
+
+def synthetic(n: int) -> JobIndex:
+    rng = np.random.default_rng(0)
+    return JobIndex([f"직업 {i}" for i in range(n)], rng.choice(CATEGORIES, n).tolist(), rng.uniform(-1, 1, (n, 4)))
+
+
+def per_query(fn) -> float:
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(QUERIES):
+        fn()
+    return (time.perf_counter() - t0) / QUERIES
+
+
+if __name__ == "__main__":
+    print(f"{'jobs':>9} | {'top-10':>9} | {'top-10 + 3 fields':>17} | {'full sort top-10':>16}")
+    for n in SIZES:
+        index = synthetic(n)
+        plain = per_query(lambda: index.top("INTJ", 10))
+        filtered = per_query(lambda: index.top("INTJ", 10, categories=CATEGORIES[:3]))
+        full = per_query(lambda: np.argsort(-index.scores("INTJ"))[:10])
+        print(f"{n:>9,} | {plain * 1e3:>6.3f} ms | {filtered * 1e3:>14.3f} ms | {full * 1e3:>13.3f} ms")
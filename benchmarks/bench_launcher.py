@@ -0,0 +1,77 @@
+# benchmarks/bench_launcher.py
+# 통합 실행기(app.py) vs 스크립트 세 개를 각자 프로세스로: 콜드 스타트 시간과 상주 메모리(RSS)
+#   - 각 경우를 새 파이썬 프로세스에서 AppTest로 화면 없이 실행 (test.py는 모든 페이지를 한 번씩 열고, main.py·ex1.py는 한 번)
+#   - 콜드 스타트 = 프로세스 생성부터 모든 페이지 첫 실행까지의 벽시계 시간, RSS는 끝났을 때 값과 최대값
+#   - 실제 서버(streamlit run)는 여기에 웹 서버·세션 관리 메모리가 더해지고, 그것도 프로세스마다 따로 든다
+# 실행: python benchmarks/bench_launcher.py
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from studybody.views import PAGES  # noqa: E402
+
+_CHILD = """
+import json, sys
+from streamlit.testing.v1 import AppTest
+
+def rss():
+    # (현재 RSS, 최대 RSS) KB — 리눅스 /proc, 없으면 최대값만
+    try:
+        status = dict(line.split(":", 1) for line in open("/proc/self/status"))
+        return int(status["VmRSS"].split()[0]), int(status["VmHWM"].split()[0])
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak, peak
+
+at = AppTest.from_file({app!r}, default_timeout=300)
+at.run()
+for page in {views!r}:
+    at.session_state["page"] = page
+    at.run()
+for script in {switch!r}:
+    at.switch_page(script).run()
+errors = [e.value for e in at.exception]
+now, peak = rss()
+print(json.dumps({{"rss_kb": now, "peak_kb": peak, "errors": errors}}))
+"""
+
+
+def run(app: str, views=(), switch=()) -> dict:
+    code = _CHILD.format(app=str(ROOT / app), views=list(views), switch=list(switch))
+    env = dict(os.environ, STUDYBODY_DB=str(Path(tempfile.mkdtemp()) / "bench.db"))
+    t0 = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    result["wall"] = time.perf_counter() - t0
+    return result
+
+
+def row(name: str, r: dict):
+    print(f"{name:<24} | {r['wall']:>7.2f} s | {r['rss_kb'] / 1024:>8.1f} MB | {r['peak_kb'] / 1024:>8.1f} MB"
+          + (f"  (예외: {r['errors']})" if r["errors"] else ""))
+
+
+if __name__ == "__main__":
+    views = list(PAGES)
+    separate = {
+        "test.py": run("test.py", views),
+        "main.py": run("main.py"),
+        "ex1.py": run("ex1.py"),
+    }
+    unified = run("app.py", views, ["main.py", "ex1.py"])
+
+    print(f"{'':<24} | {'cold start':>9} | {'RSS':>11} | {'peak RSS':>11}")
+    for name, r in separate.items():
+        row(f"{name} (own process)", r)
+    total = {k: sum(r[k] for r in separate.values()) for k in ("wall", "rss_kb", "peak_kb")}
+    row("3 processes, total", dict(total, errors=[]))
+    row("app.py (one process)", unified)
+    print(f"\nsaved: {1 - unified['rss_kb'] / total['rss_kb']:.0%} RSS, "
+          f"{1 - unified['wall'] / total['wall']:.0%} cold-start time (sequential)")
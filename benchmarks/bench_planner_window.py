@@ -0,0 +1,83 @@
+# benchmarks/bench_planner_window.py
+# 학습 플래너 편집기: 전체 테이블 전송 vs 기간·페이지 창(window) 전송
+#   - payload: 편집기로 보내는 Arrow 바이트 수 (Streamlit이 쓰는 변환 함수 그대로 사용)
+#   - rerun: AppTest로 '학습 플래너' 페이지를 다시 실행하는 데 걸리는 시간
+# 실행: python benchmarks/bench_planner_window.py [--no-apptest]
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from studybody.store import SUBJECTS, TaskStore  # noqa: E402
+
+SIZES = [1_000, 100_000, 1_000_000]
+PAGE_SIZE = 200
+RERUNS = 5
+
+
+def synthetic_store(n: int) -> TaskStore:
+    rng = np.random.default_rng(0)
+    today = np.datetime64(pd.Timestamp.today().date(), "D")
+    df = pd.DataFrame({
+        "과목": rng.choice(SUBJECTS, n),
+        "주제": [f"단원 {i}" for i in range(n)],
+        "예정(분)": rng.integers(10, 300, n),
+        "완료": rng.random(n) < 0.5,
+        "날짜": today - rng.integers(0, 3 * 365, n).astype("timedelta64[D]"),
+    })
+    store = TaskStore()
+    store.extend(df, track=False)
+    return store
+
+
+def payload(df: pd.DataFrame):
+    from streamlit.dataframe_util import convert_pandas_df_to_arrow_bytes
+
+    t0 = time.perf_counter()
+    size = len(convert_pandas_df_to_arrow_bytes(df))
+    return size, time.perf_counter() - t0
+
+
+def rerun_latency(store: TaskStore) -> float:
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / "test.py"), default_timeout=600)
+    at.session_state["tasks"] = store
+    at.run()
+    [r for r in at.sidebar.radio if r.label == "탐색"][0].set_value("학습 플래너").run()
+    times = []
+    for _ in range(RERUNS):
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+    return float(np.median(times))
+
+
+if __name__ == "__main__":
+    use_apptest = "--no-apptest" not in sys.argv
+    os.environ.setdefault("STUDYBODY_DB", str(Path(tempfile.mkdtemp()) / "bench.db"))
+    today = pd.Timestamp.today().date()
+    payload(pd.DataFrame({"x": [0]}))  # streamlit import 비용은 측정에서 제외
+    print(f"{'rows':>10} | {'full payload':>13} | {'full build':>10} | {'window payload':>14} | "
+          f"{'window build':>12} | {'planner rerun p50':>17}")
+    for n in SIZES:
+        store = synthetic_store(n)
+        t0 = time.perf_counter()
+        full = store.frame()
+        full_bytes, _ = payload(full)
+        full_t = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        view, _ = store.window(today - pd.Timedelta(days=14), today + pd.Timedelta(days=14), limit=PAGE_SIZE)
+        win_bytes, _ = payload(view)
+        win_t = time.perf_counter() - t0
+
+        rerun = f"{rerun_latency(store) * 1e3:>14.1f} ms" if use_apptest else f"{'-':>17}"
+        print(f"{n:>10,} | {full_bytes / 1e6:>10.2f} MB | {full_t * 1e3:>7.1f} ms | {win_bytes / 1e3:>11.1f} KB | "
+              f"{win_t * 1e3:>9.1f} ms | {rerun}")
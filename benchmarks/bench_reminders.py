@@ -0,0 +1,51 @@
+# benchmarks/bench_reminders.py
+# 알림 엔진: 세션 5,000개 × 하루치 알림을 예약하고 1초씩 하루를 돌릴 때 (타이머 휠 vs 매 틱 전체 일정 훑기)
+# 실행: python benchmarks/bench_reminders.py
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from studybody.reminders import TimerWheel  # noqa: E402
+
+SESSIONS = 5_000
+PER_SESSION = 30
+DAY = 86_400
+SCAN_TICKS = 600    # 전체 훑기는 느려서 10분만 재고 하루로 환산
+
+
+def schedules(start: float):
+    rng = random.Random(0)
+    return [[start + rng.uniform(1, DAY) for _ in range(PER_SESSION)] for _ in range(SESSIONS)]
+
+
+if __name__ == "__main__":
+    start = 1_800_000_000.0
+    plans = schedules(start)
+    n = SESSIONS * PER_SESSION
+
+    wheel = TimerWheel(start)
+    t0 = time.perf_counter()
+    for s, plan in enumerate(plans):
+        for at in plan:
+            wheel.schedule(at, s)
+    t_sched = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    fired = sum(len(wheel.advance(start + k)) for k in range(1, DAY + 1))
+    t_wheel = time.perf_counter() - t0
+    assert fired == n
+
+    # 비교용: 틱마다 모든 세션의 일정을 훑어 지금 울릴 것을 찾는다
+    last = start
+    t0 = time.perf_counter()
+    for k in range(1, SCAN_TICKS + 1):
+        now = start + k
+        hits = [s for s, plan in enumerate(plans) for at in plan if last < at <= now]
+        last = now
+    t_scan = (time.perf_counter() - t0) / SCAN_TICKS * DAY
+
+    print(f"reminders={n:,} ({SESSIONS:,} sessions × {PER_SESSION})")
+    print(f"schedule all          | {t_sched * 1e3:>10.1f} ms ({t_sched / n * 1e6:.2f} µs/each)")
+    print(f"wheel, 1 s ticks, 24h | {t_wheel * 1e3:>10.1f} ms ({t_wheel / DAY * 1e6:.2f} µs/tick)")
+    print(f"full scan, 24h (est.) | {t_scan * 1e3:>10.1f} ms ({t_scan / DAY * 1e6:.0f} µs/tick)")
@@ -0,0 +1,115 @@
+# benchmarks/bench_reports.py
+# 리포트 작업자 풀: 학생 USERS명이 동시에 리포트 페이지를 다시 그릴 때 각 화면(스크립트 스레드)이 막혀 있는 시간
+# — 화면 스레드에서 표·BEI 추이 그림을 바로 만들기 vs 요약 인덱스에서 표만 꺼내고 그림은 풀에 맡기기,
+# 그리고 데이터가 그대로일 때 다시 그리는 비용(판 번호로 캐시 조회)
+# 실행: python benchmarks/bench_reports.py
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from studybody import reports  # noqa: E402
+from studybody.store import TaskStore  # noqa: E402
+
+USERS = 4
+ROWS = 200_000       # 학생당 계획 수
+DAYS = 720           # 기록 기간(일) — 추이 그림의 점 수
+SUBJECTS = ["국어", "수학", "영어", "화학", "생명과학", "물리", "한국사", "기타"]
+FALLBACK = (7.0, 6, 1)
+COLORS = ("#64748b", "#7c3aed")
+WAIT = 0.2           # views/report.py INLINE_WAIT
+
+
+def build(seed: int) -> TaskStore:
+    rng = np.random.default_rng(seed)
+    store = TaskStore()
+    store.extend(pd.DataFrame({
+        "과목": rng.choice(SUBJECTS, ROWS),
+        "주제": [f"주제 {i}" for i in rng.integers(0, 500, ROWS)],
+        "예정(분)": rng.integers(10, 120, ROWS),
+        "완료": rng.random(ROWS) < 0.5,
+        "날짜": pd.Timestamp("2025-01-01") + pd.to_timedelta(rng.integers(0, DAYS, ROWS), "D"),
+    }), track=False)
+    return store
+
+
+class _Inline:
+    # 비교용: 진행률을 버리는 Job 자리
+    def step(self, progress, stage):
+        pass
+
+
+def inline(store):
+    # 풀 없이 화면 스레드에서 전부
+    days, studied = store.daily.series()
+    return reports.summary_report(_Inline(), store.daily.pivot(), days, studied, {}, FALLBACK, COLORS)
+
+
+def pooled(store):
+    # views/report.py가 하는 일: 캐시 조회 → 없으면 요약 인덱스에서 표·일별 합계만 꺼내 풀에 맡기고 잠깐 기다림
+    version, options = (store.uid, store.version), (FALLBACK, frozenset())
+    job = reports.pool.find("summary", version, options)
+    if job is None:
+        days, studied = store.daily.series()
+        job = reports.pool.submit("summary", version, reports.summary_report, store.daily.pivot(), days, studied,
+                                  {}, FALLBACK, COLORS, options=options)
+    job.wait(WAIT)
+    return job
+
+
+def concurrent(fn, stores):
+    # 사용자마다 스레드 하나(= Streamlit 세션 스크립트 스레드) — (사용자별 막힌 시간, 결과, 시작 시각)
+    blocked = [0.0] * len(stores)
+    results = [None] * len(stores)
+    start = threading.Barrier(len(stores) + 1)
+
+    def run(i):
+        start.wait()
+        t0 = time.perf_counter()
+        results[i] = fn(stores[i])
+        blocked[i] = time.perf_counter() - t0
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(stores))]
+    for t in threads:
+        t.start()
+    t0 = time.perf_counter()
+    start.wait()
+    for t in threads:
+        t.join()
+    return blocked, results, t0
+
+
+def row(label, blocked):
+    print(f"{label:>40} | max {max(blocked) * 1e3:>7.1f} ms | mean {np.mean(blocked) * 1e3:>7.1f} ms")
+
+
+if __name__ == "__main__":
+    stores = [build(s) for s in range(USERS)]
+    print(f"users={USERS} rows/user={ROWS:,} days={DAYS} workers={reports.REPORT_WORKERS}")
+
+    inline(stores[0])   # plotly import 등 첫 호출 비용 제외
+    blocked, _, _ = concurrent(inline, stores)
+    row("inline: page blocked", blocked)
+
+    blocked, jobs, t0 = concurrent(pooled, stores)
+    for job in jobs:
+        job.result()
+    row(f"pool: page blocked (incl. ≤{WAIT * 1e3:.0f} ms wait)", blocked)
+    print(f"{'pool: all reports ready':>40} | {(time.perf_counter() - t0) * 1e3:>7.1f} ms")
+
+    t0 = time.perf_counter()
+    again = [pooled(s) for s in stores]
+    warm = (time.perf_counter() - t0) / USERS
+    assert all(a is b for a, b in zip(jobs, again))
+    print(f"{'unchanged data: rerun (per user)':>40} | {warm * 1e6:>7.1f} µs")
+
+    stores[0].append("수학", "새 계획", 30, True, "2025-06-01")
+    t0 = time.perf_counter()
+    fresh = pooled(stores[0])
+    print(f"{'after an edit: rebuilt + resubmitted':>40} | {(time.perf_counter() - t0) * 1e3:>7.1f} ms"
+          f" | new={fresh is not jobs[0]}")
+    print(f"cache hits={reports.pool.hits} misses={reports.pool.misses}")
@@ -0,0 +1,135 @@
+# benchmarks/bench_rerun.py
+# 페이지별 재실행(rerun) 지연 — AppTest로 test.py의 각 페이지와 main.py(MBTI 추천기)를 화면 없이 실행
+#   - 합성 할 일 0 / 1k / 100k / 1M행에서 p50 / p95 재실행 시간, 재실행 중 최대 메모리(tracemalloc)
+#   - 결과는 JSON으로 저장 (--out), --baseline을 주면 p95가 허용치 이상 느려진 항목이 있을 때 종료 코드 1
+# 실행: python benchmarks/bench_rerun.py [--sizes 0,1000] [--reruns 20] [--out rerun.json] [--baseline old.json]
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from studybody.store import TaskStore  # noqa: E402
+from studybody.views import PAGES  # noqa: E402
+
+from bench_planner_window import synthetic_store  # noqa: E402
+
+SIZES = [0, 1_000, 100_000, 1_000_000]
+RERUNS = 20
+TOLERANCE = 0.25   # --baseline 비교 시 p95 허용 증가율
+
+
+def _reruns(at, reruns: int):
+    # (재실행 시간 목록, 최대 메모리 바이트) — 시간은 tracemalloc 없이 재고, 메모리는 한 번 더 돌려서 잰다
+    times = []
+    for _ in range(reruns):
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return times, peak
+
+
+def _summary(app: str, page: str, rows, times, peak, exceptions) -> dict:
+    return {
+        "app": app,
+        "page": page,
+        "rows": rows,
+        "p50_ms": float(np.percentile(times, 50) * 1e3),
+        "p95_ms": float(np.percentile(times, 95) * 1e3),
+        "peak_mem_mb": peak / 1e6,
+        "exceptions": exceptions,
+    }
+
+
+def bench_page(page: str, store: TaskStore, reruns: int) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / "test.py"), default_timeout=600)
+    at.session_state["tasks"] = store
+    at.session_state["page"] = page
+    at.run()   # 첫 실행(import·캐시 채우기)은 제외
+    times, peak = _reruns(at, reruns)
+    return _summary("test.py", page, len(store), times, peak, [e.value for e in at.exception])
+
+
+def bench_mbti(reruns: int) -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(str(ROOT / "main.py"), default_timeout=600)
+    at.run()
+    times, peak = _reruns(at, reruns)
+    return _summary("main.py", "MBTI 직업 추천", None, times, peak, [e.value for e in at.exception])
+
+
+def compare(results, baseline, tolerance: float):
+    # p95가 기준보다 tolerance 이상 늘어난 항목
+    old = {(r["app"], r["page"], r["rows"]): r for r in baseline["results"]}
+    slower = []
+    for r in results:
+        b = old.get((r["app"], r["page"], r["rows"]))
+        if b and r["p95_ms"] > b["p95_ms"] * (1 + tolerance):
+            slower.append((r, b))
+    return slower
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default=",".join(map(str, SIZES)), help="합성 할 일 행 수 (쉼표 구분)")
+    ap.add_argument("--reruns", type=int, default=RERUNS)
+    ap.add_argument("--out", default="bench_rerun.json")
+    ap.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    ap.add_argument("--tolerance", type=float, default=TOLERANCE)
+    args = ap.parse_args(argv)
+
+    from streamlit.logger import set_log_level
+
+    set_log_level("error")   # 화면 없이 실행할 때의 경고 로그는 숨긴다
+    os.environ.setdefault("STUDYBODY_DB", str(Path(tempfile.mkdtemp()) / "bench.db"))
+    results = []
+    print(f"{'app':<8} | {'page':<12} | {'rows':>9} | {'p50':>9} | {'p95':>9} | {'peak mem':>9}")
+    for n in [int(s) for s in args.sizes.split(",") if s]:
+        store = synthetic_store(n) if n else TaskStore()
+        for page in PAGES:
+            results.append(bench_page(page, store, args.reruns))
+    results.append(bench_mbti(args.reruns))
+    for r in results:
+        rows = f"{r['rows']:,}" if r["rows"] is not None else "-"
+        print(f"{r['app']:<8} | {r['page']:<12} | {rows:>9} | {r['p50_ms']:>6.1f} ms | {r['p95_ms']:>6.1f} ms | "
+              f"{r['peak_mem_mb']:>6.1f} MB" + (f"  (예외: {r['exceptions']})" if r["exceptions"] else ""))
+
+    import streamlit
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "reruns": args.reruns,
+        "results": results,
+    }
+    Path(args.out).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"결과 저장: {args.out}")
+
+    failed = any(r["exceptions"] for r in results)
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        for r, b in compare(results, baseline, args.tolerance):
+            print(f"느려짐: {r['app']} {r['page']} rows={r['rows']} p95 {b['p95_ms']:.1f} → {r['p95_ms']:.1f} ms")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
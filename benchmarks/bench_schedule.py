@@ -0,0 +1,40 @@
+# benchmarks/bench_schedule.py
+# 에너지 기반 자동 배치: 일주일치 계획 수별 auto_schedule 시간 (휴식 10분, 5분 칸)
+# 실행: python benchmarks/bench_schedule.py
+import sys
+import time
+from datetime import time as clock
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from studybody.schedule import auto_schedule  # noqa: E402
+
+SIZES = [50, 200, 500, 1_000]
+REPEAT = 20
+
+
+def synthetic(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    today = pd.Timestamp.today().normalize()
+    return pd.DataFrame({
+        "과목": rng.choice(["화학", "수학", "영어"], n),
+        "주제": [f"단원 {i}" for i in range(n)],
+        "예정(분)": rng.integers(10, 120, n),
+        "완료": rng.random(n) < 0.1,
+        "날짜": today + pd.to_timedelta(rng.integers(0, 7, n), unit="D"),
+    })
+
+
+if __name__ == "__main__":
+    print(f"{'tasks':>6} | {'schedule':>10} | {'placed':>7}")
+    for n in SIZES:
+        tasks = synthetic(n)
+        auto_schedule(tasks, "일반형", clock(7, 0), 7.0)
+        t0 = time.perf_counter()
+        for _ in range(REPEAT):
+            plan = auto_schedule(tasks, "일반형", clock(7, 0), 7.0)
+        dt = (time.perf_counter() - t0) / REPEAT
+        print(f"{n:>6,} | {dt * 1e3:>7.1f} ms | {int(plan['시작'].notna().sum()):>7}")
@@ -0,0 +1,63 @@
+# benchmarks/bench_srs.py
+# 간격 반복 덱: 카드 수별 "복습할 카드 20장" 조회 + 복습 기록 시간 (힙 vs 매번 정렬)
+# 시작 전에 SM-2 갱신 규칙을 확인한다 (틀린 카드는 간격·반복 수만 처음부터, 쉬움 정도는 그대로)
+# 실행: python benchmarks/bench_srs.py
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from studybody.srs import EASE_START, Deck  # noqa: E402
+
+SIZES = [1_000, 100_000, 1_000_000]
+ROUNDS = 200
+DUE = 20
+
+
+def build(n: int) -> Deck:
+    rng = random.Random(0)
+    deck = Deck()
+    for i in range(n):
+        deck.add(f"카드 {i}", rng.randrange(0, 60))   # 복습일을 60일에 흩뿌림
+    return deck
+
+
+def session(deck: Deck, pick) -> float:
+    # 하루 30일차에 20장씩 뽑아 모두 "보통"으로 복습하기를 ROUNDS번
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        for row in pick(deck):
+            deck.review(row, 4, 30)
+    return (time.perf_counter() - t0) / ROUNDS
+
+
+def check_sm2():
+    deck = Deck()
+    row = deck.add("카드", 0)
+    deck.review(row, 4, 0)
+    deck.review(row, 4, 1)
+    deck.review(row, 4, 7)
+    ease, interval = deck.ease[row], deck.interval[row]
+    assert (deck.reps[row], interval) == (3, round(6 * EASE_START)), (deck.reps[row], interval)
+    deck.review(row, 1, 22)   # 틀림
+    assert (deck.reps[row], deck.interval[row], deck.due_day[row]) == (0, 1, 23)
+    assert deck.ease[row] == ease, (deck.ease[row], ease)
+    deck.review(row, 5, 23)   # 맞히면 다시 1일부터, 쉬움 정도는 오른다
+    assert deck.interval[row] == 1 and deck.ease[row] > ease
+
+
+def naive(deck: Deck):
+    # 비교용: 매번 전체 카드에서 복습일이 지난 것을 골라 정렬
+    return [r for _, r in sorted((d, r) for r, d in enumerate(deck.due_day) if d <= 30)[:DUE]]
+
+
+if __name__ == "__main__":
+    check_sm2()
+    print(f"{'cards':>10} | {'heap due+review':>15} | {'sort due+review':>15} | {'bytes/card (state)':>18}")
+    for n in SIZES:
+        t_heap = session(build(n), lambda d: d.due(DUE, 30))
+        t_sort = f"{session(build(n), naive) * 1e3:>12.3f} ms" if n <= 100_000 else f"{'-':>15}"
+        d = build(1)
+        per_card = sum(a.itemsize for a in (d.ease, d.interval, d.reps, d.due_day))
+        print(f"{n:>10,} | {t_heap * 1e3:>12.3f} ms | {t_sort} | {per_card:>18}")
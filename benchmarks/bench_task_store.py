@@ -0,0 +1,52 @@
+# benchmarks/bench_task_store.py
+# 추가 1건당 비용: 기존 pd.concat 방식 vs TaskStore.append
+# 실행: python benchmarks/bench_task_store.py
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from studybody.store import SUBJECTS, TaskStore  # noqa: E402
+
+SIZES = [1_000, 10_000, 50_000, 100_000]
+INSERTS = 200
+
+
+def synthetic(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "과목": rng.choice(SUBJECTS, n),
+        "주제": [f"단원 {i}" for i in range(n)],
+        "예정(분)": rng.integers(10, 300, n),
+        "완료": rng.random(n) < 0.5,
+        "날짜": (np.datetime64("2025-03-01") + rng.integers(0, 365, n)).astype(str),
+    })
+
+
+def bench_concat(base: pd.DataFrame) -> float:
+    df = base
+    t0 = time.perf_counter()
+    for i in range(INSERTS):
+        row = {"과목": "화학", "주제": f"new {i}", "예정(분)": 40, "완료": False, "날짜": "2025-10-18"}
+        df = pd.concat([df, pd.DataFrame([row])], ignore_index=True)
+    return (time.perf_counter() - t0) / INSERTS
+
+
+def bench_store(base: pd.DataFrame) -> float:
+    store = TaskStore()
+    store.extend(base)
+    t0 = time.perf_counter()
+    for i in range(INSERTS):
+        store.append("화학", f"new {i}", 40, False, date(2025, 10, 18))
+    return (time.perf_counter() - t0) / INSERTS
+
+
+if __name__ == "__main__":
+    print(f"{'rows':>10} | {'pd.concat (us/insert)':>22} | {'TaskStore (us/insert)':>22}")
+    for n in SIZES:
+        base = synthetic(n)
+        print(f"{n:>10,} | {bench_concat(base) * 1e6:>22.1f} | {bench_store(base) * 1e6:>22.1f}")
@@ -0,0 +1,93 @@
+# benchmarks/bench_templates.py
+# HTML 조각 렌더링: 재실행 한 번에 해당하는 카드 묶음(캐릭터 2 + 골든타임 3 + 직업 10)을 만드는 시간,
+# 그리고 AppTest로 본 페이지별 markdown 요소 수·바이트
+# 실행: python benchmarks/bench_templates.py
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+from studybody.templates import render, render_many  # noqa: E402
+
+ROUNDS = 5_000
+CHARS = [("🧠", "#7C3AED", "뉴런", "기억 담당", "지금 장기기억으로 전환할 찬스! 5문제만 복습하자 🔁"),
+         ("⚡", "#F59E0B", "ATP 몬스터", "에너지 담당", "에너지 저하 경보! 물을 1컵 마시고 60초 스트레칭 어때? 💧🧎")]
+SLOTS = [("09:00", "10:00", 91), ("14:30", "15:30", 84), ("19:00", "20:00", 77)]
+JOBS = [(f"직업 {i}", "분야", 90 - i) for i in range(10)]
+
+
+def legacy():
+    # 비교용: 예전처럼 요소마다 들여쓴 f-string을 새로 만든다
+    out = []
+    for emoji, color, name, tag, msg in CHARS:
+        out.append(f"""
+        <div class="character">
+          <div style="display:flex;gap:12px;align-items:center;">
+            <div style="font-size:36px">{emoji}</div>
+            <div>
+              <div style="font-weight:800;color:{color};font-size:16px;">{name}</div>
+              <div class="subtitle">{tag}</div>
+              <div class="speech" style="margin-top:8px;">{msg}</div>
+            </div>
+          </div>
+        </div>
+        """)
+    for start, end, power in SLOTS:
+        out.append(f"""
+                    <div class="card">
+                        <div style="font-size:22px;">⚡ {start} ~ {end}</div>
+                        <div class="subtitle">예상 집중도 {power}%</div>
+                    </div>
+                    """)
+    for name, category, fit in JOBS:
+        out.append(f"""
+            <div style="background-color:#F9F7FE; padding:15px; 
+                        border-radius:15px; margin:10px 0; 
+                        box-shadow: 2px 2px 8px rgba(0,0,0,0.1);">
+                <h4 style="margin:0;">{name}</h4>
+                <span style="color:gray; font-size:14px;">{category} · 적합도 {fit:.0f}%</span>
+            </div>
+            """)
+    return out
+
+
+def templated():
+    return [
+        "".join(render("character", emoji=e, color=c, name=n, tag=t, msg=m) for e, c, n, t, m in CHARS),
+        render_many("golden", tuple(SLOTS), wrap="card-row"),
+        render_many("job", tuple(JOBS)),
+    ]
+
+
+def timed(fn) -> float:
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - t0) / ROUNDS
+
+
+def payload():
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["STUDYBODY_DB"] = str(Path(tempfile.mkdtemp()) / "bench.db")
+    out = {}
+    for name, app in (("대시보드", "test.py"), ("MBTI 추천 (k=10)", "main.py")):
+        at = AppTest.from_file(str(ROOT / app), default_timeout=120).run()
+        if app == "main.py":
+            at.slider[0].set_value(10).run()
+        md = [m.value for m in at.markdown]
+        out[name] = (len(md), sum(len(v.encode()) for v in md))
+    return out
+
+
+if __name__ == "__main__":
+    old, new = legacy(), templated()
+    print(f"{'':<18} | {'elements':>8} | {'bytes':>7} | {'build/rerun':>11}")
+    print(f"{'f-string per card':<18} | {len(old):>8} | {sum(len(s.encode()) for s in old):>7} | {timed(legacy) * 1e6:>8.1f} µs")
+    print(f"{'templates, batched':<18} | {len(new):>8} | {sum(len(s.encode()) for s in new):>7} | {timed(templated) * 1e6:>8.1f} µs")
+    print()
+    for page, (n, size) in payload().items():
+        print(f"{page:<18} | markdown 요소 {n:>3}개 · {size:,} bytes")
@@ -1,5 +1,9 @@
 import streamlit as st
 
+from studybody.catalog import get_catalog
+from studybody.jobs import get_job_index
+from studybody.templates import render_many
+
 # ✅ 페이지 기본 설정
 st.set_page_config(page_title="💼 MBTI 직업 추천기", page_icon="🌈", layout="centered")
 
@@ -16,35 +20,15 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-# ✅ MBTI 선택
-mbti_types = [
-    "INTJ", "INTP", "ENTJ", "ENTP",
-    "INFJ", "INFP", "ENFJ", "ENFP",
-    "ISTJ", "ISFJ", "ESTJ", "ESFJ",
-    "ISTP", "ISFP", "ESTP", "ESFP"
-]
-
-user_mbti = st.selectbox("🔮 당신의 MBTI를 선택해주세요:", mbti_types)
+# ✅ MBTI 선택 (유형 목록은 프로세스 공유 콘텐츠 카탈로그에서)
+catalog = get_catalog()
+jobs = get_job_index()
+user_mbti = st.selectbox("🔮 당신의 MBTI를 선택해주세요:", catalog.mbti_types)
 
-# ✅ 직업 추천 데이터
-job_recommendations = {
-    "INTJ": ["🧠 과학자", "📊 전략 컨설턴트", "📈 데이터 분석가"],
-    "INTP": ["💡 발명가", "🔬 연구원", "🤖 프로그래머"],
-    "ENTJ": ["👔 기업 임원", "📊 경영 컨설턴트", "📣 프로젝트 매니저"],
-    "ENTP": ["🚀 기업가", "📱 마케터", "⚡ 혁신가"],
-    "INFJ": ["🎨 작가", "🤝 상담사", "🌍 사회운동가"],
-    "INFP": ["📝 시인", "🎭 예술가", "🧘‍♀️ 심리상담사"],
-    "ENFJ": ["👩‍🏫 교사", "🎤 스피커", "🤗 인사 담당자"],
-    "ENFP": ["🎬 배우", "✈️ 여행가이드", "📣 크리에이터"],
-    "ISTJ": ["📚 회계사", "⚖️ 판사", "🏢 공무원"],
-    "ISFJ": ["🏥 간호사", "👨‍👩‍👧‍👦 사회복지사", "📑 사서"],
-    "ESTJ": ["📊 관리자", "🛠️ 엔지니어", "🏛️ 행정가"],
-    "ESFJ": ["💼 HR 매니저", "🍳 요리사", "🏥 간호조무사"],
-    "ISTP": ["🔧 기술자", "✈️ 파일럿", "🏍️ 모험가"],
-    "ISFP": ["🎨 디자이너", "🎶 음악가", "🌿 플로리스트"],
-    "ESTP": ["💸 세일즈맨", "⚽ 운동선수", "🎤 MC"],
-    "ESFP": ["🎭 배우", "🎉 이벤트 플래너", "🌍 여행 가이드"],
-}
+# ✅ 추천 조건
+col1, col2 = st.columns([2, 1])
+fields = col1.multiselect("🗂️ 관심 분야 (비우면 전체)", jobs.categories)
+top_k = col2.slider("추천 개수", 3, 10, 3)
 
 # ✅ 결과 출력
 if user_mbti:
@@ -57,19 +41,16 @@ if user_mbti:
         unsafe_allow_html=True
     )
 
-    recommendations = job_recommendations.get(user_mbti, ["❌ 추천 데이터 없음"])
-    
-    for job in recommendations:
-        st.markdown(
-            f"""
-            <div style="background-color:#F9F7FE; padding:15px; 
-                        border-radius:15px; margin:10px 0; 
-                        box-shadow: 2px 2px 8px rgba(0,0,0,0.1);">
-                <h4 style="margin:0;">{job}</h4>
-            </div>
-            """,
-            unsafe_allow_html=True
-        )
+    # 전체 직업 카탈로그와의 유사도 상위 k개
+    recommendations = jobs.top(user_mbti, top_k, categories=fields)
+    if not recommendations:
+        st.info("❌ 조건에 맞는 추천 데이터가 없어요")
+
+    # 카드 전체를 markdown 요소 하나로 (같은 직업·적합도 카드는 렌더 캐시에서)
+    st.markdown(
+        render_many("job", tuple((j.name, j.category, round(max(0, j.score) * 100)) for j in recommendations)),
+        unsafe_allow_html=True
+    )
 
 # ✅ 푸터
 st.markdown(
@@ -0,0 +1 @@
+# studybody — Study&Body 앱(test.py)의 데이터·계산 모듈
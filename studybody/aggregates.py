@@ -0,0 +1,107 @@
+# studybody/aggregates.py
+# (날짜, 과목)별 요약 인덱스 — 행이 바뀔 때 바뀐 행만큼만 갱신한다
+from collections import defaultdict
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+# 셀 값 순서: 예정 분, 완료 분, 항목 수, 완료 항목 수
+PLANNED, DONE_MIN, COUNT, DONE_COUNT = range(4)
+
+
+class DailyIndex:
+    """날짜 → 과목 → [예정 분, 완료 분, 항목 수, 완료 항목 수].
+
+    날짜별 합계도 따로 들고 있어서 '오늘 몇 분 했나' 같은 질문은 기록 길이와 무관하게 O(1)이다.
+    날짜가 없는 행(NaT)은 집계하지 않는다.
+    """
+
+    def __init__(self):
+        self._cells = defaultdict(dict)
+        self._totals = {}
+        # 변경분 (날짜, 과목, delta)을 받는 함수 — 여러 세션의 집계(코호트)로 흘려보낼 때 쓴다
+        self.listener = None
+
+    # -------------------- 갱신 --------------------
+    def add(self, day, subject, minutes: int, done: bool, sign: int = 1):
+        if day is None or pd.isna(day):
+            return
+        day = pd.Timestamp(day).date()
+        delta = (sign * int(minutes), sign * int(minutes) * bool(done), sign, sign * bool(done))
+        self._bump(day, subject, delta)
+
+    def add_rows(self, days, subjects, minutes, done, sign: int = 1):
+        # 여러 행을 (날짜, 과목)으로 묶어서 반영 — 비용은 바뀐 행 수에 비례
+        days = np.asarray(days, dtype="datetime64[D]")
+        if len(days) == 0:
+            return
+        minutes = np.asarray(minutes, dtype=np.int64)
+        done = np.asarray(done, dtype=bool)
+        grouped = pd.DataFrame({
+            "day": days,
+            "subject": np.asarray(subjects, dtype=object),
+            "planned": minutes,
+            "done_min": minutes * done,
+            "count": 1,
+            "done_count": done.astype(np.int64),
+        }).dropna(subset=["day"]).groupby(["day", "subject"], sort=False).sum()
+        for (day, subject), row in zip(grouped.index, grouped.to_numpy()):
+            self._bump(pd.Timestamp(day).date(), subject, tuple(sign * int(v) for v in row))
+
+    def apply(self, day, subject, delta):
+        # 다른 인덱스에서 받은 변경분 (예정 분, 완료 분, 항목 수, 완료 항목 수)을 그대로 더한다
+        self._bump(day, subject, delta)
+
+    def _bump(self, day, subject, delta):
+        if self.listener is not None:
+            self.listener(day, subject, delta)
+        cells = self._cells[day]
+        cell = cells.setdefault(subject, [0, 0, 0, 0])
+        total = self._totals.setdefault(day, [0, 0, 0, 0])
+        for i, v in enumerate(delta):
+            cell[i] += v
+            total[i] += v
+        if cell[COUNT] <= 0:
+            del cells[subject]
+        if total[COUNT] <= 0:
+            del self._totals[day]
+            self._cells.pop(day, None)
+
+    # -------------------- 조회 --------------------
+    def totals(self, day):
+        # (예정 분, 완료 분, 항목 수, 완료 항목 수)
+        return tuple(self._totals.get(day, (0, 0, 0, 0)))
+
+    def planned_minutes(self, day) -> int:
+        return self.totals(day)[PLANNED]
+
+    def done_minutes(self, day) -> int:
+        return self.totals(day)[DONE_MIN]
+
+    def subjects_on(self, day):
+        return list(self._cells.get(day, {}))
+
+    def subject_totals(self, start, end, field: int = PLANNED):
+        # 기간(포함) 과목별 합계 {과목: 값} — 기간 일수 × 과목 수만큼만 본다
+        out = {}
+        for i in range((end - start).days + 1):
+            for subject, cell in self._cells.get(start + timedelta(days=i), {}).items():
+                out[subject] = out.get(subject, 0) + cell[field]
+        return out
+
+    def series(self, field: int = DONE_MIN):
+        # (정렬된 날짜 목록, 날짜별 합계 배열) — 추세 차트용
+        days = sorted(self._totals)
+        return days, np.array([self._totals[d][field] for d in days], dtype=np.int64)
+
+    def pivot(self, field: int = PLANNED) -> pd.DataFrame:
+        # 날짜 × 과목 표 (리포트용) — 전체 행이 아니라 (날짜, 과목) 칸 수만큼만 순회
+        data = {
+            day: {subject: cell[field] for subject, cell in cells.items()}
+            for day, cells in self._cells.items()
+        }
+        table = pd.DataFrame.from_dict(data, orient="index").fillna(0).astype(int).sort_index()
+        table.index.name = "날짜"
+        table.columns.name = "과목"
+        return table
@@ -0,0 +1,192 @@
+# studybody/batch.py
+# MBTI 직업 추천 일괄 처리(화면 없음) — 대규모 인원(예: 신입생 전체)을 한 번에 처리할 때 쓴다.
+# 입력 CSV/JSONL을 청크 단위로 읽어 프로세스 풀에 나눠 보내고, 결과를 입력 순서대로 바로 흘려 쓴다.
+# 동시에 떠 있는 청크 수를 제한하므로 입력 크기와 상관없이 메모리 사용량이 일정하다.
+#
+# 실행: python -m studybody.batch cohort.csv -o recs.jsonl [--workers 4] [--chunk-rows 5000] [-k 3]
+#   입력 열: user_id, mbti, categories(선택, ';'로 구분 — JSONL은 목록도 됨), k(선택)
+#   '-'는 표준 입력/출력
+import argparse
+import csv
+import io
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from .jobs import get_job_index
+
+CHUNK_ROWS = 5_000
+DEFAULT_K = 3
+OUTPUT_FIELDS = ["user_id", "rank", "job", "category", "score"]
+
+
+# -------------------- 입력 --------------------
+def _open_in(path):
+    return sys.stdin if path == "-" else open(path, encoding="utf-8-sig", newline="")
+
+
+def _fmt_of(path, fmt):
+    if fmt:
+        return fmt
+    return "jsonl" if str(path).lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def _categories(value) -> tuple:
+    # 분야 목록 — "a;b" 문자열이든 ["a", "b"] 목록이든 같은 튜플로
+    if not value:
+        return ()
+    if isinstance(value, str):
+        value = value.split(";")
+    return tuple(c for c in (str(v).strip() for v in value) if c)
+
+
+def iter_rows(f, fmt: str):
+    # (user_id, mbti, categories 튜플, k 원본 값 또는 None) — 한 줄씩. k는 행별 오류 처리를 위해 작업자에서 검사한다
+    # JSONL에서 읽지 못한 줄은 k 자리에 ValueError를 실어 보내 작업자가 그 줄만 오류로 기록한다
+    if fmt == "jsonl":
+        for n, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                r = json.loads(line)
+            except ValueError as e:
+                yield "", "", (), ValueError(f"{n}번째 줄을 JSON으로 읽을 수 없어요: {e.msg}")
+                continue
+            if not isinstance(r, dict):
+                yield "", "", (), ValueError(f"{n}번째 줄이 JSON 객체가 아니에요")
+                continue
+            yield str(r.get("user_id", "")), str(r.get("mbti", "")), _categories(r.get("categories")), r.get("k")
+    else:
+        for r in csv.DictReader(f):
+            yield r.get("user_id", ""), r.get("mbti", ""), _categories(r.get("categories")), r.get("k")
+
+
+def chunked(rows, size: int):
+    it = iter(rows)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+# -------------------- 작업자 --------------------
+def _parse_k(value, default_k: int) -> int:
+    # 행의 k (비어 있으면 기본값) — 1 이상의 정수가 아니면 ValueError (그 행만 오류로 기록)
+    if value is None or str(value).strip() == "":
+        return default_k
+    try:
+        k = int(str(value).strip())
+    except ValueError:
+        raise ValueError(f"k가 정수가 아니에요: {value!r}") from None
+    if k < 1:
+        raise ValueError(f"k는 1 이상이어야 해요: {k}")
+    return k
+
+
+@lru_cache(maxsize=4096)
+def _recommend(mbti: str, categories: tuple, k: int):
+    # 같은 (유형, 분야, k) 질의는 작업자 프로세스 안에서 한 번만 계산 — 유형은 16개뿐이라 적중률이 높다
+    return tuple(get_job_index().top(mbti, k, categories=categories))
+
+
+@lru_cache(maxsize=4096)
+def _recommend_json(mbti: str, categories: tuple, k: int) -> str:
+    # JSONL 출력용으로 직렬화까지 끝낸 추천 목록
+    recs = [{"job": m.name, "category": m.category, "score": round(m.score, 4)} for m in _recommend(mbti, categories, k)]
+    return json.dumps(recs, ensure_ascii=False)
+
+
+def process_chunk(chunk, out_fmt: str, default_k: int) -> str:
+    # 청크 하나를 출력 텍스트로 (프로세스 간에는 문자열 하나만 오가도록)
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n") if out_fmt == "csv" else None
+    for user_id, mbti, cats, k in chunk:
+        try:
+            if isinstance(k, ValueError):   # 입력 단계에서 읽지 못한 줄
+                raise k
+            key = (mbti.strip().upper(), cats, _parse_k(k, default_k))
+            matches = _recommend(*key) if writer else _recommend_json(*key)
+        except ValueError as e:
+            if writer:
+                writer.writerow([user_id, 0, "", "", f"오류: {e}"])
+            else:
+                buf.write(json.dumps({"user_id": user_id, "error": str(e)}, ensure_ascii=False) + "\n")
+            continue
+        if writer:
+            writer.writerows([user_id, i, m.name, m.category, f"{m.score:.4f}"] for i, m in enumerate(matches, 1))
+        else:
+            buf.write(f'{{"user_id": {json.dumps(user_id, ensure_ascii=False)}, "recommendations": {matches}}}\n')
+    return buf.getvalue()
+
+
+def _init_worker():
+    get_job_index()   # 카탈로그는 작업자마다 시작할 때 한 번만 읽는다
+
+
+# -------------------- 실행 --------------------
+def run_batch(rows, write, out_fmt: str = "jsonl", workers: int = None, chunk_rows: int = CHUNK_ROWS,
+              default_k: int = DEFAULT_K) -> int:
+    # rows를 처리해 결과 텍스트를 write(str)로 입력 순서대로 넘긴다. 처리한 행 수를 돌려준다.
+    # workers=0이면 현재 프로세스에서만 처리 (생략하면 CPU 수, CPU가 하나면 0)
+    if workers is None:
+        workers = os.cpu_count() or 1
+        workers = workers if workers > 1 else 0
+    done = 0
+    if out_fmt == "csv":
+        write(",".join(OUTPUT_FIELDS) + "\n")
+    if workers <= 0:
+        for chunk in chunked(rows, chunk_rows):
+            write(process_chunk(chunk, out_fmt, default_k))
+            done += len(chunk)
+        return done
+
+    max_pending = 2 * workers   # 동시에 떠 있는 청크 수 상한 (= 메모리 상한)
+    pending = deque()
+    with ProcessPoolExecutor(workers, initializer=_init_worker) as pool:
+        for chunk in chunked(rows, chunk_rows):
+            pending.append((len(chunk), pool.submit(process_chunk, chunk, out_fmt, default_k)))
+            if len(pending) >= max_pending:
+                n, fut = pending.popleft()
+                write(fut.result())
+                done += n
+        while pending:
+            n, fut = pending.popleft()
+            write(fut.result())
+            done += n
+    return done
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m studybody.batch", description="MBTI 직업 추천 일괄 처리")
+    ap.add_argument("input", help="입력 CSV/JSONL 경로 ('-'는 표준 입력)")
+    ap.add_argument("-o", "--output", default="-", help="출력 경로 ('-'는 표준 출력)")
+    ap.add_argument("--in-format", choices=["csv", "jsonl"], help="입력 형식 (생략하면 확장자로 판단)")
+    ap.add_argument("--out-format", choices=["csv", "jsonl"], help="출력 형식 (생략하면 확장자로 판단)")
+    ap.add_argument("--workers", type=int, default=None, help="프로세스 수 (0이면 단일 프로세스)")
+    ap.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    ap.add_argument("-k", type=int, default=DEFAULT_K, help="사람당 추천 개수 (입력의 k 열이 우선)")
+    args = ap.parse_args(argv)
+
+    in_fmt = _fmt_of(args.input, args.in_format)
+    out_fmt = _fmt_of(args.output, args.out_format) if args.output != "-" else (args.out_format or "jsonl")
+    t0 = time.perf_counter()
+    with _open_in(args.input) as fin:
+        fout = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+        try:
+            rows = run_batch(iter_rows(fin, in_fmt), fout.write, out_fmt, args.workers, args.chunk_rows, args.k)
+        except BrokenPipeError:   # 출력을 받는 쪽(head 등)이 먼저 끝남
+            sys.stdout = None
+            return 1
+        finally:
+            if fout is not sys.stdout:
+                fout.close()
+    elapsed = time.perf_counter() - t0
+    print(f"{rows:,}행 처리 · {elapsed:.2f}초 · {rows / elapsed if elapsed else 0:,.0f}행/초", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+# studybody/bei.py
+# Brain Energy Index — 한 번 계산(스칼라)과 배열 일괄 계산(벡터) 두 가지. 결과는 항상 같다.
+import numpy as np
+
+
+def brain_energy_index(sleep_hours: float, water: int, caffeine: int, study_minutes_today: int):
+    # 간단한 휴리스틱 모델 (0~100)
+    score = 50
+    # 수면
+    if 7 <= sleep_hours <= 9:
+        score += 20
+    else:
+        score -= 10 * abs(8 - sleep_hours) / 2
+    # 수분
+    if water >= 6:
+        score += 10
+    elif water <= 2:
+        score -= 8
+    # 카페인
+    if caffeine == 0:
+        score += 4
+    elif caffeine <= 2:
+        score += 2
+    else:
+        score -= 6 * (caffeine - 2)
+    # 공부 시간 (과도/부족 보정)
+    if study_minutes_today < 30:
+        score -= 5
+    elif study_minutes_today > 360:
+        score -= 5
+    else:
+        score += min(12, study_minutes_today / 30 * 2)
+    return max(0, min(100, round(score)))
+
+
+def brain_energy_index_batch(sleep_hours, water, caffeine, study_minutes):
+    # 위 함수의 배열 버전. 인자는 스칼라 또는 같은 길이(브로드캐스트 가능)의 배열.
+    # 분기마다 더하는 순서를 스칼라 버전과 똑같이 맞춰서 부동소수 결과까지 일치시킨다.
+    sleep = np.asarray(sleep_hours, dtype=float)
+    water = np.asarray(water)
+    caffeine = np.asarray(caffeine)
+    study = np.asarray(study_minutes)
+    shape = np.broadcast(sleep, water, caffeine, study).shape
+
+    score = np.full(shape, 50.0)
+    score += np.where((sleep >= 7) & (sleep <= 9), 20.0, -(10 * np.abs(8 - sleep) / 2))
+    score += np.select([water >= 6, water <= 2], [10.0, -8.0], 0.0)
+    score += np.select([caffeine == 0, caffeine <= 2], [4.0, 2.0], -(6.0 * (caffeine - 2)))
+    score += np.where(
+        (study < 30) | (study > 360), -5.0, np.minimum(12, study / 30 * 2)
+    )
+    return np.clip(np.round(score), 0, 100).astype(np.int64)
@@ -0,0 +1,111 @@
+# studybody/catalog.py
+# 콘텐츠 카탈로그(캐릭터·시너지 팁·플래시카드·MBTI 유형) — content/catalog.json을 프로세스당 한 번 읽어
+# 읽기 전용 구조로 모든 세션이 공유한다. 파일이 바뀌면(수정 시각) 다음 조회 때 통째로 다시 읽어 교체한다.
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+CATALOG_PATH = Path(os.environ.get("STUDYBODY_CONTENT", Path(__file__).with_name("content") / "catalog.json"))
+CATALOG_VERSION = 2   # 2: jobs(MBTI → 직업 목록) 대신 mbti_types 목록
+RELOAD_CHECK_SEC = 1.0   # 파일 변경 확인 간격 (조회마다 stat 하지 않도록)
+FALLBACK_SUBJECT = "기타"
+MBTI_AXES = ("EI", "SN", "TF", "JP")   # jobs.AXES와 같다 — 시작 시 NumPy를 불러오지 않으려고 여기서는 문자만 본다
+
+
+class Character(NamedTuple):
+    emoji: str
+    color: str
+    tag: str
+    line: tuple
+
+
+class Catalog(NamedTuple):
+    version: int
+    characters: MappingProxyType   # 이름 → Character
+    tips: MappingProxyType         # 과목 → (팁, ...)
+    cards: MappingProxyType        # 과목 → ((질문, 정답), ...)
+    subjects: tuple                # tips의 과목 순서 그대로
+    mbti_types: tuple              # MBTI 선택지 (직업 추천은 jobs.JobIndex가 content/jobs.csv로 한다)
+
+    def tips_for(self, subject: str):
+        tips = self.tips.get(subject)
+        return tips if tips is not None else self.tips[FALLBACK_SUBJECT]
+
+
+def _freeze_lists(d: dict):
+    return MappingProxyType({k: tuple(v) for k, v in d.items()})
+
+
+def parse(doc: dict) -> Catalog:
+    version = doc.get("version")
+    if version != CATALOG_VERSION:
+        raise ValueError(f"지원하지 않는 카탈로그 버전: {version!r} (필요: {CATALOG_VERSION})")
+    characters = MappingProxyType({
+        name: Character(c["emoji"], c["color"], c["tag"], tuple(c["line"]))
+        for name, c in doc["characters"].items()
+    })
+    cards = MappingProxyType({subj: tuple(tuple(qa) for qa in deck) for subj, deck in doc["cards"].items()})
+    tips = _freeze_lists(doc["tips"])
+    mbti_types = tuple(doc["mbti_types"])
+    for mbti in mbti_types:
+        if len(mbti) != 4 or any(ch not in axis for ch, axis in zip(mbti, MBTI_AXES)):
+            raise ValueError(f"MBTI 유형이 아니에요: {mbti!r}")
+    if FALLBACK_SUBJECT not in tips:
+        raise ValueError(f"tips에 '{FALLBACK_SUBJECT}' 항목이 필요해요")
+    return Catalog(
+        version=version,
+        characters=characters,
+        tips=tips,
+        cards=cards,
+        subjects=tuple(tips),
+        mbti_types=mbti_types,
+    )
+
+
+def load(path=CATALOG_PATH) -> Catalog:
+    with open(path, encoding="utf-8") as f:
+        return parse(json.load(f))
+
+
+class _Loaded:
+    """현재 카탈로그와 그 파일의 수정 시각. 다시 읽을 때는 참조만 바꿔 끼운다."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = threading.Lock()
+        self.catalog = None
+        self.mtime = None
+        self.checked = 0.0
+
+    def get(self) -> Catalog:
+        now = time.monotonic()
+        if self.catalog is not None and now - self.checked < RELOAD_CHECK_SEC:
+            return self.catalog
+        with self.lock:
+            self.checked = now
+            try:
+                mtime = self.path.stat().st_mtime_ns
+            except OSError:
+                if self.catalog is None:
+                    raise
+                return self.catalog   # 파일을 잠시 못 읽으면 이전 내용을 계속 쓴다
+            if mtime != self.mtime:
+                try:
+                    self.catalog = load(self.path)
+                except (KeyError, ValueError):   # JSON·형식 오류: 처음이면 실패, 아니면 이전 내용 유지
+                    if self.catalog is None:
+                        raise
+                self.mtime = mtime
+            return self.catalog
+
+
+_current = _Loaded(CATALOG_PATH)
+
+
+def get_catalog() -> Catalog:
+    # 프로세스 공유 카탈로그 (읽기 전용) — 파일이 바뀌었으면 새로 읽은 것
+    return _current.get()
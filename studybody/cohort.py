@@ -0,0 +1,121 @@
+# studybody/cohort.py
+# 반 전체(코호트) 집계 — 모든 세션의 계획 변경분이 흘러 들어오는 프로세스 공유 저장소.
+# 세션의 DailyIndex에 listener로 붙어서 (날짜, 과목) 변경분만 받으므로,
+# "이번 주 과목별 공부 시간" 같은 질문은 학생 수와 무관하게 미리 합쳐 둔 칸만 읽는다.
+# 저장소가 같은 SQLite 파일을 공유하므로 세션이 불러온 기존 기록은 세지 않고, 세션에서 생긴 변경분만 센다.
+# STALE_SEC 동안 실행이 없는 학생(닫힌 탭 등)은 연결을 끊어 참여 학생·BEI 평균에서 빼고 세션 인덱스도 놓아준다.
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from functools import partial
+
+from .aggregates import COUNT, DONE_MIN, PLANNED, DailyIndex
+
+STALE_SEC = 30 * 60   # 이만큼 실행이 없으면 떠난 학생으로 본다
+SWEEP_SEC = 60        # 떠난 학생 정리는 이 간격에 한 번만 (학생 수만큼 훑으므로)
+
+
+class CohortStore:
+    """학생(세션) → 변경분 → (날짜, 과목) 합계 + 날짜별 활동 학생 수 + 날짜별 BEI 평균. 모든 접근은 잠금 안에서."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._daily = DailyIndex()
+        self._student_days = defaultdict(int)   # (학생, 날짜) → 항목 수
+        self._active = defaultdict(int)         # 날짜 → 항목이 있는 학생 수
+        self._bei = defaultdict(dict)           # 날짜 → {학생: BEI}
+        self._bei_sum = defaultdict(float)      # 날짜 → BEI 합
+        self._attached = {}                     # 학생 → 세션 DailyIndex
+        self._seen = {}                         # 학생 → 마지막 실행 시각 (time.time)
+        self._swept = 0.0
+
+    # -------------------- 세션 연결 --------------------
+    def attach(self, student: str, index: DailyIndex, now: float = None):
+        # 세션의 집계 인덱스를 학생 이름으로 연결 (같은 조합이면 시각만 갱신 — 매 실행 호출해도 O(1))
+        now = time.time() if now is None else now
+        with self._lock:
+            self._seen[student] = now
+            self._expire(now)
+            if self._attached.get(student) is index:
+                return
+            for other, idx in list(self._attached.items()):
+                if idx is index:   # 같은 세션이 이름을 바꿈 — 예전 이름의 BEI 보고는 지운다
+                    del self._attached[other]
+                    self._seen.pop(other, None)
+                    self._drop_bei(other)
+            old = self._attached.get(student)
+            if old is not None:    # 같은 학생의 예전 세션 (새로고침 등) — 이미 반영된 변경분은 남긴다
+                old.listener = None
+            self._attached[student] = index
+            index.listener = partial(self._on_change, student)
+
+    def _on_change(self, student, day, subject, delta):
+        with self._lock:
+            self._daily.apply(day, subject, delta)
+            key = (student, day)
+            before = self._student_days[key]
+            after = before + delta[COUNT]
+            if before <= 0 < after:
+                self._active[day] += 1
+            elif after <= 0 < before:
+                self._active[day] -= 1
+            if after:
+                self._student_days[key] = after
+            else:
+                del self._student_days[key]
+
+    def report_bei(self, student: str, day, bei: float):
+        with self._lock:
+            scores = self._bei[day]
+            self._bei_sum[day] += bei - scores.get(student, 0)
+            scores[student] = bei
+
+    def _drop_bei(self, student):
+        for day, scores in self._bei.items():
+            if student in scores:
+                self._bei_sum[day] -= scores.pop(student)
+
+    def _expire(self, now: float):
+        # STALE_SEC 넘게 안 보인 학생의 연결을 끊는다 — 이미 더해진 공부 시간은 남기고 BEI 보고만 뺀다
+        if now - self._swept < SWEEP_SEC:
+            return
+        self._swept = now
+        for student, seen in list(self._seen.items()):
+            if now - seen > STALE_SEC:
+                del self._seen[student]
+                index = self._attached.pop(student, None)
+                if index is not None:
+                    index.listener = None
+                self._drop_bei(student)
+
+    # -------------------- 조회 --------------------
+    @property
+    def students(self) -> int:
+        # 지금 연결된 학생 수 (떠난 학생 제외)
+        with self._lock:
+            self._expire(time.time())
+            return len(self._attached)
+
+    def subject_minutes(self, start, end):
+        # 기간 과목별 {과목: (예정 분, 완료 분)}
+        with self._lock:
+            planned = self._daily.subject_totals(start, end, PLANNED)
+            done = self._daily.subject_totals(start, end, DONE_MIN)
+        return {s: (planned[s], done.get(s, 0)) for s in planned}
+
+    def daily(self, start, end):
+        # 날짜별 [(날짜, 예정 분, 완료 분, 활동 학생 수, BEI 평균 또는 None), ...]
+        rows = []
+        with self._lock:
+            self._expire(time.time())
+            for i in range((end - start).days + 1):
+                day = start + timedelta(days=i)
+                planned, done, _, _ = self._daily.totals(day)
+                n_bei = len(self._bei.get(day, ()))
+                rows.append((day, planned, done, self._active.get(day, 0),
+                             self._bei_sum.get(day, 0.0) / n_bei if n_bei else None))
+        return rows
+
+
+cohort = CohortStore()
@@ -0,0 +1,174 @@
+# studybody/events.py
+# 계획 변경 기록(이벤트 로그) — 추가·수정·완료·삭제를 (행 id, 이전 행, 이후 행) 한 줄로 뒤에만 덧붙인다.
+# 테이블 크기에 비례하는 개수(최소 SNAPSHOT_EVERY)만큼 쌓일 때마다 그 시점의 테이블(TaskStore.frame)을 스냅샷으로 잡아
+# 두므로, 최근 상태는 가장 가까운 스냅샷에서 그만큼만 다시 적용하면 된다. 복사 비용은 이벤트당 몇 행 꼴로 나뉜다.
+# 스냅샷이 MAX_SNAPSHOTS개를 넘으면 하나 걸러 버리고 간격을 두 배로 늘린다 — 개수는 상한 안에 두면서도
+# 어느 시점이든 바로 앞 스냅샷까지의 거리가 현재 간격 이하로 남는다 (로그 전체를 처음부터 재생하지 않는다).
+# 되돌리기/다시 실행도 기록을 지우지 않고 반대 변경을 새 이벤트로 덧붙인다.
+import time
+from array import array
+from bisect import bisect_right
+from contextlib import contextmanager
+from typing import NamedTuple
+
+import pandas as pd
+
+SNAPSHOT_EVERY = 256   # 스냅샷 사이 최소 이벤트 수
+SNAPSHOT_RATIO = 0.5   # ... 이자 테이블 행 수의 이 비율 (큰 테이블을 몇 건 바뀔 때마다 통째로 복사하지 않도록)
+MAX_SNAPSHOTS = 8      # 메모리 상한 = 테이블 × 이 수
+DO, UNDO, REDO = "do", "undo", "redo"
+
+
+def row_tuples(df) -> dict:
+    # DataFrame → {행 id: (과목, 주제, 예정(분), 완료, 날짜)} — 로그에 남기는 행 형식
+    if df is None or len(df) == 0:
+        return {}
+    return dict(zip(df.index.tolist(), zip(
+        df["과목"].astype(object), df["주제"], df["예정(분)"].tolist(), df["완료"].tolist(), df["날짜"],
+    )))
+
+
+class Action(NamedTuple):
+    first: int    # 첫 이벤트 번호
+    last: int     # 마지막 이벤트 번호 + 1
+    at: float     # 시각 (time.time)
+    label: str
+    kind: str     # DO / UNDO / REDO
+
+
+class EventLog:
+    """이벤트 열(행 id·시각은 타입 배열, 행 값은 튜플 목록) + 스냅샷 + 되돌리기/다시 실행 스택.
+
+    행 값은 (과목, 주제, 예정(분), 완료, 날짜) 튜플이고 None이면 '그 행이 없음'이다.
+    snapshot_source는 현재 테이블을 돌려주는 함수 — 기록 시점의 상태와 같아야 한다.
+    """
+
+    def __init__(self, snapshot_source, snapshot_every: int = SNAPSHOT_EVERY, max_snapshots: int = MAX_SNAPSHOTS):
+        self._source = snapshot_source
+        self.snapshot_every = int(snapshot_every)
+        self.max_snapshots = max(3, int(max_snapshots))
+        self._stride = 1     # 스냅샷 간격 배수 (솎아낼 때마다 두 배)
+        self._row_id = array("q")
+        self._at = array("d")
+        self._before = []
+        self._after = []
+        self._snapshots = [(0, snapshot_source())]   # (이벤트 번호, 그 번호 직전까지 반영된 테이블)
+        self.actions = []
+        self._open = None    # 진행 중인 동작 (label, kind, 첫 번호)
+        self._undo = []      # 되돌릴 수 있는 동작 번호
+        self._redo = []
+
+    def __len__(self):
+        return len(self._row_id)
+
+    # -------------------- 기록 --------------------
+    @contextmanager
+    def action(self, label: str, kind: str = DO):
+        # 사용자 동작 하나(편집기 변경, 가져오기 등) 안의 변경을 한 번에 되돌릴 단위로 묶는다
+        if self._open is not None:   # 바깥 동작에 합친다
+            yield
+            return
+        self._open = (label, kind, len(self))
+        try:
+            yield
+        finally:
+            label, kind, first = self._open
+            self._open = None
+            if len(self) > first:
+                self._close(first, label, kind)
+
+    def _close(self, first: int, label: str, kind: str):
+        self.actions.append(Action(first, len(self), self._at[first], label, kind))
+        n = len(self.actions) - 1
+        if kind == DO:
+            self._undo.append(n)
+            self._redo.clear()
+        elif kind == UNDO:
+            self._redo.append(n)
+        else:
+            self._undo.append(n)
+
+    def record(self, changes, label: str = "편집"):
+        # changes: [(행 id, 이전 행 또는 None, 이후 행 또는 None), ...] — 저장소에 반영한 직후 호출
+        changes = [c for c in changes if c[1] != c[2]]
+        if not changes:
+            return
+        with self.action(label):
+            now = time.time()
+            for row_id, before, after in changes:
+                self._row_id.append(int(row_id))
+                self._at.append(now)
+                self._before.append(before)
+                self._after.append(after)
+        last_seq, last = self._snapshots[-1]
+        if len(self) - last_seq >= max(self.snapshot_every, int(len(last) * SNAPSHOT_RATIO)) * self._stride:
+            self._snapshots.append((len(self), self._source()))
+            if len(self._snapshots) > self.max_snapshots:
+                # 처음 상태와 가장 최근 것은 남기고 하나 걸러 — 남은 간격이 고르게 두 배가 된다
+                self._snapshots = self._snapshots[:1] + self._snapshots[:0:-2][::-1]
+                self._stride *= 2
+
+    def include(self, rows: pd.DataFrame):
+        # 기록을 시작하기 전부터 있던 행을 나중에 불러왔을 때 — 모든 스냅샷에 넣어 과거 상태에도 보이게 한다
+        self._snapshots = [
+            (seq, pd.concat([base.astype({"과목": object}), rows.astype({"과목": object})]).sort_index())
+            for seq, base in self._snapshots
+        ]
+
+    # -------------------- 되돌리기 --------------------
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def undo(self, store):
+        # 마지막 동작을 되돌린다 — 그 동작의 이벤트마다 '이전 행'으로 (store.restore)
+        self._revert(store, self._undo.pop(), UNDO)
+
+    def redo(self, store):
+        # 마지막으로 되돌린 동작을 다시 적용 — 되돌리기 동작을 되돌리는 것과 같다
+        self._revert(store, self._redo.pop(), REDO)
+
+    def _revert(self, store, n: int, kind: str):
+        action = self.actions[n]
+        rows = {}
+        for i in range(action.last - 1, action.first - 1, -1):   # 같은 행이 여러 번 바뀌었으면 가장 이른 '이전 행'
+            rows[self._row_id[i]] = self._before[i]
+        with self.action(action.label, kind):
+            store.restore(rows)
+
+    def restore_to(self, store, seq: int):
+        # 이벤트 seq개까지의 상태로 되돌린다 (그 뒤에 바뀐 행만 손댄다). 이것도 되돌릴 수 있는 동작이다.
+        changed = set(self._row_id[seq:])
+        if not changed:
+            return
+        target = self.state_at(seq)
+        target = target.loc[target.index.intersection(list(changed))]
+        rows = dict.fromkeys(changed)
+        rows.update(row_tuples(target))
+        with self.action("시점 복원"):
+            store.restore(rows)
+
+    # -------------------- 재생 --------------------
+    def state_at(self, seq: int = None) -> pd.DataFrame:
+        # 이벤트 seq개까지 반영된 테이블 — 가장 가까운 이전 스냅샷에서 나머지 이벤트만 다시 적용
+        seq = len(self) if seq is None else max(0, min(int(seq), len(self)))
+        if seq == len(self):
+            return self._source()   # 지금 상태는 재생할 것 없이 저장소에서
+        k = bisect_right([s for s, _ in self._snapshots], seq) - 1
+        start, base = self._snapshots[k]
+        latest = {}
+        for i in range(start, seq):
+            latest[self._row_id[i]] = self._after[i]
+        if not latest:
+            return base
+        kept = base.drop(index=base.index.intersection(list(latest)))
+        rows = {rid: row for rid, row in latest.items() if row is not None}
+        if not rows:
+            return kept
+        added = pd.DataFrame.from_dict(rows, orient="index", columns=base.columns)
+        added.index.name = base.index.name
+        return pd.concat([kept.astype({"과목": object}), added]).sort_index()
@@ -0,0 +1,181 @@
+# studybody/figures.py
+# 프로세스 전체가 공유하는 Plotly 그림 캐시 — 입력이 같으면 Plotly 객체 생성·검증을 건너뛴다
+import threading
+from collections import OrderedDict
+from datetime import time
+
+import numpy as np
+import plotly.graph_objects as go
+
+try:
+    from plotly.basedatatypes import convert_to_base64
+except ImportError:  # plotly < 6: 배열을 base64로 바꾸지 않고 그대로 보낸다
+    def convert_to_base64(obj):
+        pass
+
+from .profiler import profiled
+from .rhythm import energy_curve, wake_minute
+
+
+class SpecFigure(go.Figure):
+    """미리 만들어 둔 spec(dict)을 그대로 내주는 Figure.
+
+    st.plotly_chart는 Figure를 받으면 to_dict() → JSON 직렬화만 하므로,
+    to_dict()가 캐시된 spec을 돌려주면 검증·복사 비용이 사라진다. 공유 객체이니 수정 금지.
+    """
+
+    def __init__(self, spec: dict):
+        super().__init__()
+        self._spec = spec
+
+    def to_dict(self):
+        return self._spec
+
+
+class FigureCache:
+    """키 → SpecFigure, 크기 제한 LRU (여러 세션 스레드에서 같이 쓴다)."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key, build):
+        with self._lock:
+            fig = self._items.get(key)
+            if fig is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return fig
+            self.misses += 1
+        fig = SpecFigure(build())
+        with self._lock:
+            self._items[key] = fig
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return fig
+
+    def __len__(self):
+        return len(self._items)
+
+
+# -------------------- 공유 기본 레이아웃 --------------------
+# 한 번만 Plotly로 만들어 dict로 바꿔 두고, 이후에는 데이터 부분만 갈아 끼운다.
+_base_lock = threading.Lock()
+_bases = {}
+
+
+def _base(name: str, build):
+    with _base_lock:
+        if name not in _bases:
+            _bases[name] = build().to_dict()
+        return _bases[name]
+
+
+def _gauge_base(bar_color: str, threshold_color: str):
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=0,
+        number={'suffix': " / 100"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': bar_color},
+            'steps': [
+                {'range': [0, 40], 'color': "#fee2e2"},
+                {'range': [40, 70], 'color': "#fef3c7"},
+                {'range': [70, 100], 'color': "#dcfce7"},
+            ],
+            'threshold': {'line': {'color': threshold_color, 'width': 4}, 'thickness': 0.75, 'value': 70}
+        }
+    ))
+    fig.update_layout(height=250, margin=dict(l=10,r=10,t=10,b=10))
+    return fig
+
+
+def _energy_base():
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=[], y=[], mode="lines", name="에너지"))
+    fig.update_layout(
+        height=260,
+        margin=dict(l=10,r=10,t=10,b=10),
+        xaxis_title="시각(시)",
+        yaxis_title="예상 에너지(정규화)",
+    )
+    return fig
+
+
+gauge_cache = FigureCache(maxsize=128)
+energy_cache = FigureCache(maxsize=256)
+forecast_cache = FigureCache(maxsize=64)
+
+
+@profiled()
+def gauge_figure(bei: int, bar_color: str, threshold_color: str):
+    def build():
+        base = _base(("gauge", bar_color, threshold_color), lambda: _gauge_base(bar_color, threshold_color))
+        return {"data": [dict(base["data"][0], value=bei)], "layout": base["layout"]}
+    return gauge_cache.get((int(bei), bar_color, threshold_color), build)
+
+
+@profiled()
+def energy_figure(chronotype: str, wake: time):
+    def build():
+        base = _base("energy", _energy_base)
+        xs, curve = energy_curve(chronotype, wake)
+        trace = dict(base["data"][0], x=np.ascontiguousarray(xs), y=np.ascontiguousarray(curve))
+        convert_to_base64(trace)  # Figure.to_dict()와 같은 직렬화 형식
+        return {"data": [trace], "layout": base["layout"]}
+    return energy_cache.get((chronotype, wake_minute(wake)), build)
+
+
+@profiled()
+def forecast_figure(chronotype: str, start, days: int, wake: time, sleep_hours: float,
+                    weekend_shift: int = 0, weekend_sleep: float = 0.0):
+    # 장기 리듬 예보 히트맵 — 서버에서 표시 해상도(최대 120행 × 96열)로 줄인 값만 보낸다
+    from .forecast import forecast
+
+    def build():
+        z, rows, hours, _ = forecast(chronotype, start, days, wake_minute(wake), sleep_hours, weekend_shift, weekend_sleep)
+        fig = go.Figure(go.Heatmap(
+            z=z.astype(np.float32), x=hours, y=rows.astype(str), zmin=0, zmax=1,
+            colorscale="Viridis", colorbar=dict(title="에너지"),
+            hovertemplate="%{y} %{x:.2f}시<br>에너지 %{z:.2f}<extra></extra>",
+        ))
+        fig.update_layout(
+            height=max(260, min(600, 60 + 4 * len(rows))),
+            margin=dict(l=10,r=10,t=10,b=10),
+            xaxis=dict(title="시각(시)", dtick=3),
+            yaxis=dict(autorange="reversed"),
+        )
+        spec = fig.to_dict()
+        convert_to_base64(spec)  # z 행렬은 JSON 숫자 목록 대신 base64 (nan 포함)
+        return spec
+    key = (chronotype, start, int(days), wake_minute(wake), float(sleep_hours), int(weekend_shift), float(weekend_sleep))
+    return forecast_cache.get(key, build)
+
+
+def timeline_figure(schedule):
+    # 자동 배치 결과 타임라인 (날짜별 한 줄, 과목별 색) — 배치마다 달라서 캐시하지 않는다
+    import plotly.express as px
+
+    placed = schedule.dropna(subset=["시작"]).assign(날=lambda d: d["날짜"].dt.strftime("%m/%d (%a)"))
+    fig = px.timeline(placed, x_start="시작", x_end="종료", y="날", color="과목", hover_name="주제",
+                      hover_data={"예정(분)": True, "에너지": True, "날": False})
+    fig.update_yaxes(autorange="reversed", title=None)
+    fig.update_layout(height=120 + 40 * placed["날"].nunique(), margin=dict(l=10,r=10,t=10,b=10))
+    return fig
+
+
+def bei_trend_figure(days, bei_hist, line_color: str, avg_color: str):
+    # 리포트 BEI 추이 (일별 + 7일 평균) — 리포트 작업자가 한 번 만들어 spec째로 넘긴다 (리포트 캐시에 보관)
+    import pandas as pd
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=days, y=bei_hist, mode="lines+markers", name="일별 BEI", line=dict(color=line_color)))
+    fig.add_trace(go.Scatter(
+        x=days, y=pd.Series(bei_hist).rolling(7, min_periods=1).mean(),
+        mode="lines", name="7일 평균", line=dict(color=avg_color, width=3),
+    ))
+    fig.update_layout(height=260, margin=dict(l=10,r=10,t=10,b=10), yaxis=dict(range=[0, 100]))
+    return SpecFigure(fig.to_dict())
@@ -0,0 +1,70 @@
+# studybody/forecast.py
+# 장기 리듬 예보 — 날짜별 기상 시각·수면 시간으로 (일수 × 하루 칸) 에너지 행렬을 한 번에 만든다.
+# 미리 계산한 1분 곡선 표(rhythm.curve_table)를 2차원 인덱스로 뽑을 뿐이라 날짜별 파이썬 반복이 없다.
+# 화면에는 표시 해상도에 맞게 블록 평균으로 줄여서 보낸다.
+from datetime import date
+
+import numpy as np
+
+from .rhythm import CHRONOTYPES, DAY_MIN, curve_table
+
+MAX_DAYS = 365
+
+# 곡선 표의 각 칸이 '기상 후 몇 분째(하루 주기)'인지 — 수면 구간 마스크를 표와 같은 방식으로 잘라 쓰려고
+_ELAPSED = (np.arange(2 * DAY_MIN) - DAY_MIN) % DAY_MIN
+_ELAPSED_ROWS = np.lib.stride_tricks.sliding_window_view(_ELAPSED, DAY_MIN)
+
+
+def day_range(start: date, days: int):
+    # start부터 days일 (datetime64[D] 배열)
+    return np.datetime64(start, "D") + np.arange(int(days))
+
+
+def is_weekend(days):
+    weekday = (days.astype("datetime64[D]").view("int64") + 3) % 7   # 1970-01-01은 목요일 → 월=0
+    return weekday >= 5
+
+
+def weekly_plan(days, weekday_value, weekend_value):
+    # 날짜별 값 (토·일만 weekend_value) — 기상 시각·수면 시간 계획용
+    return np.where(is_weekend(days), weekend_value, weekday_value)
+
+
+def energy_matrix(chronotype: str, wake_min, sleep_hours, step: int = 5):
+    # (일수, 하루 칸 수) 에너지. 그날 자는 시간(기상 후 24-수면 시간 이후)은 nan
+    # 표를 하루 길이 창으로 본 뷰에서 날짜별 시작 행만 골라 온다 (curve_at을 모든 날에 한 번에, 행 단위 복사)
+    wake_min = np.asarray(wake_min, dtype=np.int64) % DAY_MIN
+    sleep_hours = np.broadcast_to(np.asarray(sleep_hours, dtype=float), wake_min.shape)
+    rows = DAY_MIN - wake_min
+    table = np.lib.stride_tricks.sliding_window_view(curve_table(CHRONOTYPES[chronotype]), DAY_MIN)
+    z = table[rows][:, ::step]
+    awake_min = ((24 - sleep_hours) * 60)[:, None]
+    return np.where(_ELAPSED_ROWS[rows][:, ::step] < awake_min, z, np.nan)
+
+
+def block_mean(z, max_rows: int, max_cols: int):
+    # 행·열을 정수 배로 묶어 평균 (nan 무시) — 결과는 최대 max_rows × max_cols. (행렬, 행 묶음 크기, 열 묶음 크기)
+    n, m = z.shape
+    fr, fc = -(-n // max_rows), -(-m // max_cols)
+    padded = np.full((-(-n // fr) * fr, -(-m // fc) * fc), np.nan)
+    padded[:n, :m] = z
+    blocks = padded.reshape(padded.shape[0] // fr, fr, padded.shape[1] // fc, fc)
+    valid = ~np.isnan(blocks)
+    count = valid.sum(axis=(1, 3))
+    total = np.where(valid, blocks, 0.0).sum(axis=(1, 3))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / count, np.nan), fr, fc
+
+
+def forecast(chronotype: str, start: date, days: int, wake_min: int, sleep_hours: float,
+             weekend_shift: int = 0, weekend_sleep: float = 0.0, step: int = 5, max_rows: int = 120, max_cols: int = 96):
+    # 표시용 예보: (줄인 행렬, 행 시작 날짜들, 열 시작 시각(시간), 원래 칸 수)
+    # 주말에는 weekend_shift분 늦게 일어나고 weekend_sleep시간 더 잔다
+    days = min(int(days), MAX_DAYS)
+    dates = day_range(start, days)
+    wake = weekly_plan(dates, wake_min, wake_min + int(weekend_shift))
+    sleep = weekly_plan(dates, sleep_hours, sleep_hours + weekend_sleep)
+    full = energy_matrix(chronotype, wake, sleep, step)
+    z, fr, fc = block_mean(full, max_rows, max_cols)
+    hours = np.arange(0, DAY_MIN, step * fc) / 60
+    return z, dates[::fr], hours, full.size
@@ -0,0 +1,95 @@
+# studybody/jobs.py
+# MBTI → 직업 추천 엔진 — 직업마다 네 축(E/I, S/N, T/F, J/P) 가중치 벡터를 두고
+# 모든 직업의 유사도를 행렬·벡터 곱 한 번으로 계산한 뒤 argpartition으로 상위 k개만 고른다.
+# 카탈로그(content/jobs.csv)는 프로세스당 한 번 읽어 정규화된 행렬로 들고 있는다.
+import csv
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+JOBS_PATH = Path(__file__).with_name("content") / "jobs.csv"
+AXES = ("EI", "SN", "TF", "JP")   # 각 축의 앞 글자가 +1
+
+
+class Match(NamedTuple):
+    name: str
+    category: str
+    score: float   # 코사인 유사도 (-1~1)
+
+
+def mbti_vector(mbti: str, strength=None):
+    # "INTJ" → [-1, -1, 1, 1] (축별 강도 0~1을 주면 곱한다)
+    mbti = mbti.upper()
+    if len(mbti) != 4 or any(ch not in axis for ch, axis in zip(mbti, AXES)):
+        raise ValueError(f"MBTI 유형이 아니에요: {mbti!r}")
+    vec = np.array([1.0 if ch == axis[0] else -1.0 for ch, axis in zip(mbti, AXES)])
+    if strength is not None:
+        vec *= np.asarray(strength, dtype=float)
+    return vec
+
+
+class JobIndex:
+    """직업 이름·분야·축 가중치를 열 배열로 들고 있는 읽기 전용 인덱스."""
+
+    def __init__(self, names, categories, weights):
+        weights = np.asarray(weights, dtype=np.float32).reshape(-1, len(AXES))
+        norms = np.linalg.norm(weights, axis=1, keepdims=True)
+        self.names = np.asarray(names, dtype=object)
+        self.categories = tuple(dict.fromkeys(categories))        # 분야 목록 (처음 나온 순서)
+        self._codes = {c: i for i, c in enumerate(self.categories)}
+        self.cat_codes = np.fromiter((self._codes[c] for c in categories), dtype=np.int32, count=len(self.names))
+        self.weights = np.divide(weights, norms, out=np.zeros_like(weights), where=norms > 0)  # 행 단위 정규화
+        # 분야별 행 번호 — 필터 질의 때 매번 전체를 훑지 않도록
+        self._rows_by_cat = [np.flatnonzero(self.cat_codes == i) for i in range(len(self.categories))]
+        for arr in (self.names, self.cat_codes, self.weights, *self._rows_by_cat):
+            arr.flags.writeable = False   # 세션끼리 공유하므로 읽기 전용
+
+    def __len__(self):
+        return len(self.names)
+
+    @classmethod
+    def from_csv(cls, path=JOBS_PATH):
+        # '#'으로 시작하는 줄은 주석
+        with open(path, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(line for line in f if not line.startswith("#")))
+        weights = [[float(r[axis[0].lower() + axis[1].lower()]) for axis in AXES] for r in rows]
+        return cls([r["name"] for r in rows], [r["category"] for r in rows], weights)
+
+    def scores(self, mbti: str, strength=None, rows=None):
+        # 직업(rows를 주면 그 행만)의 코사인 유사도 (행렬·벡터 곱 한 번)
+        user = mbti_vector(mbti, strength)
+        norm = np.linalg.norm(user)
+        weights = self.weights if rows is None else self.weights[rows]
+        return weights @ (user / norm if norm else user).astype(np.float32)
+
+    def top(self, mbti: str, k: int = 3, categories=None, strength=None):
+        # 유사도 상위 k개 [Match, ...] (높은 순). categories를 주면 그 분야 안에서만
+        if categories:
+            wanted = [self._rows_by_cat[self._codes[c]] for c in dict.fromkeys(categories) if c in self._codes]
+            candidates = np.concatenate(wanted) if wanted else np.empty(0, dtype=np.intp)
+        else:
+            candidates = None
+        pool = self.scores(mbti, strength, rows=candidates)
+        k = min(int(k), len(pool))
+        if k <= 0:
+            return []
+        part = np.argpartition(-pool, k - 1)[:k]          # 상위 k개 (순서 없음), O(n)
+        part = part[np.argsort(-pool[part], kind="stable")]
+        idx = part if candidates is None else candidates[part]
+        return [Match(self.names[i], self.categories[self.cat_codes[i]], float(pool[j])) for i, j in zip(idx, part)]
+
+
+_lock = threading.Lock()
+_index = None
+
+
+def get_job_index() -> JobIndex:
+    # 프로세스 공유 인덱스 — 처음 부를 때 한 번만 카탈로그를 읽는다
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = JobIndex.from_csv()
+    return _index
@@ -0,0 +1,153 @@
+# studybody/persist.py
+# 작업 테이블 영구 저장 — 로컬 SQLite(학생·날짜·과목 인덱스) + 선택적 Parquet 스냅샷
+import itertools
+import re
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+
+# pandas는 실제로 DataFrame을 다룰 때만 import (차트 없는 페이지의 시작 비용을 줄이기 위해)
+
+# 한글 열 이름 ↔ DB 열 이름
+_DB_COLUMNS = {"과목": "subject", "주제": "topic", "예정(분)": "minutes", "완료": "done", "날짜": "date"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id      INTEGER PRIMARY KEY,
+    owner   TEXT    NOT NULL DEFAULT '',
+    subject TEXT    NOT NULL,
+    topic   TEXT    NOT NULL DEFAULT '',
+    minutes INTEGER NOT NULL DEFAULT 0,
+    done    INTEGER NOT NULL DEFAULT 0,
+    date    TEXT
+);
+"""
+_INDEXES = """
+DROP INDEX IF EXISTS idx_tasks_date_subject;
+CREATE INDEX IF NOT EXISTS idx_tasks_owner_date_subject ON tasks(owner, date, subject);
+"""
+_SAFE_NAME = re.compile(r"[^\w-]")   # 스냅샷 파일 이름에 못 쓰는 문자
+
+
+class SQLiteBackend:
+    """TaskStore의 변경분만 쓰고, 필요한 날짜 범위만 읽어오는 SQLite 저장소.
+
+    행마다 주인(owner = 학생 이름)이 있고, 읽기·쓰기·삭제는 모두 그 주인의 행으로만 한정된다.
+    호출마다 연결을 새로 열기 때문에 여러 세션(스레드)에서 같이 써도 된다.
+    """
+
+    def __init__(self, path="studybody.db"):
+        self.path = str(path)
+        with self._connect() as con:
+            con.executescript(_SCHEMA)
+            # owner 열이 생기기 전 파일은 열을 덧붙인다 (예전 행은 주인 '' — 어느 학생에게도 보이지 않는다)
+            if "owner" not in {row[1] for row in con.execute("PRAGMA table_info(tasks)")}:
+                con.execute("ALTER TABLE tasks ADD COLUMN owner TEXT NOT NULL DEFAULT ''")
+            con.executescript(_INDEXES)
+
+    @contextmanager
+    def _connect(self):
+        # 트랜잭션 하나 = 연결 하나 (끝나면 커밋 후 닫는다)
+        con = sqlite3.connect(self.path, timeout=10)
+        try:
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            with con:
+                yield con
+        finally:
+            con.close()
+
+    # -------------------- 읽기 --------------------
+    def max_id(self) -> int:
+        # 행 id는 주인과 상관없이 파일 전체에서 유일하다
+        with self._connect() as con:
+            return con.execute("SELECT COALESCE(MAX(id), 0) FROM tasks").fetchone()[0]
+
+    def subjects_on(self, owner: str, day):
+        # 그날 계획이 있는 과목 (처음 나온 순서)
+        with self._connect() as con:
+            rows = con.execute(
+                "SELECT subject FROM tasks WHERE owner = ? AND date = ? GROUP BY subject ORDER BY MIN(id)",
+                (owner, day.isoformat()),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def load(self, owner: str, start=None, end=None, subjects=None, undated: bool = True):
+        # owner의 행 — start/end: 날짜(포함), subjects: 과목 목록 (생략하면 전체)
+        # undated: 날짜 없는 행도 범위와 상관없이 함께 읽을지 (이미 읽어 둔 세션이 기간만 넓힐 때는 False)
+        import pandas as pd
+
+        from .store import COLUMNS
+
+        where, params = ["owner = ?"], [owner]
+        if start is not None:
+            where.append("(date IS NULL OR date >= ?)" if undated else "date >= ?")
+            params.append(pd.Timestamp(start).date().isoformat())
+        elif not undated:
+            where.append("date IS NOT NULL")
+        if end is not None:
+            where.append("date <= ?")
+            params.append(pd.Timestamp(end).date().isoformat())
+        if subjects:
+            where.append(f"subject IN ({','.join('?' * len(subjects))})")
+            params.extend(subjects)
+        sql = "SELECT id, subject, topic, minutes, done, date FROM tasks WHERE " + " AND ".join(where) + " ORDER BY id"
+        with self._connect() as con:
+            df = pd.read_sql_query(sql, con, params=params, index_col="id")
+        df = df.rename(columns={v: k for k, v in _DB_COLUMNS.items()})
+        df["완료"] = df["완료"].astype(bool)
+        df["날짜"] = pd.to_datetime(df["날짜"], errors="coerce")
+        return df[COLUMNS]
+
+    # -------------------- 쓰기 --------------------
+    def flush(self, store, owner: str) -> int:
+        # 마지막 flush 이후 바뀐 행만 owner의 행으로 upsert/delete. 쓴 행 수를 돌려준다.
+        # 새로 생긴 행만 INSERT하고, 원래 있던 행은 아직 남아 있을 때만 UPDATE한다
+        # (다른 세션이 그새 지운 행을 오래된 사본이 되살리지 않도록). 다른 주인의 행은 건드리지 않는다.
+        ups, dels, created = store.drain_changes()
+        if ups.empty and not dels:
+            return 0
+        dates = ups["날짜"].dt.strftime("%Y-%m-%d")
+        rows = list(zip(
+            ups.index.tolist(),
+            itertools.repeat(owner),
+            ups["과목"].astype(str).tolist(),
+            ups["주제"].astype(str).tolist(),
+            ups["예정(분)"].astype(int).tolist(),
+            ups["완료"].astype(int).tolist(),
+            dates.where(dates.notna(), None).tolist(),
+        ))
+        new = [r for r in rows if r[0] in created]
+        edits = [(*r[2:], r[0], owner) for r in rows if r[0] not in created]
+        with self._connect() as con:
+            con.executemany(
+                "INSERT INTO tasks (id, owner, subject, topic, minutes, done, date) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET subject=excluded.subject, topic=excluded.topic, "
+                "minutes=excluded.minutes, done=excluded.done, date=excluded.date WHERE tasks.owner = excluded.owner",
+                new,
+            )
+            con.executemany(
+                "UPDATE tasks SET subject = ?, topic = ?, minutes = ?, done = ?, date = ? WHERE id = ? AND owner = ?",
+                edits,
+            )
+            con.executemany("DELETE FROM tasks WHERE id = ? AND owner = ?", [(int(i), owner) for i in dels])
+        return len(rows) + len(dels)
+
+    # -------------------- Parquet 스냅샷 --------------------
+    def snapshot(self, owner: str, path=None) -> Path:
+        # owner의 전체 기록을 Parquet 한 파일로 (pyarrow 필요) — 기본 경로는 DB 옆 "<DB 이름>-<주인>.parquet"
+        if path is None:
+            db = Path(self.path)
+            path = db.with_name(f"{db.stem}-{_SAFE_NAME.sub('_', owner)}.parquet")
+        path = Path(path)
+        df = self.load(owner)
+        df.reset_index().to_parquet(path, index=False)
+        return path
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
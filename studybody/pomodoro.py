@@ -0,0 +1,47 @@
+# studybody/pomodoro.py
+# 포모도로 상태 계산 — 시작 시각과 현재 시각만으로 O(1) 산술 계산 (스크립트 재실행 불필요)
+from typing import NamedTuple
+
+
+class Pomodoro(NamedTuple):
+    work: int       # 집중(분)
+    rest: int       # 휴식(분)
+    rounds: int
+    start: float    # 시작 시각 (epoch 초)
+
+
+class Phase(NamedTuple):
+    name: str       # "집중" / "휴식" / "완료"
+    round: int      # 1부터
+    remaining: int  # 남은 초
+    index: int      # 구간 번호 (집중1=0, 휴식1=1, 집중2=2, ...) — 바뀌면 단계 전환
+
+
+def phase_at(p: Pomodoro, now: float) -> Phase:
+    work, cycle = p.work * 60, (p.work + p.rest) * 60
+    elapsed = max(0.0, now - p.start)
+    if elapsed >= cycle * p.rounds:
+        return Phase("완료", p.rounds, 0, 2 * p.rounds)
+    round_idx, within = divmod(elapsed, cycle)
+    if within < work:
+        return Phase("집중", int(round_idx) + 1, int(work - within), 2 * int(round_idx))
+    return Phase("휴식", int(round_idx) + 1, int(cycle - within), 2 * int(round_idx) + 1)
+
+
+def segment_start(p: Pomodoro, index: int) -> float:
+    # index번째 구간이 시작하는 시각 (epoch 초)
+    cycle = (p.work + p.rest) * 60
+    return p.start + (index // 2) * cycle + (index % 2) * p.work * 60
+
+
+def transitions(p: Pomodoro, since: float, until: float):
+    # (since, until] 사이에 일어난 단계 전환 [(시각, Phase), ...] — 알림 이벤트용
+    first = phase_at(p, since).index + 1
+    last = phase_at(p, until).index
+    return [(segment_start(p, i), phase_at(p, segment_start(p, i))) for i in range(first, last + 1)]
+
+
+def upcoming(p: Pomodoro, now: float):
+    # 아직 오지 않은 단계 전환 전부 [(시각, Phase), ...] — 미리 예약해 둘 때
+    current = phase_at(p, now).index
+    return [(segment_start(p, i), phase_at(p, segment_start(p, i))) for i in range(current + 1, 2 * p.rounds + 1)]
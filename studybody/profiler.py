@@ -0,0 +1,137 @@
+# studybody/profiler.py
+# 선택형(opt-in) 구간 계측 — STUDYBODY_PROFILE=1 일 때만 켜진다.
+# 꺼져 있으면 @profiled는 함수를 그대로 돌려주고 timer()는 빈 컨텍스트라서 비용이 거의 없다.
+# 켜져 있으면 이름별 호출 수·누적 시간·최근 샘플(p50/p95)을 프로세스 전체와 세션별로 모은다.
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+
+ENABLED = os.environ.get("STUDYBODY_PROFILE", "").lower() in {"1", "true", "yes", "on"}
+SAMPLES = 1024   # 이름별로 백분위 계산에 쓰는 최근 샘플 수
+SESSION_KEY = "_profile"
+
+
+class Stats:
+    """이름 → 호출 수, 누적 시간, 최근 샘플 (여러 스레드가 같이 쓴다)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._items = {}
+
+    def add(self, name: str, seconds: float):
+        with self._lock:
+            item = self._items.get(name)
+            if item is None:
+                item = self._items[name] = [0, 0.0, deque(maxlen=SAMPLES)]
+            item[0] += 1
+            item[1] += seconds
+            item[2].append(seconds)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def summary(self):
+        # [{name, calls, total_ms, mean_ms, p50_ms, p95_ms, max_ms}, ...] — 누적 시간이 큰 순
+        with self._lock:
+            items = [(name, calls, total, sorted(samples)) for name, (calls, total, samples) in self._items.items()]
+        rows = []
+        for name, calls, total, samples in items:
+            rows.append({
+                "name": name,
+                "calls": calls,
+                "total_ms": total * 1e3,
+                "mean_ms": total / calls * 1e3,
+                "p50_ms": _percentile(samples, 50) * 1e3,
+                "p95_ms": _percentile(samples, 95) * 1e3,
+                "max_ms": samples[-1] * 1e3,
+            })
+        rows.sort(key=lambda r: r["total_ms"], reverse=True)
+        return rows
+
+
+def _percentile(ordered, q):
+    # 정렬된 샘플의 nearest-rank 백분위
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))]
+
+
+PROCESS = Stats()
+_session = ContextVar("studybody_profile_session", default=None)
+_run_start = ContextVar("studybody_profile_run_start", default=None)
+
+
+def record(name: str, seconds: float):
+    PROCESS.add(name, seconds)
+    stats = _session.get()
+    if stats is not None:
+        stats.add(name, seconds)
+
+
+@contextmanager
+def _timed(name: str):
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - t0)
+
+
+def timer(name: str):
+    # with timer("이름"): ... — 꺼져 있으면 아무 일도 하지 않는다
+    return _timed(name) if ENABLED else nullcontext()
+
+
+def profiled(name: str = None):
+    # 함수 데코레이터. 이름을 생략하면 "모듈.함수" (studybody. 접두사 제외)
+    def deco(fn):
+        if not ENABLED:
+            return fn
+        label = name or f"{fn.__module__.removeprefix('studybody.')}.{fn.__qualname__}"
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(label, time.perf_counter() - t0)
+        return wrapper
+    return deco
+
+
+def begin_session(session_state):
+    # 스크립트 실행마다 맨 앞에서 호출 — 이 실행의 계측을 해당 세션 통계에도 쌓는다
+    if not ENABLED:
+        return None
+    stats = session_state.get(SESSION_KEY)
+    if stats is None:
+        stats = session_state[SESSION_KEY] = Stats()
+    _session.set(stats)
+    _run_start.set(time.perf_counter())
+    return stats
+
+
+def end_run():
+    # 스크립트 끝에서 호출 — begin_session부터의 전체 실행 시간을 "run"으로 기록
+    t0 = _run_start.get()
+    if t0 is not None:
+        record("run", time.perf_counter() - t0)
+        _run_start.set(None)
+
+
+def export_json(session=None) -> str:
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "pid": os.getpid(),
+        "process": PROCESS.summary(),
+    }
+    if session is not None:
+        report["session"] = session.summary()
+    return json.dumps(report, ensure_ascii=False, indent=2)
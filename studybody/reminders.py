@@ -0,0 +1,193 @@
+# studybody/reminders.py
+# 리듬 알림 엔진 — 세션마다 오늘 남은 알림(물·눈 휴식·스트레칭·카페인 컷오프·골든타임·포모도로)을 계산해
+# 프로세스 전체가 함께 쓰는 계층형 타이머 휠에 넣는다. 예약·취소는 O(1), 시간이 흐를 때는 지나간 칸만 본다.
+# 울린 알림은 세션별 받은편지함으로 옮겨 두므로, 세션은 재실행마다 자기 편지함만 비우면 된다(전체 일정 조회 없음).
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta
+
+TICK = 1.0           # 휠 한 칸(초)
+SLOT_BITS = 6        # 레벨당 64칸 → 64초 / 68분 / 72시간 / 194일
+LEVELS = 4
+INBOX_MAX = 20       # 세션당 쌓아 둘 알림 수 (오래 안 보면 오래된 것부터 버림)
+STALE_SEC = 3600     # 이만큼 편지함을 안 비운 세션은 떠난 것으로 보고 알림을 버린다
+HORIZON_H = 24       # 미리 잡아 두는 범위(시간)
+
+_SLOTS = 1 << SLOT_BITS
+_MASK = _SLOTS - 1
+
+
+class TimerWheel:
+    """계층형 타이머 휠 — 레벨 l의 한 칸은 레벨 l-1 한 바퀴. 시각은 틱(정수) 단위.
+
+    항목은 만기 틱과 현재 틱이 처음으로 같은 칸 범위에 드는 레벨에 넣고,
+    아래 레벨이 한 바퀴 돌 때마다 위 레벨의 한 칸을 아래로 풀어 내린다(cascade).
+    """
+
+    def __init__(self, now: float, tick: float = TICK):
+        self.tick = tick
+        self._now = int(now // tick)
+        self._wheels = [[[] for _ in range(_SLOTS)] for _ in range(LEVELS)]
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def _insert(self, entry):
+        due = max(entry[0], self._now)
+        for level in range(LEVELS):
+            shift = SLOT_BITS * level
+            if (due >> shift) - (self._now >> shift) < _SLOTS:
+                self._wheels[level][(due >> shift) & _MASK].append(entry)
+                return
+        # 맨 위 레벨보다 멀면 맨 위 레벨의 가장 먼 칸에 두고, 풀려 내려올 때 다시 자리를 찾는다
+        shift = SLOT_BITS * (LEVELS - 1)
+        self._wheels[-1][((self._now >> shift) - 1) & _MASK].append(entry)
+
+    def schedule(self, at: float, item):
+        # at(epoch 초)에 item을 울리도록 예약 — 취소용 핸들을 돌려준다
+        entry = [int(-(-at // self.tick)), item, True]
+        self._insert(entry)
+        self._count += 1
+        return entry
+
+    def cancel(self, entry):
+        # 칸에서 빼지 않고 표시만 한다 (풀려 내려오거나 울릴 때 버림)
+        if entry[2]:
+            entry[2] = False
+            self._count -= 1
+
+    def advance(self, now: float):
+        # now까지 만기가 된 항목 [(만기 epoch 초, item), ...] — 지나간 틱 수 + 울린 수에 비례
+        target = int(now // self.tick)
+        fired = []
+        if self._count == 0:
+            self._now = max(self._now, target)
+            return fired
+        while self._now < target:
+            self._now += 1
+            t = self._now
+            level = 1
+            while level < LEVELS and t & ((1 << (SLOT_BITS * level)) - 1) == 0:
+                level += 1
+            for lv in range(level - 1, 0, -1):   # 위 레벨부터 풀어 내린다
+                slot = self._wheels[lv][(t >> (SLOT_BITS * lv)) & _MASK]
+                self._wheels[lv][(t >> (SLOT_BITS * lv)) & _MASK] = []
+                for entry in slot:
+                    if entry[2]:
+                        self._insert(entry)
+            slot = self._wheels[0][t & _MASK]
+            if slot:
+                self._wheels[0][t & _MASK] = []
+                for entry in slot:
+                    if not entry[2]:
+                        continue
+                    if entry[0] > t:   # 범위 밖에서 온 항목
+                        self._insert(entry)
+                        continue
+                    entry[2] = False
+                    self._count -= 1
+                    fired.append((entry[0] * self.tick, entry[1]))
+            if self._count == 0:
+                self._now = target
+        return fired
+
+
+class ReminderEngine:
+    """세션 id → 예약 핸들 목록 / 받은편지함. 휠과 편지함은 하나의 잠금으로 보호한다."""
+
+    def __init__(self, now: float = None):
+        self._lock = threading.Lock()
+        self._wheel = TimerWheel(time.time() if now is None else now)
+        self._handles = {}
+        self._inbox = {}
+        self._seen = {}
+
+    def __len__(self):
+        return len(self._wheel)
+
+    def replace(self, session: str, reminders, now: float):
+        # 세션의 예약을 통째로 바꾼다 — reminders: [(epoch 초, 문구), ...] (이미 지난 것은 건너뜀)
+        with self._lock:
+            for entry in self._handles.pop(session, ()):
+                self._wheel.cancel(entry)
+            self._handles[session] = [self._wheel.schedule(at, (session, text)) for at, text in reminders if at > now]
+            self._seen[session] = now
+
+    def cancel(self, session: str):
+        with self._lock:
+            for entry in self._handles.pop(session, ()):
+                self._wheel.cancel(entry)
+            self._inbox.pop(session, None)
+            self._seen.pop(session, None)
+
+    def _advance(self, now: float):
+        for at, (session, text) in self._wheel.advance(now):
+            if now - self._seen.get(session, 0) > STALE_SEC:   # 떠난 세션 — 남은 예약도 정리
+                for entry in self._handles.pop(session, ()):
+                    self._wheel.cancel(entry)
+                self._inbox.pop(session, None)
+                self._seen.pop(session, None)
+                continue
+            self._inbox.setdefault(session, deque(maxlen=INBOX_MAX)).append((at, text))
+
+    def drain(self, session: str, now: float):
+        # 휠을 now까지 돌리고 이 세션에 온 알림 [(시각, 문구), ...]을 꺼낸다
+        with self._lock:
+            self._advance(now)
+            self._seen[session] = now
+            inbox = self._inbox.pop(session, None)
+        return list(inbox) if inbox else []
+
+    def pending(self, session: str, limit: int = 8):
+        # 이 세션의 다가오는 알림 [(시각, 문구), ...] — 이 세션 예약만 본다
+        with self._lock:
+            live = [(e[0] * self._wheel.tick, e[1][1]) for e in self._handles.get(session, ()) if e[2]]
+        return sorted(live)[:limit]
+
+
+engine = ReminderEngine()
+
+
+def new_session_id() -> str:
+    return uuid.uuid4().hex
+
+
+# -------------------- 알림 계산 --------------------
+def plan_reminders(chronotype: str, wake, sleep_hours: float, pomo=None, now: float = None):
+    # 지금부터 HORIZON_H시간 안의 알림 [(epoch 초, 문구), ...] (시각 순)
+    from .pomodoro import upcoming
+    from .rhythm import energy_curve, suggested_blocks
+
+    now = time.time() if now is None else now
+    today = datetime.fromtimestamp(now).date()
+    blocks = suggested_blocks(*energy_curve(chronotype, wake), n=3)
+    awake = timedelta(hours=24 - sleep_hours)
+    out = []
+    for day in (today - timedelta(days=1), today, today + timedelta(days=1)):
+        up = datetime.combine(day, wake)
+        bed = up + awake
+        out += [(up + timedelta(hours=h), "🧎 스트레칭 60초 — 근육 펌프 → 뇌혈류 ↑")
+                for h in range(1, int(awake.total_seconds() // 3600) + 1)]
+        out.append((bed - timedelta(hours=8), "☕️🚫 카페인 컷오프 — 잠들기 8시간 전이에요"))
+        for start, end, power in blocks:
+            at = datetime.combine(day, start)
+            if at < up:
+                at += timedelta(days=1)
+            if at < bed:
+                out.append((at - timedelta(minutes=10), f"💧 물 1컵 — 10분 뒤 집중 골든타임({start:%H:%M})"))
+                out.append((at, f"⚡ 집중 골든타임 시작 {start:%H:%M}~{end:%H:%M} (예상 집중도 {int(power * 100)}%)"))
+    reminders = [(at.timestamp(), text) for at, text in out]
+    if pomo is not None:
+        for at, ph in upcoming(pomo, now):
+            if ph.name == "완료":
+                text = "🎉 모든 라운드 완료!"
+            elif ph.name == "휴식":
+                text = f"👀 휴식 — 20-20-20: 6m 먼 곳을 20초 보기 (라운드 {ph.round}/{pomo.rounds})"
+            else:
+                text = f"⏰ 집중 시작 — 라운드 {ph.round}/{pomo.rounds}"
+            reminders.append((at, text))
+    horizon = now + HORIZON_H * 3600
+    return sorted((at, text) for at, text in reminders if now < at <= horizon)
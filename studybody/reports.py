@@ -0,0 +1,109 @@
+# studybody/reports.py
+# 리포트 작업자 풀 — 리포트의 무거운 부분(일별 BEI 계산과 추이 그림 생성)을 프로세스 전체가 함께 쓰는
+# 크기 제한 스레드 풀에서 만든다. 페이지는 작업을 맡기고 진행률만 그리므로, 큰 리포트를 여러 명이 동시에
+# 요청해도 각자의 화면이 그림이 다 만들어질 때까지 막혀 있지 않다.
+# 결과는 (종류, 저장소 판 번호, 옵션)으로 보관하므로 데이터가 바뀌기 전까지는 다시 만들지 않는다.
+# 표의 입력은 요약 인덱스(DailyIndex.pivot/series)에서 (날짜, 과목) 칸 수만큼만 읽는다 — 전체 행을 훑지 않는다.
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from .bei import brain_energy_index_batch
+from .profiler import timer
+
+REPORT_WORKERS = max(2, min(4, os.cpu_count() or 1))
+KEEP_REPORTS = 32   # 보관할 리포트 수 (오래 안 쓴 것부터 버림) — 표 + 그림 spec이라 작다
+
+
+class Job:
+    """맡긴 리포트 작업 하나 — 작업자가 progress(0~1)·stage를 갱신하고, 페이지는 읽기만 한다."""
+
+    __slots__ = ("key", "progress", "stage", "future")
+
+    def __init__(self, key):
+        self.key = key
+        self.progress = 0.0
+        self.stage = "대기 중"
+        self.future = None
+
+    def step(self, progress: float, stage: str):
+        self.progress = min(1.0, max(0.0, float(progress)))
+        self.stage = stage
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def failed(self) -> bool:
+        return self.future.done() and self.future.exception() is not None
+
+    def wait(self, timeout: float) -> bool:
+        # timeout초까지 기다려 끝났는지 (작은 리포트는 진행 막대 없이 바로 그리도록)
+        return bool(wait([self.future], timeout=timeout).done)
+
+    def result(self):
+        return self.future.result()
+
+
+class ReportPool:
+    """크기 제한 스레드 풀 + (종류, 판 번호, 옵션) → Job LRU. 여러 세션 스레드가 함께 쓴다.
+
+    프로세스 풀이 아니라 스레드 풀인 이유: 작업 입력과 결과(표·그림 spec)를 프로세스 사이로 직렬화하지 않고,
+    결과를 그대로 세션 스레드에 넘기기 위해서다.
+    """
+
+    def __init__(self, workers: int = REPORT_WORKERS, keep: int = KEEP_REPORTS):
+        self.keep = keep
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report")
+        self._lock = threading.Lock()
+        self._jobs = OrderedDict()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def find(self, kind: str, version, options=()):
+        # 이미 맡긴(진행 중이거나 끝난) 작업 — 실패한 작업은 없는 것으로 본다
+        with self._lock:
+            job = self._jobs.get((kind, version, options))
+            if job is None or job.failed():
+                self.misses += 1
+                return None
+            self._jobs.move_to_end(job.key)
+            self.hits += 1
+            return job
+
+    def submit(self, kind: str, version, build, *args, options=()):
+        # build(job, *args)를 풀에 맡긴다 — 같은 키의 작업이 이미 있으면 그것을 돌려준다
+        key = (kind, version, options)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not job.failed():
+                self._jobs.move_to_end(key)
+                return job
+            job = self._jobs[key] = Job(key)
+            job.future = self._executor.submit(build, job, *args)
+            while len(self._jobs) > self.keep:
+                self._jobs.popitem(last=False)   # 진행 중이던 작업도 계속 돌고, 기다리던 페이지는 그 Job을 쥐고 있다
+        return job
+
+
+pool = ReportPool()
+
+
+# -------------------- 리포트 --------------------
+def summary_report(job: Job, pivot, days, studied, habits: dict, fallback, colors):
+    # (날짜 × 과목 예정 분 표, BEI 추이 그림 또는 None)
+    # pivot·days·studied는 페이지가 DailyIndex에서 꺼내 준 사본이라 작업자가 세션 상태를 건드리지 않는다
+    from .figures import bei_trend_figure
+
+    figure = None
+    if len(days) > 1:
+        job.step(0.2, "일별 Brain Energy Index 계산")
+        sleep_h, water_c, caffeine_c = zip(*(habits.get(d, fallback) for d in days))
+        bei_hist = brain_energy_index_batch(sleep_h, water_c, caffeine_c, studied)
+        job.step(0.5, "추이 그림 만들기")
+        with timer("report.bei_figure"):
+            figure = bei_trend_figure(days, bei_hist, *colors)
+    job.step(1.0, "완료")
+    return pivot, figure
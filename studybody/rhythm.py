@@ -0,0 +1,129 @@
+# studybody/rhythm.py
+# 24시간 에너지 곡선 — 프로세스당 한 번 미리 계산해 두고 뷰(view)로 잘라서 돌려준다
+from datetime import time
+from functools import lru_cache
+from typing import NamedTuple
+
+import numpy as np
+
+from .profiler import profiled
+
+DAY_MIN = 24 * 60
+
+
+class CurveParams(NamedTuple):
+    # 기상 후 몇 시간 뒤에 첫 번째 정점이 오는지 등, 곡선 모양을 정하는 값
+    peak_offset: float = 3.5    # 기상 → 첫 정점(시간)
+    peak_shift: float = 0.0     # 크로노타입 보정(시간)
+    second_gap: float = 7.5     # 첫 정점 → 두 번째 정점(시간)
+    base: float = 0.55
+    amp1: float = 0.3
+    width1: float = 1.6
+    amp2: float = 0.2
+    width2: float = 2.2
+
+
+CHRONOTYPES = {
+    "아침형": CurveParams(peak_shift=-1.0),
+    "일반형": CurveParams(peak_shift=0.0),
+    "저녁형": CurveParams(peak_shift=2.0),
+}
+
+
+def _build_table(params: CurveParams):
+    # 곡선은 '기상 후 경과 시간'만의 함수라서, 경과 시간 -24h~+24h를 1분 간격으로 한 번만 계산하면
+    # 어떤 기상 시각·해상도든 이 배열을 자르기(stride 포함)만 하면 된다.
+    d = (np.arange(2 * DAY_MIN) - DAY_MIN) / 60
+    p1 = params.peak_offset + params.peak_shift
+    p2 = p1 + params.second_gap
+    curve = (
+        params.base
+        + params.amp1 * np.exp(-0.5 * ((d - p1) / params.width1) ** 2)
+        + params.amp2 * np.exp(-0.5 * ((d - p2) / params.width2) ** 2)
+    )
+    curve = np.clip(curve, 0, 1)
+    curve.flags.writeable = False  # 세션끼리 공유하므로 읽기 전용
+    return curve
+
+
+# 기본 크로노타입 3종은 import 시점에 미리 계산 (3 × 2880 float)
+_TABLES = {params: _build_table(params) for params in CHRONOTYPES.values()}
+
+
+@lru_cache(maxsize=64)
+def _custom_table(params: CurveParams):
+    return _build_table(params)
+
+
+def curve_table(params: CurveParams):
+    table = _TABLES.get(params)
+    return table if table is not None else _custom_table(params)
+
+
+@lru_cache(maxsize=None)
+def time_axis(step: int = 30):
+    # 0~24시를 step분 간격으로 (시간 단위)
+    xs = np.arange(0, DAY_MIN, step) / 60
+    xs.flags.writeable = False
+    return xs
+
+
+def wake_minute(wake: time) -> int:
+    return wake.hour * 60 + wake.minute
+
+
+def curve_at(params: CurveParams, wake_min: int, step: int = 30):
+    # 하루치 곡선 (step분 간격) — 미리 계산한 표의 뷰라서 복사·exp 계산이 없다
+    start = DAY_MIN - int(wake_min) % DAY_MIN
+    return curve_table(params)[start:start + DAY_MIN:step]
+
+
+@profiled()
+def energy_curve(chronotype: str, wake: time, step: int = 30):
+    # 24시간 에너지 곡선 (0~1)
+    return time_axis(step), curve_at(CHRONOTYPES[chronotype], wake_minute(wake), step)
+
+
+# -------------------- 집중 블록 선택 --------------------
+def top_windows(curves, window: int, k: int):
+    # 겹치지 않는 길이 window(샘플 수) 구간 중 평균 에너지가 높은 k개를 고른다.
+    # curves: (T,) 또는 (일수, T) — 여러 날을 한 번에 처리. 반환: (시작 인덱스, 평균 점수), 모양 (..., k)
+    # 자리가 모자라면 시작 인덱스 -1, 점수 nan.
+    curves = np.asarray(curves, dtype=float)
+    squeeze = curves.ndim == 1
+    curves = np.atleast_2d(curves)
+    days, t = curves.shape
+    window = max(1, min(int(window), t))
+    csum = np.concatenate([np.zeros((days, 1)), np.cumsum(curves, axis=1)], axis=1)
+    scores = (csum[:, window:] - csum[:, :-window]) / window   # (일수, T-window+1) 구간 평균
+    avail = scores.copy()
+    pos = np.arange(avail.shape[1])
+    rows = np.arange(days)
+    starts = np.full((days, k), -1, dtype=np.int64)
+    best = np.full((days, k), np.nan)
+    for j in range(k):
+        i = np.argmax(avail, axis=1)
+        ok = np.isfinite(avail[rows, i])
+        starts[ok, j] = i[ok]
+        best[ok, j] = scores[ok, i[ok]]
+        # 고른 구간과 겹치는 시작점(i-window+1 ~ i+window-1)은 후보에서 제외
+        blocked = np.abs(pos[None, :] - i[:, None]) < window
+        avail[blocked & ok[:, None]] = -np.inf
+    if squeeze:
+        return starts[0], best[0]
+    return starts, best
+
+
+@profiled()
+def suggested_blocks(xs, curve, n=3, block_min: int = 60):
+    # 상위 n개 집중 블록 (겹치지 않는 block_min분 구간, 시작 시각 순)
+    step = round((xs[1] - xs[0]) * 60) if len(xs) > 1 else DAY_MIN
+    starts, scores = top_windows(curve, max(1, round(block_min / step)), n)
+    slots = []
+    for i, power in sorted(zip(starts.tolist(), scores.tolist())):
+        if i < 0:
+            continue
+        start_min = round(xs[i] * 60)
+        end_min = (start_min + block_min) % DAY_MIN
+        slots.append((time(start_min // 60, start_min % 60), time(end_min // 60, end_min % 60), round(power, 2)))
+    return slots
@@ -0,0 +1,72 @@
+# studybody/schedule.py
+# 에너지 기반 자동 배치 — 날짜별 미완료 계획을 기상~취침 사이 시간대에 넣어 예상 에너지 합을 최대화한다.
+# 긴 계획부터 하나씩, 비어 있는 구간 중 (누적합으로 구한) 에너지 합이 가장 큰 시작 시각에 놓는 탐욕 배치.
+# 놓은 계획 앞뒤로 휴식 칸을 막아 두므로 계획 사이에는 항상 휴식이 들어간다.
+from datetime import datetime, time, timedelta
+
+import numpy as np
+import pandas as pd
+
+from .rhythm import CHRONOTYPES, DAY_MIN, curve_table, wake_minute
+
+STEP = 5   # 배치 단위(분)
+
+
+def awake_energy(chronotype: str, sleep_hours: float, step: int = STEP):
+    # 기상 후 깨어 있는 동안의 step분 칸별 평균 에너지 (기상 시각 기준 경과 시간의 함수라 기상 시각과 무관)
+    awake_min = int((24 - sleep_hours) * 60) // step * step
+    table = curve_table(CHRONOTYPES[chronotype])
+    return table[DAY_MIN:DAY_MIN + awake_min].reshape(-1, step).mean(axis=1)
+
+
+def place(durations, energy, break_slots: int = 0, blocked=None):
+    # durations(칸 수)를 energy 칸 위에 겹치지 않게 배치. 시작 칸 배열 (못 넣으면 -1)
+    t = len(energy)
+    csum = np.concatenate([[0.0], np.cumsum(energy)])
+    taken = np.zeros(t, dtype=np.int32) if blocked is None else np.asarray(blocked, dtype=np.int32).copy()
+    starts = np.full(len(durations), -1, dtype=np.int64)
+    for i in np.argsort(-np.asarray(durations), kind="stable"):   # 긴 계획부터
+        d = int(durations[i])
+        if d <= 0 or d > t:
+            continue
+        used = np.concatenate([[0], np.cumsum(taken)])
+        free = (used[d:] - used[:-d]) == 0                 # [s, s+d)가 모두 비어 있는 시작 칸
+        if not free.any():
+            continue
+        score = np.where(free, csum[d:] - csum[:-d], -np.inf)
+        s = int(np.argmax(score))                           # 동점이면 이른 시각
+        starts[i] = s
+        taken[max(0, s - break_slots):s + d + break_slots] = 1
+    return starts
+
+
+def auto_schedule(tasks: pd.DataFrame, chronotype: str, wake: time, sleep_hours: float,
+                  break_min: int = 10, step: int = STEP) -> pd.DataFrame:
+    # tasks: 저장소 뷰(행 id 인덱스, 과목·주제·예정(분)·완료·날짜). 미완료·날짜 있는 계획만 배치한다.
+    # 반환: id 인덱스, 날짜·과목·주제·예정(분)·시작·종료·에너지 (못 넣은 계획은 시작/종료 NaT)
+    todo = tasks[~tasks["완료"].astype(bool) & tasks["날짜"].notna()]
+    energy = awake_energy(chronotype, sleep_hours, step)
+    wake_offset = timedelta(minutes=wake_minute(wake))
+    brk = -(-int(break_min) // step)
+    slots = -(-todo["예정(분)"].to_numpy(dtype=np.int64) // step)        # 올림
+    start_at = np.full(len(todo), np.datetime64("NaT"), dtype="datetime64[ns]")
+    power = np.full(len(todo), np.nan)
+    days = todo["날짜"].dt.normalize().to_numpy()
+    csum = np.concatenate([[0.0], np.cumsum(energy)])
+    for day in np.unique(days):
+        idx = np.flatnonzero(days == day)
+        starts = place(slots[idx], energy, brk)
+        ok = starts >= 0
+        base = day + np.timedelta64(wake_offset)
+        start_at[idx[ok]] = base + (starts[ok] * step).astype("timedelta64[m]")
+        power[idx[ok]] = (csum[starts[ok] + slots[idx[ok]]] - csum[starts[ok]]) / slots[idx[ok]]
+    out = todo[["날짜", "과목", "주제", "예정(분)"]].copy()
+    out["시작"] = start_at
+    out["종료"] = out["시작"] + pd.to_timedelta(out["예정(분)"], unit="m")
+    out["에너지"] = np.round(power, 2)
+    return out.sort_values(["날짜", "시작"], na_position="last")
+
+
+def week_range(today=None, days: int = 7):
+    today = today or datetime.today().date()
+    return today, today + timedelta(days=days - 1)
@@ -0,0 +1,100 @@
+# studybody/srs.py
+# 플래시카드 간격 반복(SM-2) — 카드 상태는 타입 배열(array.array: 쉬움 정도·간격·반복 수·복습일)에,
+# 복습할 카드 목록은 (복습일, 행) 힙에 둔다. 복습 결과가 들어오면 새 항목만 힙에 넣고
+# 예전 항목은 꺼낼 때 버린다(lazy 삭제) — 카드 n장일 때 한 장당 O(log n).
+import heapq
+from array import array
+from datetime import date
+
+EASE_START = 2.5
+EASE_MIN = 1.3
+GRADES = {"다시": 1, "어려움": 3, "보통": 4, "쉬움": 5}   # SM-2 점수 (0~5, 3 미만이면 처음부터)
+
+
+def day_number(day: date) -> int:
+    return day.toordinal()
+
+
+class Deck:
+    """카드 키(문자열) → 행 번호, 행별 SM-2 상태 배열, 복습일 힙."""
+
+    def __init__(self):
+        # 카드당 4 + 4 + 2 + 4바이트 (NumPy 없이 — 가벼운 시너지 페이지에서 쓴다)
+        self._rows = {}              # 키 → 행
+        self._keys = []              # 행 → 키
+        self.ease = array("f")
+        self.interval = array("i")   # 일
+        self.reps = array("h")       # 연속 정답 수
+        self.due_day = array("i")    # 다음 복습일 (date.toordinal)
+        self._heap = []
+        self.source = None     # 마지막으로 맞춘 카드 목록 (sync 생략 판단용)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def key(self, row: int) -> str:
+        return self._keys[row]
+
+    def add(self, key: str, today: int) -> int:
+        # 새 카드는 오늘부터 복습 대상. 이미 있으면 그 행
+        row = self._rows.get(key)
+        if row is not None:
+            return row
+        row = len(self._keys)
+        self._rows[key] = row
+        self._keys.append(key)
+        self.ease.append(EASE_START)
+        self.interval.append(0)
+        self.reps.append(0)
+        self.due_day.append(today)
+        heapq.heappush(self._heap, (today, row))
+        return row
+
+    def sync(self, keys, today: int, source=None):
+        # 카드 목록(콘텐츠 카탈로그 등)에 새로 생긴 카드만 추가 — 같은 source면 건너뛴다
+        if source is not None and source is self.source:
+            return
+        for key in keys:
+            self.add(key, today)
+        self.source = source
+
+    def review(self, row: int, grade: int, today: int):
+        # SM-2 갱신 후 다음 복습일을 힙에 넣는다
+        if grade < 3:   # 틀리면 간격·반복 수만 처음부터 (쉬움 정도는 그대로)
+            self.reps[row] = 0
+            self.interval[row] = 1
+        else:
+            reps = self.reps[row]
+            self.interval[row] = 1 if reps == 0 else 6 if reps == 1 else max(1, round(self.interval[row] * self.ease[row]))
+            self.reps[row] = reps + 1
+            self.ease[row] = max(EASE_MIN, self.ease[row] + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+        self.due_day[row] = today + self.interval[row]
+        heapq.heappush(self._heap, (self.due_day[row], row))
+        if len(self._heap) > 2 * len(self._keys) + 64:
+            self._compact()
+
+    def _compact(self):
+        # 예전(버려질) 항목이 쌓이면 현재 복습일로 힙을 다시 만든다 — O(n), 드물게
+        self._heap = list(zip(self.due_day, range(len(self._keys))))
+        heapq.heapify(self._heap)
+
+    def due(self, n: int, today: int):
+        # 오늘까지 복습할 카드 최대 n장의 행 번호 (복습일이 이른 순) — 힙에서 꺼냈다가 다시 넣는다
+        picked, seen = [], set()
+        heap = self._heap
+        while heap and len(picked) < n and heap[0][0] <= today:
+            day, row = heapq.heappop(heap)
+            if day != self.due_day[row] or row in seen:
+                continue   # 복습 결과가 나중에 들어와 무효가 된 항목
+            seen.add(row)
+            picked.append(row)
+        for row in picked:
+            heapq.heappush(heap, (self.due_day[row], row))
+        return picked
+
+    def next_due(self):
+        # 가장 이른 복습일 (카드가 없으면 None)
+        heap = self._heap
+        while heap and heap[0][0] != self.due_day[heap[0][1]]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
@@ -0,0 +1,430 @@
+# studybody/store.py
+# 학습 플래너 작업 저장소 — 청크 단위 추가 버퍼 + 필요할 때만 만드는 DataFrame 뷰
+import itertools
+import threading
+from bisect import bisect_right
+
+import numpy as np
+import pandas as pd
+
+from .aggregates import DailyIndex
+from .events import row_tuples
+
+COLUMNS = ["과목", "주제", "예정(분)", "완료", "날짜"]
+SUBJECTS = ["화학", "생명과학", "약학", "수학", "영어", "기타"]
+
+# 내부 필드 → dtype (과목은 카테고리 코드로 저장)
+_FIELDS = {
+    "id": np.int64,
+    "subject": np.int16,
+    "topic": object,
+    "minutes": np.int16,
+    "done": np.bool_,
+    "date": "datetime64[D]",
+    "alive": np.bool_,  # False = 삭제된 칸 (삭제를 O(1)로 하기 위한 표시)
+}
+_MINUTES_MAX = np.iinfo(np.int16).max
+
+# 행 id는 프로세스 전체에서 유일 (여러 세션이 같은 영구 저장소에 써도 겹치지 않게)
+_id_lock = threading.Lock()
+_next_id = 1
+
+
+def _reserve_ids(n: int):
+    global _next_id
+    with _id_lock:
+        start = _next_id
+        _next_id += n
+    return np.arange(start, start + n, dtype=np.int64)
+
+
+def seed_ids(start: int):
+    # 저장소에 이미 있는 id 다음부터 발급하도록 올려둔다
+    global _next_id
+    with _id_lock:
+        _next_id = max(_next_id, int(start))
+
+
+# 저장소 번호(TaskStore.uid) — 프로세스 안에서 유일
+_store_ids = itertools.count(1)
+
+
+class TaskStore:
+    """고정 크기 청크에 행을 채워 넣는 작업 테이블.
+
+    추가는 청크 안의 빈 칸에 값을 쓰는 것뿐이라 테이블 크기와 무관하게 O(1)이고,
+    DataFrame은 frame()을 호출할 때 한 번 만들어 변경 전까지 재사용한다.
+    """
+
+    def __init__(self, chunk_size: int = 4096):
+        self.chunk_size = int(chunk_size)
+        self._chunks = {f: [] for f in _FIELDS}
+        self._n = 0      # 사용한 칸 수 (삭제된 칸 포함)
+        self._live = 0   # 살아 있는 행 수
+        self._categories = list(SUBJECTS)
+        self._codes = {s: i for i, s in enumerate(self._categories)}
+        self._frame = None
+        # (저장소 번호, 판 번호)는 내용이 같은 동안만 같다 — 리포트 같은 파생 결과의 캐시 키 (내용 해시 대신 O(1))
+        self.uid = next(_store_ids)
+        self.version = 0
+        # (날짜, 과목)별 요약 — 쓰기 연산마다 바뀐 행만큼 갱신
+        self.daily = DailyIndex()
+        # 영구 저장소로 아직 내보내지 않은 변경분 (행 id 기준)
+        self._upserts = set()
+        self._deletes = set()
+        self._created = set()   # 이 세션에서 생겨서 아직 영구 저장소에 없는 행 (그 밖의 행은 있는 행만 고친다)
+        # 변경 기록(events.EventLog) — 붙어 있을 때만 쓰기 연산마다 (이전 행, 이후 행)을 남긴다
+        self.events = None
+
+    # -------------------- 기본 정보 --------------------
+    def __len__(self):
+        return self._live
+
+    @property
+    def empty(self) -> bool:
+        return self._live == 0
+
+    @property
+    def categories(self):
+        return list(self._categories)
+
+    # -------------------- 내부 도우미 --------------------
+    def _dirty(self):
+        # 쓰기마다: 만들어 둔 DataFrame 뷰를 버리고 판 번호를 올린다
+        self._frame = None
+        self.version += 1
+
+    def _alloc_chunk(self):
+        for f, dtype in _FIELDS.items():
+            self._chunks[f].append(np.empty(self.chunk_size, dtype=dtype))
+
+    def _subject_code(self, subject) -> int:
+        if subject is None or (isinstance(subject, float) and np.isnan(subject)):
+            subject = "기타"
+        code = self._codes.get(subject)
+        if code is None:
+            code = len(self._categories)
+            self._categories.append(subject)
+            self._codes[subject] = code
+        return code
+
+    def _gather(self, field: str):
+        chunks = self._chunks[field]
+        if not chunks:
+            return np.empty(0, dtype=_FIELDS[field])
+        return np.concatenate(chunks)[: self._n]
+
+    def _chunk_len(self, c: int) -> int:
+        return min(self.chunk_size, self._n - c * self.chunk_size)
+
+    def _slots(self, row_ids):
+        # 행 id → 칸 위치 (삭제 표시된 칸 포함, 칸이 없으면 -1). id는 칸 순서대로 오름차순이라 청크 이분 탐색으로 O(log n)
+        firsts = [chunk[0] for chunk in self._chunks["id"]]
+        out = np.full(len(row_ids), -1, dtype=np.int64)
+        for k, rid in enumerate(row_ids):
+            c = bisect_right(firsts, rid) - 1
+            if c >= 0:
+                ids = self._chunks["id"][c][: self._chunk_len(c)]
+                o = int(np.searchsorted(ids, rid))
+                if o < len(ids) and ids[o] == rid:
+                    out[k] = c * self.chunk_size + o
+        return out
+
+    def _is_alive(self, positions):
+        return np.array([p >= 0 and bool(self._chunks["alive"][p // self.chunk_size][p % self.chunk_size])
+                         for p in positions], dtype=bool)
+
+    def _locate(self, row_ids):
+        # 살아 있는 행 id → 칸 위치 (없거나 삭제된 행이면 KeyError)
+        out = self._slots(row_ids)
+        alive = self._is_alive(out)
+        if not alive.all():
+            raise KeyError(row_ids[int(np.argmin(alive))])
+        return out
+
+    def _log(self, before=None, after=None, label: str = "편집"):
+        if self.events is None:
+            return
+        old, new = row_tuples(before), row_tuples(after)
+        self.events.record([(rid, old.get(rid), new.get(rid)) for rid in {**old, **new}], label)
+
+    def _rows_at(self, positions) -> pd.DataFrame:
+        # 칸 위치 목록 → DataFrame (인덱스 = 행 id)
+        c, o = np.divmod(np.asarray(positions, dtype=np.int64), self.chunk_size)
+        pick = {f: np.array([self._chunks[f][ci][oi] for ci, oi in zip(c, o)], dtype=dtype)
+                for f, dtype in _FIELDS.items()}
+        return self._make_frame(pick)
+
+    def _make_frame(self, fields) -> pd.DataFrame:
+        # 내부 필드 배열 → 한글 열 DataFrame (인덱스 = 행 id)
+        return pd.DataFrame(index=pd.Index(fields["id"], name="id"), data={
+            "과목": pd.Categorical.from_codes(fields["subject"], categories=self._categories),
+            "주제": fields["topic"],
+            "예정(분)": fields["minutes"],
+            "완료": fields["done"],
+            "날짜": fields["date"].astype("datetime64[ns]"),
+        })
+
+    def _coerce(self, df: pd.DataFrame):
+        # 외부 DataFrame(편집기 결과, 가져오기 등)을 내부 배열 형식으로 맞춘다
+        subj = df["과목"].astype(object).where(df["과목"].notna(), "기타")
+        for s in pd.unique(subj.to_numpy()):
+            self._subject_code(s)
+        codes = pd.Categorical(subj, categories=self._categories).codes.astype(np.int16)
+        topics = df["주제"].fillna("").astype(str).to_numpy(dtype=object)
+        minutes = (
+            pd.to_numeric(df["예정(분)"], errors="coerce")
+            .fillna(0)
+            .clip(0, _MINUTES_MAX)
+            .to_numpy()
+            .astype(np.int16)
+        )
+        done = df["완료"].eq(True).to_numpy(dtype=bool)
+        dates = pd.to_datetime(df["날짜"], errors="coerce").to_numpy().astype("datetime64[D]")
+        return {"subject": codes, "topic": topics, "minutes": minutes, "done": done, "date": dates}
+
+    # -------------------- 쓰기 --------------------
+    def append(self, subject: str, topic: str, minutes: int, done: bool = False, date=None) -> int:
+        c, o = divmod(self._n, self.chunk_size)
+        if c == len(self._chunks["subject"]):
+            self._alloc_chunk()
+        row_id = int(_reserve_ids(1)[0])
+        code = self._subject_code(subject)
+        minutes = min(max(int(minutes), 0), _MINUTES_MAX)
+        day = np.datetime64(date, "D") if date is not None else np.datetime64("NaT")
+        self._chunks["id"][c][o] = row_id
+        self._chunks["subject"][c][o] = code
+        self._chunks["topic"][c][o] = topic
+        self._chunks["minutes"][c][o] = minutes
+        self._chunks["done"][c][o] = bool(done)
+        self._chunks["date"][c][o] = day
+        self._chunks["alive"][c][o] = True
+        self._n += 1
+        self._live += 1
+        self._dirty()
+        self._upserts.add(row_id)
+        self._created.add(row_id)
+        self.daily.add(day, self._categories[code], minutes, done)
+        if self.events is not None:
+            row = (self._categories[code], topic, minutes, bool(done), pd.Timestamp(day))
+            self.events.record([(row_id, None, row)], "추가")
+        return row_id
+
+    def _fill(self, cols):
+        cols["alive"] = np.ones(len(cols["id"]), dtype=bool)
+        pos, total = 0, len(cols["id"])
+        while pos < total:
+            c, o = divmod(self._n, self.chunk_size)
+            if c == len(self._chunks["subject"]):
+                self._alloc_chunk()
+            take = min(self.chunk_size - o, total - pos)
+            for f, values in cols.items():
+                self._chunks[f][c][o:o + take] = values[pos:pos + take]
+            pos += take
+            self._n += take
+        self._live += total
+        self._dirty()
+
+    def _index_rows(self, rows: pd.DataFrame, sign: int):
+        self.daily.add_rows(
+            rows["날짜"].to_numpy(), rows["과목"].astype(object), rows["예정(분)"], rows["완료"], sign
+        )
+
+    def extend(self, df: pd.DataFrame, ids=None, track: bool = True):
+        # 여러 행을 청크 단위로 한꺼번에 채운다.
+        # ids: 저장소에서 읽어온 행처럼 이미 id가 있으면 넘긴다 / track=False면 변경분으로 기록하지 않음
+        if df is None or len(df) == 0:
+            return
+        cols = self._coerce(df)
+        cols["id"] = _reserve_ids(len(df)) if ids is None else np.asarray(ids, dtype=np.int64)
+        self._fill(cols)
+        names = np.asarray(self._categories, dtype=object)[cols["subject"]]
+        self.daily.add_rows(cols["date"], names, cols["minutes"], cols["done"])
+        if track:
+            self._upserts.update(cols["id"].tolist())
+            self._created.update(cols["id"].tolist())
+            if self.events is not None:
+                self._log(after=self._make_frame(cols), label="추가")
+
+    def merge_loaded(self, df: pd.DataFrame):
+        # 저장소에서 나중에 더 읽어 온 행(예: 더 오래된 기간)을 끼워 넣는다 — 변경분·반 집계·되돌리기 대상이 아니다.
+        # 칸의 id 오름차순(_slots)을 지키려고 살아 있는 행과 합쳐 다시 채운다 (기간을 넓힐 때 한 번, O(n))
+        if df is None or len(df) == 0:
+            return
+        df = df[~df.index.isin(self._gather("id"))]   # 이 세션이 이미 들고 있는 행(삭제 표시 포함)은 세션 쪽이 최신
+        if len(df) == 0:
+            return
+        cols = self._coerce(df)
+        cols["id"] = df.index.to_numpy(dtype=np.int64)
+        alive = self._gather("alive")
+        merged = {f: np.concatenate([self._gather(f)[alive], cols[f]]) for f in cols}
+        order = np.argsort(merged["id"], kind="stable")
+        self._chunks = {f: [] for f in _FIELDS}
+        self._n = self._live = 0
+        self._fill({f: v[order] for f, v in merged.items()})
+        listener, self.daily.listener = self.daily.listener, None
+        try:
+            self.daily.add_rows(cols["date"], np.asarray(self._categories, dtype=object)[cols["subject"]],
+                                cols["minutes"], cols["done"])
+        finally:
+            self.daily.listener = listener
+        if self.events is not None:
+            self.events.include(self._make_frame(cols))
+
+    def replace(self, df: pd.DataFrame, keep_ids: bool = False):
+        # 편집기에서 돌아온 전체 테이블로 교체.
+        # 인덱스(행 id)로 기존 행과 맞춰 보고, 실제로 바뀐 행만 변경분·요약 인덱스에 반영한다.
+        # keep_ids=True면 모르는 id도 그대로 쓴다 (기록 복원용 — id 오름차순으로 넘길 것)
+        old = self.frame()
+        labels = pd.Index(df.index)
+        known = labels.isin(old.index) & ~labels.duplicated()
+        cols = self._coerce(df)
+        ids = np.empty(len(df), dtype=np.int64)
+        ids[known] = labels[known].to_numpy(dtype=np.int64)
+        ids[~known] = labels[~known].to_numpy(dtype=np.int64) if keep_ids else _reserve_ids(int((~known).sum()))
+        cols["id"] = ids
+
+        self._chunks = {f: [] for f in _FIELDS}
+        self._n = self._live = 0
+        self._fill(cols)
+
+        new = self.frame()
+        kept = new.index[known]
+        a = old.loc[kept].astype({"과목": object})
+        b = new.loc[kept].astype({"과목": object})
+        changed = kept[(~((a == b) | (a.isna() & b.isna())).all(axis=1)).to_numpy()]
+        added = pd.Index(ids[~known])
+        gone = old.index.difference(kept)
+
+        before, after = old.loc[changed.append(gone)], new.loc[changed.append(added)]
+        self._index_rows(before, -1)
+        self._index_rows(after, +1)
+        self._log(before, after)
+        self._upserts.update(changed.tolist())
+        self._upserts.update(added.tolist())
+        self._created.update(added.tolist())
+        self._upserts.difference_update(gone.tolist())
+        self._deletes.update(gone.tolist())
+
+    def update_rows(self, changes: dict):
+        # {행 id: {열 이름: 새 값}} — 편집기의 셀 단위 변경을 해당 행에만 반영
+        if not changes:
+            return
+        ids = list(changes)
+        pos = self._locate(ids)
+        before = self._rows_at(pos)
+        patched = before.astype(object)
+        for rid, values in changes.items():
+            for col, value in values.items():
+                if col in COLUMNS:
+                    patched.at[rid, col] = value
+        cols = self._coerce(patched)
+        c, o = np.divmod(pos, self.chunk_size)
+        for f, values in cols.items():
+            for ci, oi, v in zip(c, o, values):
+                self._chunks[f][ci][oi] = v
+        self._dirty()
+        after = self._rows_at(pos)
+        self._index_rows(before, -1)
+        self._index_rows(after, +1)
+        self._upserts.update(ids)
+        self._log(before, after)
+
+    def delete_rows(self, row_ids):
+        # 칸은 그대로 두고 삭제 표시만 한다 (frame()/window()에서 빠짐)
+        row_ids = [int(i) for i in row_ids]
+        if not row_ids:
+            return
+        pos = self._locate(row_ids)
+        before = self._rows_at(pos)
+        self._index_rows(before, -1)
+        c, o = np.divmod(pos, self.chunk_size)
+        for ci, oi in zip(c, o):
+            self._chunks["alive"][ci][oi] = False
+        self._live -= len(row_ids)
+        self._dirty()
+        self._upserts.difference_update(row_ids)
+        self._created.difference_update(row_ids)
+        self._deletes.update(row_ids)
+        self._log(before, label="삭제")
+
+    def restore(self, rows: dict):
+        # {행 id: 행 튜플 또는 None} 상태로 되돌린다 (이벤트 로그의 되돌리기/다시 실행·시점 복원).
+        # 살아 있는 행은 수정, None은 삭제, 삭제 표시만 된 행은 그 칸을 되살린다.
+        ids = list(rows)
+        pos = self._slots(ids)
+        alive = self._is_alive(pos)
+        lost = [rid for rid, p in zip(ids, pos) if p < 0 and rows[rid] is not None]
+        if lost:
+            # 전체 교체·비우기로 칸까지 없어진 행이 있으면 테이블을 통째로 맞춘다 (O(n), 드물게)
+            frame = self.frame().astype({"과목": object})
+            frame = frame.drop(index=frame.index.intersection(ids))
+            back = pd.DataFrame.from_dict({r: v for r, v in rows.items() if v is not None}, orient="index", columns=COLUMNS)
+            self.replace(pd.concat([frame, back]).sort_index(), keep_ids=True)
+            return
+        self.update_rows({rid: dict(zip(COLUMNS, rows[rid])) for rid, ok in zip(ids, alive) if ok and rows[rid] is not None})
+        self.delete_rows([rid for rid, ok in zip(ids, alive) if ok and rows[rid] is None])
+        revive = [(rid, p) for rid, p, ok in zip(ids, pos, alive) if not ok and p >= 0 and rows[rid] is not None]
+        if revive:
+            rids, where = zip(*revive)
+            cols = self._coerce(pd.DataFrame([rows[r] for r in rids], columns=COLUMNS))
+            c, o = np.divmod(np.asarray(where), self.chunk_size)
+            for f, values in cols.items():
+                for ci, oi, v in zip(c, o, values):
+                    self._chunks[f][ci][oi] = v
+            for ci, oi in zip(c, o):
+                self._chunks["alive"][ci][oi] = True
+            self._live += len(rids)
+            self._dirty()
+            after = self._rows_at(where)
+            self._index_rows(after, +1)
+            self._upserts.update(rids)
+            self._created.update(rids)   # 다른 곳에서 이미 지워졌을 수 있으니 다시 넣는다
+            self._deletes.difference_update(rids)
+            self._log(after=after)
+
+    def drain_changes(self):
+        # (추가·수정된 행 DataFrame, 삭제된 id 목록, 그중 새로 생긴 행 id 집합)을 돌려주고 변경분을 비운다
+        # 바뀐 id만 칸에서 꺼낸다 — 전체 frame()을 다시 만들지 않도록 (O(변경 수 · log n))
+        pos = self._slots(sorted(self._upserts))
+        ups = self._rows_at(pos[self._is_alive(pos)])
+        dels = sorted(self._deletes)
+        created = self._created.intersection(ups.index.tolist())
+        self._upserts, self._deletes, self._created = set(), set(), set()
+        return ups, dels, created
+
+    # -------------------- 읽기 --------------------
+    def frame(self) -> pd.DataFrame:
+        # 읽기 전용 뷰: 변경이 없으면 같은 객체를 돌려준다 (수정하려면 .copy())
+        if self._frame is None:
+            alive = self._gather("alive")
+            self._frame = self._make_frame({f: self._gather(f)[alive] for f in _FIELDS})
+        return self._frame
+
+    def iter_frames(self):
+        # 저장 청크 하나씩 DataFrame으로 (내보내기처럼 전체 사본 없이 훑을 때)
+        for c in range(len(self._chunks["id"])):
+            n = self._chunk_len(c)
+            alive = self._chunks["alive"][c][:n]
+            if alive.any():
+                yield self._make_frame({f: self._chunks[f][c][:n][alive] for f in _FIELDS})
+
+    def window(self, start=None, end=None, subjects=None, offset: int = 0, limit: int = 200):
+        # 조건에 맞는 행 중 [offset, offset+limit) 구간만 DataFrame으로. (구간, 전체 일치 수)를 돌려준다.
+        # 전체 DataFrame을 만들지 않고 청크별로 마스크만 계산한다.
+        start = np.datetime64(start, "D") if start is not None else None
+        end = np.datetime64(end, "D") if end is not None else None
+        codes = [self._codes[s] for s in subjects if s in self._codes] if subjects else None
+        matches = []
+        for c in range(len(self._chunks["id"])):
+            n = self._chunk_len(c)
+            mask = self._chunks["alive"][c][:n].copy()
+            if start is not None:
+                mask &= self._chunks["date"][c][:n] >= start
+            if end is not None:
+                mask &= self._chunks["date"][c][:n] <= end
+            if codes is not None:
+                mask &= np.isin(self._chunks["subject"][c][:n], codes)
+            matches.append(np.flatnonzero(mask) + c * self.chunk_size)
+        matches = np.concatenate(matches) if matches else np.empty(0, dtype=np.int64)
+        return self._rows_at(matches[offset:offset + limit]), len(matches)
@@ -0,0 +1,141 @@
+# studybody/templates.py
+# HTML 조각 템플릿 — 모듈을 읽을 때 한 번 컴파일(공백 정리 + 자리 표시자 분해)하고,
+# 같은 입력으로 다시 그리면 만들어 둔 문자열을 그대로 돌려준다 (캐시 키는 lru_cache가 인자 그대로 만든다 —
+# 적중하면 이스케이프·서식·키 변환 없이 사전 조회 한 번).
+# 여러 조각은 render_many로 이어 붙여 st.markdown 한 번에 보낸다 (요소 수·전송량 감소).
+import html
+import re
+from functools import lru_cache
+from string import Formatter
+
+_BLANK = re.compile(r"\s+")
+_BETWEEN_TAGS = re.compile(r">\s+<")
+_CSS_PUNCT = re.compile(r"\s*([{};:,])\s*")
+
+
+def minify(source: str, css: bool = False) -> str:
+    # 줄바꿈·들여쓰기 제거 (markdown이 들여쓴 줄을 코드 블록으로 읽지 않도록 한 줄로)
+    text = _BLANK.sub(" ", _BETWEEN_TAGS.sub("><", source)).strip()
+    return _CSS_PUNCT.sub(r"\1", text) if css else text
+
+
+class Template:
+    """str.format 문법의 HTML 조각. 문자열 값은 HTML 이스케이프, 서식 지정자({x:.0f})는 그대로 적용."""
+
+    __slots__ = ("name", "fields", "_parts")   # fields: 자리 표시자 이름 (처음 나온 순서, 중복 없음)
+
+    def __init__(self, name: str, source: str, css: bool = False):
+        self.name = name
+        self._parts = [(literal, field, spec) for literal, field, spec, _ in Formatter().parse(minify(source, css))]
+        self.fields = tuple(dict.fromkeys(f for _, f, _ in self._parts if f))
+
+    def render(self, values: dict) -> str:
+        out = []
+        for literal, field, spec in self._parts:
+            out.append(literal)
+            if field:
+                v = values[field]
+                out.append(format(v, spec) if spec else html.escape(v) if isinstance(v, str) else str(v))
+        return "".join(out)
+
+
+TEMPLATES = {t.name: t for t in (
+    Template("stylesheet", """
+        <style>
+        @keyframes float {{
+          0% {{ transform: translateY(0px); }}
+          50% {{ transform: translateY(-6px); }}
+          100% {{ transform: translateY(0px); }}
+        }}
+        .app-bg {{ background: linear-gradient(180deg,{bg}, #fff); }}
+        .card {{
+          background:{card_bg};
+          border:1px solid rgba(0,0,0,0.06);
+          border-radius:20px;
+          padding:18px 18px;
+          box-shadow:0 6px 20px rgba(0,0,0,0.05);
+        }}
+        .card-row {{ display:flex; gap:16px; flex-wrap:wrap; }}
+        .card-row > .card {{ flex:1 1 0; min-width:160px; }}
+        .chip {{
+          display:inline-block;
+          padding:4px 10px;
+          border-radius:999px;
+          background:rgba(124,58,237,0.08);
+          color:{primary};
+          font-weight:600;
+          font-size:12px;
+          border:1px solid rgba(124,58,237,0.2);
+        }}
+        .character {{
+          border-radius:22px;
+          padding:14px 16px;
+          margin-bottom:12px;
+          background:linear-gradient(135deg, rgba(124,58,237,0.09), rgba(34,197,94,0.10));
+          border:1px solid rgba(0,0,0,0.06);
+          box-shadow:0 8px 20px rgba(124,58,237,0.12);
+          animation: float 5s ease-in-out infinite;
+        }}
+        .speech {{
+          background:white;
+          border-radius:16px;
+          padding:10px 12px;
+          border:1px solid rgba(0,0,0,0.06);
+          display:inline-block;
+          box-shadow:0 4px 14px rgba(0,0,0,0.05);
+        }}
+        .title {{ font-size:28px; font-weight:800; letter-spacing:-0.4px; }}
+        .subtitle {{ color:{muted}; font-size:14px; }}
+        .progress-label {{ font-weight:700; color:#0f172a; }}
+        </style>
+    """, css=True),
+    Template("character", """
+        <div class="character">
+          <div style="display:flex;gap:12px;align-items:center;">
+            <div style="font-size:36px">{emoji}</div>
+            <div>
+              <div style="font-weight:800;color:{color};font-size:16px;">{name}</div>
+              <div class="subtitle">{tag}</div>
+              <div class="speech" style="margin-top:8px;">{msg}</div>
+            </div>
+          </div>
+        </div>
+    """),
+    Template("progress", """
+        <div class="card">
+            <div class="progress-label">{label}</div>
+            <div style="height:10px;background:#e5e7eb;border-radius:999px;overflow:hidden;margin-top:8px;">
+                <div style="width:{pct:.1f}%;height:100%;background:{color};"></div>
+            </div>
+            <div class="subtitle" style="margin-top:6px;">{caption}</div>
+        </div>
+    """),
+    Template("golden", """
+        <div class="card">
+            <div style="font-size:22px;">⚡ {start} ~ {end}</div>
+            <div class="subtitle">예상 집중도 {power}%</div>
+        </div>
+    """),
+    Template("job", """
+        <div style="background-color:#F9F7FE; padding:15px; border-radius:15px; margin:10px 0;
+                    box-shadow: 2px 2px 8px rgba(0,0,0,0.1);">
+            <h4 style="margin:0;">{name}</h4>
+            <span style="color:gray; font-size:14px;">{category} · 적합도 {fit}%</span>
+        </div>
+    """),
+)}
+
+
+@lru_cache(maxsize=4096)
+def render(template: str, /, **values) -> str:
+    # 템플릿 하나 — 같은 (템플릿, 값)이면 캐시된 문자열 (값은 해시 가능해야 한다)
+    return TEMPLATES[template].render(values)
+
+
+@lru_cache(maxsize=1024)
+def render_many(template: str, rows: tuple, wrap: str = None) -> str:
+    # 여러 조각을 이어 붙인 문자열 — rows는 값 튜플의 튜플 (템플릿 fields 순서), 묶음째로 캐시
+    # wrap="card-row"면 가로로 늘어놓는 div로 감싼다
+    t = TEMPLATES[template]
+    body = "".join(render(template, **dict(zip(t.fields, row))) for row in rows)
+    return f'<div class="{wrap}">{body}</div>' if wrap else body
@@ -0,0 +1,154 @@
+# studybody/transfer.py
+# 플래너 내보내기(CSV / Parquet / Arrow IPC)와 가져오기(CSV / Parquet)
+# 내보내기는 다운로드를 누를 때만 만들고, 저장 청크 단위로 흘려보낸다.
+# 가져오기는 파일을 청크 단위로 읽으면서 행마다 형식을 검사한다.
+import io
+
+import numpy as np
+import pandas as pd
+
+from .store import COLUMNS
+
+EXPORT_FORMATS = {
+    # 이름: (확장자, MIME, pyarrow 필요 여부)
+    "CSV": ("csv", "text/csv", False),
+    "Parquet": ("parquet", "application/vnd.apache.parquet", True),
+    "Arrow IPC": ("arrow", "application/vnd.apache.arrow.file", True),
+}
+IMPORT_CHUNK_ROWS = 10_000
+_MINUTES_MAX = np.iinfo(np.int16).max
+_TRUE = {"true", "1", "y", "yes", "o", "예", "완료"}
+_FALSE = {"false", "0", "n", "no", "x", "아니오", ""}
+
+
+class IterStream(io.RawIOBase):
+    """bytes 조각을 내는 이터레이터를 읽기 전용 파일 객체로 감싼다."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buf = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buf:
+            try:
+                self._buf = next(self._chunks)
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]
+        self._buf = self._buf[n:]
+        return n
+
+
+# -------------------- 내보내기 --------------------
+def _export_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # 파일에는 id 대신 원래 열만, 과목은 문자열로
+    return df.reset_index(drop=True).astype({"과목": str})
+
+
+def iter_csv(store):
+    yield "﻿".encode("utf-8")  # 엑셀 한글 깨짐 방지 (utf-8-sig)
+    yield (",".join(COLUMNS) + "\n").encode("utf-8")
+    for df in store.iter_frames():
+        out = _export_frame(df)
+        out["날짜"] = out["날짜"].dt.strftime("%Y-%m-%d")
+        yield out.to_csv(index=False, header=False).encode("utf-8")
+
+
+def _iter_arrow(store, open_writer):
+    import pyarrow as pa
+
+    sink = io.BytesIO()
+    writer = None
+    for df in store.iter_frames():
+        table = pa.Table.from_pandas(_export_frame(df), preserve_index=False)
+        if writer is None:
+            writer = open_writer(sink, table.schema)
+        writer.write_table(table)
+        yield sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+    if writer is None:
+        empty = pa.Table.from_pandas(_export_frame(store.frame()), preserve_index=False)
+        writer = open_writer(sink, empty.schema)
+    writer.close()
+    yield sink.getvalue()
+
+
+def iter_parquet(store):
+    import pyarrow.parquet as pq
+
+    return _iter_arrow(store, lambda sink, schema: pq.ParquetWriter(sink, schema))
+
+
+def iter_arrow_ipc(store):
+    import pyarrow as pa
+
+    return _iter_arrow(store, lambda sink, schema: pa.ipc.new_file(sink, schema))
+
+
+def export_stream(store, fmt: str) -> IterStream:
+    chunks = {"CSV": iter_csv, "Parquet": iter_parquet, "Arrow IPC": iter_arrow_ipc}[fmt](store)
+    return IterStream(chunks)
+
+
+# -------------------- 가져오기 --------------------
+def _read_chunks(file, fmt: str, chunk_rows: int):
+    if fmt == "Parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(file).iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas().astype(object)
+    else:
+        yield from pd.read_csv(file, chunksize=chunk_rows, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+
+
+def validate_chunk(raw: pd.DataFrame, first_row: int = 0):
+    # (정상 행 DataFrame, [(파일 행 번호, 사유), ...])
+    missing = [c for c in COLUMNS if c not in raw.columns]
+    if missing:
+        raise ValueError(f"열이 없어요: {', '.join(missing)}")
+    raw = raw[COLUMNS]
+    subj = raw["과목"].astype(str).str.strip()
+    minutes = pd.to_numeric(raw["예정(분)"], errors="coerce")
+    done_txt = raw["완료"].astype(str).str.strip().str.lower()
+    dates = pd.to_datetime(raw["날짜"], errors="coerce", format="mixed")
+
+    checks = [
+        (raw["과목"].isna() | (subj == "") | (subj == "nan"), "과목이 비어 있음"),
+        (minutes.isna() | (minutes % 1 != 0), "예정(분)이 정수가 아님"),
+        ((minutes < 0) | (minutes > _MINUTES_MAX), "예정(분) 범위를 벗어남"),
+        (~done_txt.isin(_TRUE | _FALSE), "완료 값이 참/거짓이 아님"),
+        (dates.isna() & raw["날짜"].notna() & (raw["날짜"].astype(str).str.strip() != ""), "날짜 형식 오류"),
+    ]
+    bad = np.zeros(len(raw), dtype=bool)
+    errors = []
+    for mask, reason in checks:
+        mask = mask.to_numpy(dtype=bool) & ~bad
+        errors.extend((first_row + int(i) + 1, reason) for i in np.flatnonzero(mask))
+        bad |= mask
+    ok = ~bad
+    clean = pd.DataFrame({
+        "과목": subj[ok],
+        "주제": raw["주제"][ok].fillna("").astype(str),
+        "예정(분)": minutes[ok].astype(np.int64),
+        "완료": done_txt[ok].isin(_TRUE),
+        "날짜": dates[ok],
+    })
+    return clean, errors
+
+
+def import_into(store, file, fmt: str = "CSV", chunk_rows: int = IMPORT_CHUNK_ROWS):
+    # 파일을 청크 단위로 검사해 정상 행만 저장소에 추가. (추가한 행 수, 오류 목록)
+    added, errors, seen = 0, [], 0
+    for raw in _read_chunks(file, fmt, chunk_rows):
+        clean, bad = validate_chunk(raw, first_row=seen)
+        store.extend(clean)
+        added += len(clean)
+        errors.extend(bad)
+        seen += len(raw)
+    errors.sort()
+    return added, errors
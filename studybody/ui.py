@@ -0,0 +1,100 @@
+# studybody/ui.py
+# 화면 공통 요소 — 테마 색·CSS, 가이드 캐릭터, 계측 패널
+import random
+import time
+
+import streamlit as st
+
+from . import profiler
+from .catalog import get_catalog
+from .reminders import engine, new_session_id
+from .templates import render
+
+# -------------------- Theme --------------------
+PASTEL_BG = "#F9FAFB"
+PRIMARY = "#7C3AED"       # violet-600
+ACCENT = "#22C55E"        # green-500
+WARN = "#F59E0B"          # amber-500
+MUTED = "#94A3B8"         # slate-400
+CARD_BG = "#FFFFFF"
+
+
+@profiler.profiled("css")
+def inject_css():
+    # 스타일시트는 프로세스에서 한 번 만들어(공백 제거) 재사용 — 전체 재실행마다 이 한 요소만 다시 보낸다
+    st.markdown(
+        render("stylesheet", bg=PASTEL_BG, card_bg=CARD_BG, primary=PRIMARY, muted=MUTED),
+        unsafe_allow_html=True,
+    )
+
+
+# -------------------- Character System --------------------
+# 캐릭터 목록·대사는 콘텐츠 카탈로그(studybody/content/catalog.json)에 있다
+def character_html(name: str, msg: str = None) -> str:
+    c = get_catalog().characters[name]
+    pick = msg or random.choice(c.line)
+    return render("character", emoji=c.emoji, color=c.color, name=name, tag=c.tag, msg=pick)
+
+
+@profiler.profiled()
+def character_bubble(name: str, msg: str = None):
+    st.markdown(character_html(name, msg), unsafe_allow_html=True)
+
+
+def character_feed(bubbles):
+    # [(캐릭터, 대사 또는 None), ...]를 markdown 요소 하나로
+    st.markdown("".join(character_html(name, msg) for name, msg in bubbles), unsafe_allow_html=True)
+
+
+# -------------------- Reminders --------------------
+REMINDER_TICK = 5   # 알림 배달 프래그먼트 실행 간격(초)
+
+
+def sync_reminders(chronotype: str, wake, sleep_hours: float) -> bool:
+    # 알림을 켠 세션이면 입력(리듬·포모도로·날짜)이 바뀔 때만 예약을 다시 잡는다. 켜져 있는지 돌려준다.
+    state = st.session_state
+    if not state.get("reminders_on"):
+        if state.pop("reminder_sig", None) is not None:
+            engine.cancel(state.reminder_sid)
+        return False
+    sid = state.setdefault("reminder_sid", new_session_id())
+    sig = (chronotype, wake, sleep_hours, state.get("pomo"), time.strftime("%Y-%m-%d"))
+    if state.get("reminder_sig") != sig:
+        from .reminders import plan_reminders
+
+        now = time.time()
+        engine.replace(sid, plan_reminders(chronotype, wake, sleep_hours, state.get("pomo"), now), now)
+        state.reminder_sig = sig
+    return True
+
+
+def deliver_reminders():
+    # 이 세션 받은편지함에 온 알림만 토스트로 (전체 일정을 훑지 않음)
+    for _, text in engine.drain(st.session_state.reminder_sid, time.time()):
+        st.toast(text)
+
+
+# -------------------- Profiler Panel --------------------
+def profile_panel(session_stats):
+    # STUDYBODY_PROFILE=1 일 때만 사이드바 맨 아래에 보이는 계측 패널
+    if not profiler.ENABLED:
+        return
+    import pandas as pd
+
+    with st.sidebar.expander("🛠️ 성능 계측 (디버그)"):
+        scope = st.radio("범위", ["이 세션", "프로세스 전체"], horizontal=True, key="_profile_scope")
+        stats = session_stats if scope == "이 세션" else profiler.PROCESS
+        rows = stats.summary()
+        if rows:
+            table = pd.DataFrame(rows).set_index("name")
+            st.dataframe(table.round(2), use_container_width=True)
+        else:
+            st.caption("아직 기록이 없어요.")
+        st.download_button(
+            "⬇️ 계측 결과 JSON",
+            data=lambda: profiler.export_json(session_stats),
+            file_name="studybody_profile.json",
+            mime="application/json",
+        )
+        if st.button("초기화", key="_profile_reset"):
+            session_stats.clear()
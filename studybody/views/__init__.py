@@ -0,0 +1,70 @@
+# studybody/views — 페이지별 화면 모듈
+# 페이지를 처음 열 때 import 되므로, 그 페이지가 쓰는 무거운 라이브러리도 그때 처음 로드된다.
+import importlib
+import sys
+import time as _time
+from datetime import datetime, time, timedelta
+from typing import NamedTuple
+
+import streamlit as st
+
+PAGES = {
+    "대시보드": "dashboard",
+    "학습 플래너": "planner",
+    "리듬 알림": "rhythm",
+    "시너지 팁": "synergy",
+    "리포트 & 내보내기": "report",
+    "반 전체 현황": "cohort",
+}
+HISTORY_DAYS = 180  # 세션 시작 시 불러올 기간(일) — 더 이전 기록은 페이지가 요청할 때 load_history로
+
+# 페이지 모듈 → 첫 import에 걸린 시간(초), 프로세스 단위
+IMPORT_TIMES = {}
+
+
+class PageContext(NamedTuple):
+    backend: object
+    owner: str          # 학생 이름 — 저장소에서 이 학생의 행만 읽고 쓴다
+    wake_time: time
+    sleep_hours: float
+    water_cups: int
+    caffeine: int
+
+
+def load(page: str):
+    name = f"{__name__}.{PAGES[page]}"
+    if name in sys.modules:
+        return sys.modules[name]
+    t0 = _time.perf_counter()
+    module = importlib.import_module(name)
+    IMPORT_TIMES[name] = _time.perf_counter() - t0
+    return module
+
+
+def get_tasks(ctx):
+    # 세션의 TaskStore — 처음 필요할 때 저장소에서 이 학생의 최근 HISTORY_DAYS일만 불러온다
+    if "tasks" not in st.session_state:
+        from ..store import TaskStore, seed_ids
+
+        since = (datetime.today() - timedelta(days=HISTORY_DAYS)).date()
+        seed_ids(ctx.backend.max_id() + 1)
+        loaded = ctx.backend.load(ctx.owner, start=since)
+        store = TaskStore()
+        store.extend(loaded, ids=loaded.index, track=False)
+        st.session_state.tasks = store
+        st.session_state.tasks_owner = ctx.owner
+        st.session_state.tasks_since = since   # 이 날짜(포함) 이후와 날짜 없는 행을 들고 있다 (None = 전체)
+    return st.session_state.tasks
+
+
+def load_history(ctx, start=None):
+    # start(포함)부터의 기록이 세션 테이블에 있도록 — 아직 안 읽은 더 오래된 기간만 저장소에서 읽어 붙인다.
+    # start=None이면 전체 기간 (플래너 '전체 기간', 리포트·내보내기)
+    store = get_tasks(ctx)
+    since = st.session_state.get("tasks_since")   # 키가 없으면(밖에서 넣어 준 테이블) 전체가 있는 것으로 본다
+    if since is None or (start is not None and start >= since):
+        return store
+    older = ctx.backend.load(ctx.owner, start=start, end=since - timedelta(days=1), undated=False)
+    store.merge_loaded(older)
+    st.session_state.tasks_since = start
+    return store
@@ -0,0 +1,43 @@
+# studybody/views/cohort.py
+# 반 전체 현황 — 모든 세션이 함께 쌓는 공유 집계(cohort)만 읽는다. 학생 수와 상관없이 (일수 × 과목 수) 칸 조회.
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+from ..cohort import cohort
+from ..profiler import timer
+
+
+def render(ctx):
+    st.markdown("### 🏫 반 전체 현황")
+    st.caption("접속한 학생들이 이 앱에서 추가·수정한 계획이 실시간으로 합쳐져요. (불러온 예전 기록은 세지 않아요)")
+
+    today = datetime.today().date()
+    start = today - timedelta(days=today.weekday())
+    end = start + timedelta(days=6)
+    with timer("cohort.query"):
+        by_subject = cohort.subject_minutes(start, end)
+        days = cohort.daily(start, end)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("참여 학생", cohort.students)
+    with col2:
+        st.metric("이번 주 예정(분)", sum(p for p, _ in by_subject.values()))
+    with col3:
+        st.metric("이번 주 완료(분)", sum(d for _, d in by_subject.values()))
+
+    st.markdown(f"#### 📚 이번 주 과목별 공부 시간 ({start:%m/%d}~{end:%m/%d})")
+    if by_subject:
+        table = pd.DataFrame.from_dict(by_subject, orient="index", columns=["예정(분)", "완료(분)"])
+        table = table.sort_values("예정(분)", ascending=False)
+        st.bar_chart(table)
+        st.dataframe(table, use_container_width=True)
+    else:
+        st.info("이번 주에 새로 추가된 계획이 아직 없어요.")
+
+    st.markdown("#### 📅 요일별 참여 & 평균 BEI")
+    daily = pd.DataFrame(days, columns=["날짜", "예정(분)", "완료(분)", "활동 학생", "평균 BEI"]).set_index("날짜")
+    daily["평균 BEI"] = pd.to_numeric(daily["평균 BEI"]).round(1)   # 아무도 보고 안 했으면 전부 None(object)
+    st.dataframe(daily, use_container_width=True)
@@ -0,0 +1,46 @@
+# studybody/views/dashboard.py
+# 대시보드 — 오늘 BEI 게이지, 공부 시간, 집중 골든타임, 캐릭터 피드
+from datetime import datetime
+
+import streamlit as st
+
+from .. import templates
+from ..bei import brain_energy_index
+from ..figures import gauge_figure
+from ..rhythm import energy_curve, suggested_blocks
+from ..ui import ACCENT, PRIMARY, character_feed
+from . import get_tasks
+
+
+def render(ctx):
+    left, right = st.columns([1.3, 1])
+    with left:
+        st.markdown("### 📊 오늘 한눈에 보기")
+        today = datetime.today().date()
+        studied_today = get_tasks(ctx).daily.done_minutes(today)
+        bei = brain_energy_index(ctx.sleep_hours, ctx.water_cups, ctx.caffeine, int(studied_today))
+
+        # gauge-like chart (같은 BEI면 프로세스 캐시의 그림을 그대로 사용)
+        fig = gauge_figure(bei, PRIMARY, ACCENT)
+        st.plotly_chart(fig, use_container_width=True)
+
+        st.markdown(
+            templates.render("progress", label="오늘 공부 시간", pct=min(100, studied_today / 240 * 100), color=ACCENT,
+                             caption=f"완료 {int(studied_today)}분 / 목표 240분"),
+            unsafe_allow_html=True,
+        )
+
+        xs, curve = energy_curve(st.session_state.chronotype, ctx.wake_time)
+        slots = suggested_blocks(xs, curve, n=3)
+
+        st.markdown("### ⏰ 오늘의 집중 골든타임")
+        cards = tuple((f"{start:%H:%M}", f"{end:%H:%M}", int(power * 100)) for start, end, power in slots)
+        st.markdown(templates.render_many("golden", cards, wrap="card-row"), unsafe_allow_html=True)
+
+    with right:
+        st.markdown("### 🧩 캐릭터 피드")
+        if bei < 60:
+            nudge = ("ATP 몬스터", "에너지 저하 경보! 물을 1컵 마시고 60초 스트레칭 어때? 💧🧎")
+        else:
+            nudge = ("뉴런", "지금 장기기억으로 전환할 찬스! 5문제만 복습하자 🔁")
+        character_feed([(st.session_state.guide, None), nudge])
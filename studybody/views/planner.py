@@ -0,0 +1,258 @@
+# studybody/views/planner.py
+# 학습 플래너 — 계획 추가·가져오기, 기간/페이지 창 편집기, 오늘 진행률
+import math
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+from ..events import EventLog
+from ..persist import parquet_available
+from ..profiler import timer
+from ..schedule import auto_schedule, week_range
+from ..store import COLUMNS as TASK_COLUMNS
+from ..transfer import import_into
+from . import get_tasks, load_history
+
+
+def apply_planner_edits(key: str, view_ids):
+    # data_editor의 행 단위 diff(수정/추가/삭제)만 저장소에 반영하고, 편집기는 새 키로 다시 그린다
+    state = st.session_state[key]
+    store = st.session_state.tasks
+    with store.events.action("표 편집"):
+        store.update_rows({int(view_ids[int(i)]): vals for i, vals in state["edited_rows"].items()})
+        added = [row for row in state["added_rows"] if row]
+        if added:
+            rows = pd.DataFrame(added, columns=TASK_COLUMNS)
+            rows["날짜"] = rows["날짜"].fillna(datetime.today().date().isoformat())  # 날짜를 비우면 오늘
+            store.extend(rows)
+        store.delete_rows(view_ids[int(i)] for i in state["deleted_rows"])
+    st.session_state.editor_ver = st.session_state.get("editor_ver", 0) + 1
+
+
+def history_step(name: str, *args):
+    # 되돌리기/다시 실행/시점 복원 (버튼 콜백) — 편집기는 새 키로 다시 그린다
+    store = st.session_state.tasks
+    getattr(store.events, name)(store, *args)
+    st.session_state.editor_ver = st.session_state.get("editor_ver", 0) + 1
+
+
+def history_section(store):
+    # 변경 기록: 최근 동작 목록, 고른 시점의 테이블 미리 보기·복원
+    log = store.events
+    with st.expander(f"🕘 변경 기록 ({len(log.actions):,}개 동작 · 이벤트 {len(log):,}개)"):
+        if not log.actions:
+            st.caption("아직 변경이 없어요.")
+            return
+        kinds = {"do": "", "undo": " (되돌리기)", "redo": " (다시 실행)"}
+
+        def describe(n):
+            a = log.actions[n]
+            return f"#{n + 1} · {datetime.fromtimestamp(a.at):%H:%M:%S} · {a.label}{kinds[a.kind]} · {a.last - a.first}행"
+
+        recent = range(len(log.actions) - 1, max(-1, len(log.actions) - 51), -1)   # 최근 50개
+        pick = st.selectbox("시점", recent, format_func=describe, key="history_pick")
+        seq = log.actions[pick].last
+        # expander는 접혀 있어도 본문을 실행하므로, 재생은 미리 보기를 켰을 때만
+        if st.toggle("이 시점의 계획 보기", key="history_preview"):
+            with timer("planner.replay"):
+                past = log.state_at(seq)
+            st.caption(f"이 동작 직후의 계획 {len(past):,}개")
+            st.dataframe(past.tail(200), use_container_width=True)
+        st.button("이 시점으로 복원", disabled=seq == len(log), on_click=history_step, args=("restore_to", seq))
+
+
+def save_auto_starts(key, ids):
+    # 표에서 고친 시작 시각을 행 id로 옮겨 담고, 편집기는 새 키로 다시 시작한다 (덮어쓴 plan이 새 기준)
+    starts = st.session_state.setdefault("auto_starts", {})
+    for pos, change in st.session_state[key]["edited_rows"].items():
+        if "시작" not in change:
+            continue
+        if change["시작"] is None:
+            starts.pop(ids[int(pos)], None)   # 비우면 자동 배치 시각으로
+        else:
+            starts[ids[int(pos)]] = pd.Timestamp(change["시작"]).floor("min")
+    st.session_state.auto_rev = st.session_state.get("auto_rev", 0) + 1
+
+
+def reset_auto_starts(ids):
+    starts = st.session_state.get("auto_starts", {})
+    for i in ids:
+        starts.pop(i, None)
+    st.session_state.auto_rev = st.session_state.get("auto_rev", 0) + 1
+
+
+def overlaps(plan):
+    # 시작 순으로 놓았을 때 앞 계획이 끝나기 전에 시작하는 계획 쌍 ("과목·주제" 이름)
+    placed = plan.dropna(subset=["시작"]).sort_values("시작")
+    label = (placed["과목"].astype(str) + "·" + placed["주제"].astype(str)).tolist()
+    begin, finish = placed["시작"].tolist(), placed["종료"].tolist()
+    clashes, last = [], 0
+    for i in range(1, len(placed)):
+        if begin[i] < finish[last]:
+            clashes.append((label[last], label[i]))
+        if finish[i] > finish[last]:
+            last = i
+    return clashes
+
+
+def auto_schedule_section(store, ctx):
+    # 미완료 계획을 에너지 곡선의 좋은 시간대에 배치하고, 시작 시각은 표에서 직접 고칠 수 있게 한다
+    from ..figures import timeline_figure
+
+    a1, a2 = st.columns([1, 1])
+    span = a1.radio("범위", ["오늘", "이번 주"], horizontal=True, key="auto_span")
+    break_min = a2.number_input("계획 사이 휴식(분)", 0, 30, 10, 5, key="auto_break")
+    start, end = week_range(days=1 if span == "오늘" else 7)
+    tasks, _ = store.window(start, end, limit=len(store))
+    with timer("planner.auto_schedule"):
+        plan = auto_schedule(tasks, st.session_state.chronotype, ctx.wake_time, ctx.sleep_hours, break_min)
+    if plan.empty:
+        st.info("배치할 미완료 계획이 없어요.")
+        return
+    missed = int(plan["시작"].isna().sum())
+    if missed:
+        st.warning(f"깨어 있는 시간 안에 못 넣은 계획 {missed}개 (표 아래쪽)")
+
+    # 고친 시작 시각은 행 id별로 세션에 두고 배치 결과 위에 덮어쓴다 — 범위·휴식을 바꿔도 남는다
+    starts = st.session_state.setdefault("auto_starts", {})
+    mine = plan.index.intersection(list(starts))
+    if len(mine):
+        plan.loc[mine, "시작"] = [starts[i] for i in mine]
+        plan.loc[mine, "에너지"] = math.nan   # 자동 배치 시각 기준 값이라 고친 계획에는 맞지 않는다
+        plan["종료"] = plan["시작"] + pd.to_timedelta(plan["예정(분)"], unit="m")
+        plan = plan.sort_values(["날짜", "시작"], na_position="last")
+
+    key = f"auto_editor_{st.session_state.get('auto_rev', 0)}"
+    st.data_editor(
+        plan.drop(columns="종료"),
+        key=key,
+        hide_index=True,
+        use_container_width=True,
+        disabled=["날짜", "과목", "주제", "예정(분)", "에너지"],
+        column_config={
+            "날짜": st.column_config.DateColumn("날짜"),
+            "시작": st.column_config.DatetimeColumn("시작", format="MM/DD HH:mm", step=300),
+            "에너지": st.column_config.ProgressColumn("예상 에너지", min_value=0, max_value=1, format="%.2f"),
+        },
+        on_change=save_auto_starts,
+        args=(key, tuple(plan.index)),
+    )
+    if len(mine):
+        st.button(f"고친 시작 시각 {len(mine)}개 되돌리기", key="auto_reset", on_click=reset_auto_starts, args=(mine,))
+
+    clashes = overlaps(plan)
+    if clashes:
+        st.warning("시간이 겹치는 계획이 있어요: " + ", ".join(f"{a} ↔ {b}" for a, b in clashes[:5])
+                   + (f" 외 {len(clashes) - 5}건" if len(clashes) > 5 else ""))
+    if plan["시작"].notna().any():
+        st.plotly_chart(timeline_figure(plan), use_container_width=True)
+
+
+def render(ctx):
+    st.markdown("### 🗂️ 학습 플래너")
+    store = get_tasks(ctx)
+    if store.events is None:   # 변경은 이 페이지에서만 일어나므로 여기서 기록을 시작한다
+        store.events = EventLog(store.frame)
+    with st.container():
+        c1, c2, c3, c4 = st.columns([1, 1.2, 0.8, 0.8])
+        subj = c1.selectbox("과목", ["화학", "생명과학", "약학", "수학", "영어", "기타"])
+        topic = c2.text_input("주제/단원", placeholder="예: 산화·환원, 유전자 발현 등")
+        minutes = c3.number_input("예정(분)", 10, 300, 40, 10)
+        date = c4.date_input("날짜")
+
+        add = st.button("➕ 추가", use_container_width=False)
+        if add and topic.strip():
+            store.append(subj, topic.strip(), int(minutes), False, date)
+            st.success("계획이 추가됐어요! ✅")
+
+    with st.expander("📥 계획 가져오기 (CSV / Parquet)"):
+        import_types = ["csv", "parquet"] if parquet_available() else ["csv"]
+        upload = st.file_uploader("과목·주제·예정(분)·완료·날짜 열이 있는 파일", type=import_types)
+        if upload is not None and st.button("가져오기"):
+            fmt = "Parquet" if upload.name.lower().endswith(".parquet") else "CSV"
+            try:
+                with store.events.action("가져오기"):
+                    added, errors = import_into(store, upload, fmt)
+            except ValueError as e:
+                st.error(str(e))
+            else:
+                st.success(f"{added:,}개 항목을 가져왔어요! ✅")
+                if errors:
+                    st.warning(f"형식이 맞지 않아 건너뛴 행 {len(errors):,}개")
+                    st.dataframe(pd.DataFrame(errors[:100], columns=["행", "사유"]), hide_index=True)
+
+    st.write("")
+    u1, u2, _ = st.columns([0.25, 0.25, 1])
+    u1.button("↩️ 되돌리기", disabled=not store.events.can_undo, on_click=history_step, args=("undo",))
+    u2.button("↪️ 다시 실행", disabled=not store.events.can_redo, on_click=history_step, args=("redo",))
+    if store.empty:
+        st.info("아직 계획이 없어요. 위에서 항목을 추가해보세요!")
+        history_section(store)
+        return
+
+    # Window: 기간·과목으로 거르고 한 페이지만 편집기로 보낸다
+    today = datetime.today().date()
+    f1, f2, f3 = st.columns([1.4, 1.2, 0.6])
+    whole = f1.checkbox("전체 기간", value=False)
+    period = f1.date_input("기간", value=(today - timedelta(days=14), today + timedelta(days=14)), disabled=whole)
+    start, end = (None, None) if whole or not period else (period[0], period[-1])
+    load_history(ctx, start)   # 세션이 아직 안 읽은 더 이전 기간이면 그 부분만 저장소에서
+    subjects = f2.multiselect("과목 필터", store.categories)
+    page_size = f3.selectbox("페이지 크기", [50, 200, 1000], index=1)
+
+    page_no = st.session_state.get("planner_page", 1)
+    view, total = store.window(start, end, subjects, offset=(page_no - 1) * page_size, limit=page_size)
+    pages = max(1, math.ceil(total / page_size))
+    if page_no > pages:
+        page_no = st.session_state.planner_page = pages
+        view, total = store.window(start, end, subjects, offset=(page_no - 1) * page_size, limit=page_size)
+
+    # Editable planner (변경분만 저장소에 반영)
+    key = f"planner_editor_{st.session_state.get('editor_ver', 0)}"
+    with timer("planner.data_editor"):
+        st.data_editor(
+            view.reset_index(drop=True),  # 행 id는 args로 따로 넘기고 편집기에는 범위 인덱스만
+            key=key,
+            num_rows="dynamic",
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "완료": st.column_config.CheckboxColumn("완료"),
+                "예정(분)": st.column_config.NumberColumn("예정(분)", min_value=0, step=5),
+                "날짜": st.column_config.DateColumn("날짜"),
+            },
+            on_change=apply_planner_edits,
+            args=(key, view.index.to_numpy()),
+        )
+    p1, p2 = st.columns([0.3, 1])
+    p1.number_input("페이지", 1, pages, key="planner_page")
+    shown = f"{(page_no - 1) * page_size + 1}–{(page_no - 1) * page_size + len(view)}" if len(view) else "0"
+    p2.caption(f"조건에 맞는 {total:,}개 중 {shown}번째 · 전체 {len(store):,}개")
+    history_section(store)
+
+    # Summary
+    today = datetime.today().date()
+    daily = store.daily
+    done_mins = daily.done_minutes(today)
+    total_mins = daily.planned_minutes(today)
+    pct = 0 if total_mins == 0 else int(done_mins / total_mins * 100)
+    st.markdown(
+        f"""
+        <div class="card">
+          <div style="display:flex;gap:16px;align-items:center;">
+            <div style="font-size:28px;">📈</div>
+            <div>
+              <div class="progress-label">오늘 진행률 {pct}%</div>
+              <div class="subtitle">완료 {int(done_mins)}분 / 전체 {int(total_mins)}분</div>
+            </div>
+          </div>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    # Auto schedule (켰을 때만 계산·차트 생성)
+    st.write("")
+    if st.toggle("⚡ 에너지 기반 자동 배치", key="auto_on"):
+        auto_schedule_section(store, ctx)
@@ -0,0 +1,97 @@
+# studybody/views/report.py
+# 리포트 & 내보내기 — 지표, 과목별 분포, BEI 추이, 내보내기
+from datetime import datetime
+
+import streamlit as st
+
+from .. import reports
+from ..bei import brain_energy_index
+from ..persist import parquet_available
+from ..profiler import timer
+from ..transfer import EXPORT_FORMATS, export_stream
+from ..ui import MUTED, PRIMARY, character_bubble
+from . import load_history
+
+POLL_SEC = 0.5      # 진행 중인 리포트의 진행 막대 갱신 간격(초)
+INLINE_WAIT = 0.2   # 이만큼 안에 끝나는 작은 리포트는 진행 막대 없이 바로 그린다
+
+
+@st.fragment(run_every=POLL_SEC)
+def _progress(job, label: str):
+    # 진행 막대만 다시 그리다가 작업이 끝나면 페이지 전체를 다시 그린다
+    if job.done():
+        st.rerun()
+    st.progress(job.progress, text=f"{label} — {job.stage}")
+
+
+def _ready(job, label: str) -> bool:
+    # 결과를 그릴 수 있으면 True, 아니면 진행 막대(또는 오류)를 그리고 False
+    if not job.wait(INLINE_WAIT):
+        _progress(job, label)
+        return False
+    if job.failed():
+        st.error(f"리포트를 만들지 못했어요: {job.future.exception()}")
+        return False
+    return True
+
+
+def render(ctx):
+    st.markdown("### 📘 리포트 & 내보내기")
+    store = load_history(ctx)   # 리포트·내보내기는 전체 기간
+    if store.empty:
+        st.info("데이터가 없어요. 학습 계획을 추가해보세요!")
+        return
+
+    today = datetime.today().date()
+    studied = store.daily.done_minutes(today)
+    bei = brain_energy_index(ctx.sleep_hours, ctx.water_cups, ctx.caffeine, int(studied))
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("오늘 공부(분)", int(studied))
+    with col2:
+        st.metric("Brain Energy Index", bei)
+    with col3:
+        st.metric("수면(시간)", ctx.sleep_hours)
+
+    # 과목별 분포 표 + BEI 추이 — 같은 판(데이터)·습관 기록이면 만들어 둔 결과, 아니면 작업자 풀에 맡긴다
+    habits = st.session_state.habits
+    fallback = (ctx.sleep_hours, ctx.water_cups, ctx.caffeine)
+    version = (store.uid, store.version)
+    options = (fallback, frozenset(habits.items()))
+    summary = reports.pool.find("summary", version, options)
+    if summary is None:
+        with timer("report.pivot"):
+            pivot = store.daily.pivot()   # (날짜, 과목) 칸 수만큼만
+        days, studied_by_day = store.daily.series()
+        summary = reports.pool.submit(
+            "summary", version, reports.summary_report, pivot, days, studied_by_day, dict(habits), fallback,
+            (MUTED, PRIMARY), options=options,
+        )
+    st.markdown("#### 📅 과목별 학습 분포")
+    if _ready(summary, "리포트 만드는 중"):
+        pivot, fig = summary.result()
+        st.dataframe(pivot, use_container_width=True)
+        if fig is not None:
+            st.markdown("#### 📈 Brain Energy Index 추이")
+            st.plotly_chart(fig, use_container_width=True)
+            st.caption("생활 습관 기록이 없는 날은 현재 사이드바 값(수면·물·카페인)으로 계산했어요.")
+
+    # Export (다운로드를 누를 때만 청크 단위로 생성)
+    formats = [f for f, (_, _, needs_arrow) in EXPORT_FORMATS.items() if parquet_available() or not needs_arrow]
+    fmt = st.radio("내보내기 형식", formats, horizontal=True)
+    ext, mime, _ = EXPORT_FORMATS[fmt]
+    st.download_button(
+        f"⬇️ 플래너 {fmt} 다운로드",
+        data=lambda: export_stream(store, fmt),
+        file_name=f"studybody_planner.{ext}",
+        mime=mime,
+    )
+    if parquet_available() and st.button("🗄️ 전체 기록 Parquet 스냅샷 저장"):
+        st.success(f"스냅샷 저장 완료: {ctx.backend.snapshot(ctx.owner)}")
+
+    # Character closing
+    if bei >= 70:
+        character_bubble("뉴런", "데이터가 말해! 오늘은 기억 고정하기 좋은 날이야 🔒")
+    else:
+        character_bubble("DNA 요정", "리듬 조정이 필요해. 빛 노출 & 물 1컵부터 시작해봐 🌞💧")
@@ -0,0 +1,98 @@
+# studybody/views/rhythm.py
+# 리듬 알림 — 에너지 곡선, 알림 문구, 포모도로 타이머(프래그먼트)
+from datetime import datetime
+
+import streamlit as st
+
+from ..figures import energy_figure, forecast_figure
+from ..forecast import MAX_DAYS
+from ..pomodoro import Pomodoro, phase_at, transitions
+from ..reminders import engine
+from ..ui import deliver_reminders, sync_reminders
+
+
+POMO_TICK = 1  # 타이머 카드 새로고침 간격(초)
+
+
+def pomodoro_card():
+    # 이 함수만 POMO_TICK마다 다시 실행된다 (CSS·사이드바·차트는 건드리지 않음)
+    if "pomo" not in st.session_state:
+        return
+    pomo = st.session_state.pomo
+    now = datetime.now().timestamp()
+    finished = False
+    for at, ph in transitions(pomo, st.session_state.get("pomo_tick", pomo.start), now):
+        finished = ph.name == "완료"
+        if not st.session_state.get("reminders_on"):   # 알림을 켜면 전환 알림도 알림 엔진이 보낸다
+            st.toast("🎉 모든 라운드 완료!" if finished else f"⏰ {ph.name} 시작 — 라운드 {ph.round}/{pomo.rounds}")
+    st.session_state.pomo_tick = now
+    if finished:   # 방금 끝났으면 전체를 다시 그려 1초 새로고침을 멈춘다 (run_every는 전체 실행 때만 정해짐)
+        st.rerun()
+    if st.session_state.get("reminders_on"):
+        deliver_reminders()   # 이 페이지에서는 1초 간격으로 편지함 확인
+
+    ph = phase_at(pomo, now)
+    m, s = divmod(ph.remaining, 60)
+    st.markdown(
+        f"""
+        <div class="card">
+          <div style="font-size:20px;">현재: <b>{ph.name}</b> | 라운드 {ph.round}/{pomo.rounds}</div>
+          <div style="margin-top:6px;" class="subtitle">남은시간 {m:02d}:{s:02d}</div>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+
+def render(ctx):
+    st.markdown("### ⏱️ 리듬 알림 & 집중 타이머")
+    # chart (크로노타입·기상 시각이 같으면 캐시된 그림)
+    fig = energy_figure(st.session_state.chronotype, ctx.wake_time)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # Long-range forecast (일수 × 하루 칸 행렬을 한 번에 계산, 표시 해상도로 줄여서 전송)
+    with st.expander("📅 장기 리듬 예보"):
+        f1, f2, f3 = st.columns(3)
+        days = f1.slider("기간(일)", 7, MAX_DAYS, 90, 7)
+        shift = f2.slider("주말 기상 늦춤(분)", 0, 240, 60, 15)
+        extra = f3.slider("주말 추가 수면(시간)", 0.0, 3.0, 1.0, 0.5)
+        st.plotly_chart(
+            forecast_figure(st.session_state.chronotype, datetime.today().date(), days, ctx.wake_time,
+                            ctx.sleep_hours, shift, extra),
+            use_container_width=True,
+        )
+        st.caption("빈 칸은 수면 시간이에요. 긴 기간은 여러 날·시간대를 묶은 평균으로 보여줘요.")
+
+    st.markdown("#### ⏳ 포모도로 타이머(로컬)")
+    st.caption("타이머 카드만 1초마다 따로 새로고침돼요. 세션 단위로 작동하니 탭을 유지해 주세요.")
+    work = st.number_input("집중(분)", 10, 60, 25, 5)
+    rest = st.number_input("휴식(분)", 3, 20, 5, 1)
+    rounds = st.number_input("라운드", 1, 12, 4, 1)
+    if st.button("타이머 시작/리셋"):
+        now = datetime.now().timestamp()
+        st.session_state.pomo = Pomodoro(int(work), int(rest), int(rounds), now)
+        st.session_state.pomo_tick = now
+
+    running = "pomo" in st.session_state and phase_at(st.session_state.pomo, datetime.now().timestamp()).name != "완료"
+    st.fragment(pomodoro_card, run_every=POMO_TICK if running else None)()
+
+    # 알림 (포모도로를 방금 시작했으면 그것까지 반영해 예약)
+    if sync_reminders(st.session_state.chronotype, ctx.wake_time, ctx.sleep_hours):
+        st.markdown("#### 🔔 다가오는 알림")
+        pending = engine.pending(st.session_state.reminder_sid)
+        for at, text in pending:
+            st.write(f"• {datetime.fromtimestamp(at):%H:%M} — {text}")
+        if not pending:
+            st.caption("24시간 안에 예약된 알림이 없어요.")
+    else:
+        st.markdown("#### 🔔 추천 알림 문구 (예시)")
+        st.caption("사이드바에서 ‘🔔 리듬 알림 받기’를 켜면 기상 시각·수면·골든타임·포모도로에 맞춰 알림을 띄워 드려요.")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("• 물 1컵: 집중 전 10분 알림 — “수분 보충으로 시냅스 전도 업! 💧”")
+            st.write("• 눈 휴식: 25분 집중 후 5분 — “20-20-20 규칙, 먼 곳 보기 👀”")
+            st.write("• 간식: 저혈당 방지 — “과일 한 조각으로 ATP 충전 🔋”")
+        with col2:
+            st.write("• 스트레칭: 매 시간 60초 — “근육 펌프 → 뇌혈류 ↑ 🧎”")
+            st.write("• 카페인 컷오프: 잠자기 8시간 전 — “수면 방해 방지 ☕️🚫”")
+            st.write("• 가벼운 산책: 오후 슬럼프 — “빛+움직임 → 각성 ↑ 🚶”")
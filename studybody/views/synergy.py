@@ -0,0 +1,79 @@
+# studybody/views/synergy.py
+# 시너지 팁 — 과목별 학습×건강 팁, 간격 반복 플래시카드 (차트·pandas 없이 동작)
+import random
+from datetime import datetime
+
+import streamlit as st
+
+from ..catalog import get_catalog
+from ..srs import GRADES, Deck, day_number
+from ..ui import character_bubble
+
+
+def synergy_tip(subject: str):
+    # 과목별 팁 (없는 과목이면 "기타") — 카탈로그 조회만 하므로 O(1)
+    return get_catalog().tips_for(subject)
+
+
+def review_card(subject: str, row: int, grade: int):
+    st.session_state.decks[subject].review(row, grade, day_number(datetime.today().date()))
+
+
+def get_deck(subject: str, cards) -> Deck:
+    # 세션의 과목별 복습 덱 — 카탈로그 카드가 바뀌었을 때만 새 카드를 맞춰 넣는다
+    decks = st.session_state.setdefault("decks", {})
+    deck = decks.get(subject)
+    if deck is None:
+        deck = decks[subject] = Deck()
+    deck.sync((q for q, _ in cards), day_number(datetime.today().date()), source=cards)
+    return deck
+
+
+def render(ctx):
+    st.markdown("### 🧪 학습 × 건강 시너지 팁")
+    catalog = get_catalog()
+    subjects = catalog.subjects
+    today = datetime.today().date()
+    if "tasks" in st.session_state:
+        today_subj = st.session_state.tasks.daily.subjects_on(today)
+    else:  # 아직 작업 테이블을 안 불러온 세션이면 DB에서 오늘 과목만 조회
+        today_subj = ctx.backend.subjects_on(ctx.owner, today)
+    pick_subj = st.selectbox("과목 선택", subjects, index=subjects.index(today_subj[0]) if today_subj and today_subj[0] in subjects else 0)
+
+    colA, colB = st.columns([1, 1])
+    with colA:
+        for tip in synergy_tip(pick_subj):
+            st.markdown(f"- {tip}")
+    with colB:
+        # character comment
+        if pick_subj in ["화학", "생명과학", "약학"]:
+            who = "뉴런" if pick_subj != "약학" else "DNA 요정"
+        else:
+            who = "ATP 몬스터"
+        character_bubble(who)
+
+    st.markdown("---")
+    st.markdown("#### 🎴 오늘의 복습 카드 (최대 5)")
+    deck_subj = pick_subj
+    if deck_subj not in catalog.cards:  # 카드가 없는 과목은 다른 과목 덱 하나를 (세션 동안 고정해서) 보여준다
+        fallback = st.session_state.setdefault("card_fallback", {})
+        if fallback.get(pick_subj) not in catalog.cards:
+            fallback[pick_subj] = random.choice(list(catalog.cards))
+        deck_subj = fallback[pick_subj]
+    cards = catalog.cards[deck_subj]
+    answers = dict(cards)
+    deck = get_deck(deck_subj, cards)
+    today_no = day_number(today)
+    due = deck.due(5, today_no)
+    with st.expander("카드 펼치기/접기"):
+        if not due:
+            nxt = deck.next_due()
+            st.success("오늘 복습할 카드를 다 끝냈어요! 🎉" + (f" 다음 복습: {nxt - today_no}일 뒤" if nxt else ""))
+        for row in due:
+            q = deck.key(row)
+            with st.container():
+                st.markdown(f"**Q. {q}**")
+                if st.toggle("정답 보기", key=f"card-{deck_subj}-{row}-{deck.reps[row]}-{deck.due_day[row]}"):
+                    st.success(answers.get(q, "(카탈로그에서 빠진 카드예요)"))
+                    for col, (label, grade) in zip(st.columns(len(GRADES)), GRADES.items()):
+                        col.button(label, key=f"grade-{deck_subj}-{row}-{grade}", on_click=review_card, args=(deck_subj, row, grade))